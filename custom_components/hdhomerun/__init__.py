@@ -3,17 +3,24 @@
 # region #-- imports --#
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import ipaddress
 import logging
-from datetime import timedelta
-from typing import Any, Callable, List, Mapping
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Set, Tuple
 
+import homeassistant.helpers.config_validation as cv
 import homeassistant.helpers.device_registry as dr
 import homeassistant.helpers.entity_registry as er
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady
-from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_DEVICE_ID, CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -22,21 +29,48 @@ from homeassistant.helpers.update_coordinator import (
 from homeassistant.util import slugify
 
 from .const import (
+    CONF_CHANNEL_SOURCE,
     CONF_DATA_COORDINATOR_GENERAL,
     CONF_DATA_COORDINATOR_TUNER_STATUS,
+    CONF_DETAILS_CHANGED,
+    CONF_DEVICE,
     CONF_DISCOVERY_MODE,
+    CONF_FLEET,
     CONF_HOST,
+    CONF_LISTENER,
+    CONF_MAX_CONCURRENT,
+    CONF_OPTIONS,
     CONF_SCAN_INTERVAL_TUNER_STATUS,
+    CONF_SCHEDULER,
+    CONF_SETUP_TIMING,
+    CONF_SSDP_SEEDS,
+    CONF_STORE,
     DEF_DISCOVERY_MODE,
     DEF_SCAN_INTERVAL_SECS,
     DEF_SCAN_INTERVAL_TUNER_STATUS_SECS,
     DOMAIN,
     ENTITY_SLUG,
+    EVENT_HDHOMERUN_CHANNEL_SCAN_FINISHED,
+    EVENT_HDHOMERUN_FIRMWARE_CHANGED,
+    EVENT_HDHOMERUN_LINEUP_CHANGED,
+    FLEET_MAX_AGE_RATIO,
     PLATFORMS,
+    SERVICE_CHANNEL_SCAN,
+    STORAGE_SAVE_DELAY_SECS,
+    STORAGE_VERSION,
 )
 from .logger import Logger
-from .pyhdhr.const import DiscoverMode
+from .pyhdhr.channel_scan import (
+    DEF_MAX_CONCURRENT_SCANS,
+    ChannelScanProgress,
+    ChannelScanResult,
+    async_channel_scan_many,
+)
+from .pyhdhr.const import HDHOMERUN_DEVICE_TYPE_STORAGE, DiscoverMode
 from .pyhdhr.discover import Discover, HDHomeRunDevice
+from .pyhdhr.fleet import DeviceFleet
+from .pyhdhr.listener import DiscoveryListener, ListenerRecord
+from .pyhdhr.scheduler import PollScheduler
 
 # endregion
 
@@ -44,10 +78,261 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def _async_reload(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Reload the config entry."""
+    """Reload the config entry if the options have changed."""
+    if (
+        config_entry.options
+        == hass.data[DOMAIN].get(config_entry.entry_id, {}).get(CONF_OPTIONS)
+    ):
+        return
+
     await hass.config_entries.async_reload(config_entry.entry_id)
 
 
+async def _async_discover_device(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> HDHomeRunDevice | None:
+    """Get the device for the config entry.
+
+    Facts provided by SSDP are used if available, otherwise a discovery
+    is carried out.
+    """
+    session = async_get_clientsession(hass=hass)
+    discovery_mode = DiscoverMode(
+        config_entry.options.get(CONF_DISCOVERY_MODE, DEF_DISCOVERY_MODE.value)
+    )
+    seed: Dict[str, str] | None = (
+        hass.data[DOMAIN].get(CONF_SSDP_SEEDS, {}).get(config_entry.unique_id)
+    )
+    if (
+        seed is not None
+        and discovery_mode in (DiscoverMode.AUTO, DiscoverMode.HTTP)
+        and seed.get("host") == config_entry.data.get(CONF_HOST)
+    ):
+        device: HDHomeRunDevice = HDHomeRunDevice(host=seed.get("host"))
+        setattr(device, "_discovery_method", DiscoverMode.HTTP)
+        setattr(device, "_session", session)
+        setattr(device, "_base_url", seed.get("base_url"))
+        setattr(device, "_device_id", seed.get("device_id"))
+        setattr(device, "_lineup_url", seed.get("lineup_url"))
+        setattr(device, "_sys_hwmodel", seed.get("model"))
+        return device
+
+    devices: List[HDHomeRunDevice] = await Discover(
+        broadcast_address=config_entry.data.get(CONF_HOST),
+        mode=discovery_mode,
+        session=session,
+    ).async_discover()
+    if devices:
+        return devices[0]
+
+    return None
+
+
+def _is_ip_address(host: str | None) -> bool:
+    """Check if the host is an IP address rather than a name."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+
+    return True
+
+
+def _get_store(hass: HomeAssistant, config_entry: ConfigEntry) -> Store:
+    """Get the store used to persist the device snapshot."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}")
+
+
+async def _async_load_snapshot(
+    hass: HomeAssistant, config_entry: ConfigEntry, store: Store
+) -> Dict[str, Any] | None:
+    """Load the last known state of the device if it is still relevant."""
+    log_formatter = Logger(unique_id=config_entry.unique_id)
+    try:
+        snapshot: Dict[str, Any] | None = await store.async_load()
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.warning(log_formatter.format("unable to load snapshot: %s"), err)
+        return None
+
+    if snapshot is None:
+        return None
+
+    if snapshot.get("tuner_status") is None:
+        _LOGGER.debug(log_formatter.format("snapshot has no tuner status"))
+        return None
+
+    if snapshot.get("host") != config_entry.data.get(CONF_HOST):
+        _LOGGER.debug(log_formatter.format("snapshot is for a different host"))
+        return None
+
+    discovery_mode = DiscoverMode(
+        config_entry.options.get(CONF_DISCOVERY_MODE, DEF_DISCOVERY_MODE.value)
+    )
+    if (
+        discovery_mode is not DiscoverMode.AUTO
+        and snapshot.get("discovery_method") != discovery_mode.name
+    ):
+        _LOGGER.debug(log_formatter.format("snapshot is for a different mode"))
+        return None
+
+    return snapshot
+
+
+async def async_update_device_host(
+    hass: HomeAssistant, config_entry: ConfigEntry, host: str
+) -> None:
+    """Point the running coordinators at a new address without reloading."""
+    log_formatter = Logger(unique_id=config_entry.unique_id)
+    entry_data: Dict[str, Any] = hass.data.get(DOMAIN, {}).get(
+        config_entry.entry_id, {}
+    )
+    device: HDHomeRunDevice | None = entry_data.get(CONF_DEVICE)
+    if device is None or device.ip == host:
+        return
+
+    _LOGGER.debug(log_formatter.format("updating from %s to %s"), device.ip, host)
+    device.set_host(host)
+    await async_refresh_device(hass=hass, config_entry=config_entry)
+
+
+async def async_refresh_device(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinator_keys: Iterable[str] = (
+        CONF_DATA_COORDINATOR_GENERAL,
+        CONF_DATA_COORDINATOR_TUNER_STATUS,
+    ),
+) -> None:
+    """Refresh the coordinators now, even if the device was polled recently."""
+    entry_data: Dict[str, Any] = hass.data.get(DOMAIN, {}).get(
+        config_entry.entry_id, {}
+    )
+    device: HDHomeRunDevice | None = entry_data.get(CONF_DEVICE)
+    if device is None:
+        return
+
+    if (fleet := hass.data[DOMAIN].get(CONF_FLEET)) is not None:
+        fleet.invalidate(device)
+    for coordinator_key in coordinator_keys:
+        if (coordinator := entry_data.get(coordinator_key)) is not None:
+            await coordinator.async_request_refresh()
+
+
+@callback
+def _async_add_storage_device(
+    hass: HomeAssistant, record: ListenerRecord, _previous: ListenerRecord | None
+) -> None:
+    """Keep the storage engines seen on the network in the fleet.
+
+    Devices that are also tuners are left for their config entries to add.
+    """
+    if record.device_types != (HDHOMERUN_DEVICE_TYPE_STORAGE,):
+        return
+
+    device: HDHomeRunDevice = HDHomeRunDevice(host=record.ip)
+    setattr(device, "_base_url", record.base_url)
+    setattr(device, "_device_types", record.device_types)
+    fleet: DeviceFleet = hass.data[DOMAIN].setdefault(CONF_FLEET, DeviceFleet())
+    fleet.add(device=device, device_id=record.device_id)
+
+
+async def _async_service_channel_scan(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Start a channel scan on many devices at the same time.
+
+    The service returns once the scans are started, an event is fired with
+    the outcome for each device when they have all finished.
+    """
+    device_registry: dr.DeviceRegistry = dr.async_get(hass=hass)
+    entries: Dict[str, ConfigEntry] = {}
+    scans: List[Tuple[HDHomeRunDevice, str]] = []
+    channel_sources: str | Dict[str, str] | None = call.data.get(CONF_CHANNEL_SOURCE)
+    for device_id in call.data[CONF_DEVICE_ID]:
+        if (device_entry := device_registry.async_get(device_id)) is None:
+            continue
+
+        for entry_id in device_entry.config_entries:
+            if (
+                device := hass.data[DOMAIN].get(entry_id, {}).get(CONF_DEVICE)
+            ) is None:
+                continue
+
+            # config entries for the same physical device share the device
+            if any(scan[0] is device for scan in scans):
+                continue
+
+            channel_source: str | None = channel_sources
+            if isinstance(channel_sources, dict):
+                channel_source = channel_sources.get(
+                    device_id, channel_sources.get(device.device_id)
+                )
+            channel_source = channel_source or next(
+                iter(device.channel_sources or []), None
+            )
+            if channel_source is None:
+                _LOGGER.warning(
+                    Logger(unique_id=device.device_id).format(
+                        "no channel source available to scan"
+                    )
+                )
+                continue
+
+            config_entry: ConfigEntry = hass.config_entries.async_get_entry(entry_id)
+            entries[device.device_id or device.ip] = config_entry
+            scans.append((device, channel_source))
+
+    if not scans:
+        return
+
+    reported: Set[str] = set()
+
+    @callback
+    def _async_on_progress(progress: Dict[str, ChannelScanProgress | None]) -> None:
+        """Let the entities know as each device starts scanning."""
+        for name, device_progress in progress.items():
+            if name in reported or device_progress is None:
+                continue
+
+            reported.add(name)
+            config_entry: ConfigEntry = entries[name]
+            coordinator: DataUpdateCoordinator = hass.data[DOMAIN][
+                config_entry.entry_id
+            ][CONF_DATA_COORDINATOR_GENERAL]
+            coordinator.async_set_updated_data(coordinator.data)
+
+    async def _async_run() -> None:
+        """Carry out the scans and report the outcome."""
+        results: List[ChannelScanResult] = await async_channel_scan_many(
+            scans=scans,
+            max_concurrent=call.data[CONF_MAX_CONCURRENT],
+            on_progress=_async_on_progress,
+        )
+        for result in results:
+            _LOGGER.debug(
+                Logger(unique_id=result.name).format("channel scan finished: %s"),
+                result,
+            )
+            await async_refresh_device(
+                hass=hass,
+                config_entry=entries[result.name],
+                coordinator_keys=(CONF_DATA_COORDINATOR_GENERAL,),
+            )
+
+        hass.bus.async_fire(
+            EVENT_HDHOMERUN_CHANNEL_SCAN_FINISHED,
+            {
+                "results": [
+                    {
+                        "config_entry_id": entries[result.name].entry_id,
+                        **dataclasses.asdict(result),
+                    }
+                    for result in results
+                ]
+            },
+        )
+
+    hass.async_create_background_task(_async_run(), name=f"{DOMAIN}_channel_scan")
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Create a config entry."""
     log_formatter = Logger(unique_id=config_entry.unique_id)
@@ -55,52 +340,160 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault(config_entry.entry_id, {})
+    hass.data[DOMAIN][config_entry.entry_id][CONF_OPTIONS] = dict(config_entry.options)
 
     # listen for options updates
     config_entry.async_on_unload(config_entry.add_update_listener(_async_reload))
 
+    if not hass.services.has_service(DOMAIN, SERVICE_CHANNEL_SCAN):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_CHANNEL_SCAN,
+            functools.partial(_async_service_channel_scan, hass),
+            schema=vol.Schema(
+                {
+                    vol.Required(CONF_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+                    vol.Optional(CONF_CHANNEL_SOURCE): vol.Any(
+                        cv.string, {cv.string: cv.string}
+                    ),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT, default=DEF_MAX_CONCURRENT_SCANS
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                }
+            ),
+        )
+
+    setup_started: float = time.perf_counter()
+    store: Store = _get_store(hass=hass, config_entry=config_entry)
+    hass.data[DOMAIN][config_entry.entry_id][CONF_STORE] = store
+    snapshot: Dict[str, Any] | None = await _async_load_snapshot(
+        hass=hass, config_entry=config_entry, store=store
+    )
+
+    # region #-- get the device shared by the coordinators --#
+    device: HDHomeRunDevice | None = None
+    warm_start: bool = False
+    if snapshot is not None:
+        try:
+            device = HDHomeRunDevice.from_snapshot(
+                snapshot=snapshot, session=async_get_clientsession(hass=hass)
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning(log_formatter.format("unable to use snapshot: %s"), err)
+        else:
+            _LOGGER.debug(log_formatter.format("warm starting from snapshot"))
+            warm_start = True
+
+    if device is None:
+        try:
+            device = await _async_discover_device(hass=hass, config_entry=config_entry)
+        except Exception as err:
+            raise ConfigEntryNotReady(str(err)) from err
+        if device is None:
+            raise ConfigEntryNotReady(
+                f"Unable to find {config_entry.data.get(CONF_HOST)}"
+            )
+
+    # use the instance shared with other consumers of the same physical device
+    fleet: DeviceFleet = hass.data[DOMAIN].setdefault(CONF_FLEET, DeviceFleet())
+    device = fleet.acquire(device=device, device_id=config_entry.unique_id)
+    hass.data[DOMAIN][config_entry.entry_id][CONF_DEVICE] = device
+    # endregion
+
     # region #-- set up the coordinators --#
+    scan_interval_general: int = config_entry.options.get(
+        CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL_SECS
+    )
+    scan_interval_tuner_status: int = config_entry.options.get(
+        CONF_SCAN_INTERVAL_TUNER_STATUS, DEF_SCAN_INTERVAL_TUNER_STATUS_SECS
+    )
+
+    handled_run: int | None = None
+    registry_device_id: str | None = None
+    registry_sw_version: str | None = None
+
+    @callback
+    def _async_update_registry_firmware() -> None:
+        """Update the firmware version of the device in the registry.
+
+        The registry entry is looked up by identifier once and then cached.
+        """
+        nonlocal registry_device_id, registry_sw_version
+
+        device_registry: dr.DeviceRegistry = dr.async_get(hass=hass)
+        device_entry: dr.DeviceEntry | None = None
+        if registry_device_id is not None:
+            device_entry = device_registry.async_get(registry_device_id)
+        if device_entry is None:
+            device_entry = device_registry.async_get_device(
+                identifiers={(DOMAIN, config_entry.unique_id)}
+            )
+        if device_entry is None:  # entities not yet created
+            return
+
+        registry_device_id = device_entry.id
+        registry_sw_version = device_entry.sw_version
+        if device.installed_version == registry_sw_version:
+            return
+
+        _LOGGER.debug(
+            log_formatter.format(
+                "Firmware version changed from %s to %s, updating device"
+            ),
+            registry_sw_version,
+            device.installed_version,
+        )
+        device_registry.async_update_device(
+            device_id=registry_device_id, sw_version=device.installed_version
+        )
+        hass.bus.async_fire(
+            EVENT_HDHOMERUN_FIRMWARE_CHANGED,
+            {
+                "config_entry_id": config_entry.entry_id,
+                "device_id": device.device_id,
+                "old": registry_sw_version,
+                "new": device.installed_version,
+            },
+        )
+        registry_sw_version = device.installed_version
+
     async def _async_data_coordinator_update() -> bool:
-        """Update routine for the general details DataUpdateCoordinator."""
-        device: List[HDHomeRunDevice] | HDHomeRunDevice | None = None
-        try:
-            if (
-                device := hass.data[DOMAIN][config_entry.entry_id][
-                    CONF_DATA_COORDINATOR_GENERAL
-                ].data
-            ) is None:
-                device = await Discover(
-                    broadcast_address=config_entry.data.get(CONF_HOST),
-                    mode=DiscoverMode(
-                        config_entry.options.get(
-                            CONF_DISCOVERY_MODE, DEF_DISCOVERY_MODE.value
-                        )
-                    ),
-                    session=async_get_clientsession(hass=hass),
-                ).async_discover()
-                if device:
-                    device = device[0]
-            await device.async_gather_details()
-            device_registry: dr.DeviceRegistry = dr.async_get(hass=hass)
-            device_entry: List[dr.DeviceEntry] = [
-                device_details
-                for _, device_details in device_registry.devices.items()
-                if (DOMAIN, config_entry.unique_id) in device_details.identifiers
-            ]
-            if device_entry:
-                if device.installed_version != device_entry[0].sw_version:
-                    _LOGGER.debug(
-                        log_formatter.format(
-                            "Firmware version changed from %s to %s, updating device"
-                        ),
-                        device_entry[0].sw_version,
-                        device.installed_version,
-                    )
+        """Update routine for the general details DataUpdateCoordinator.
 
-                    device_registry.async_update_device(
-                        device_id=device_entry[0].id,
-                        sw_version=device.installed_version,
-                    )
+        The details may have been gathered on behalf of another consumer of
+        the device, so whether anything changed is worked out from the runs
+        made since this entry last looked rather than the latest run alone.
+        """
+        nonlocal handled_run
+
+        try:
+            await fleet.async_gather_details(
+                device=device, max_age=scan_interval_general * FLEET_MAX_AGE_RATIO
+            )
+            runs, changed_run = fleet.get_runs(device=device, name="gather_details")
+            details_changed: bool = handled_run is None or changed_run > handled_run
+            handled_run = runs
+            hass.data[DOMAIN][config_entry.entry_id][
+                CONF_DETAILS_CHANGED
+            ] = details_changed
+            if not details_changed:
+                return device
+
+            store.async_delay_save(device.to_snapshot, STORAGE_SAVE_DELAY_SECS)
+
+            if device.lineup_diff:
+                _LOGGER.debug(log_formatter.format("lineup changed, firing event"))
+                hass.bus.async_fire(
+                    EVENT_HDHOMERUN_LINEUP_CHANGED,
+                    {
+                        "config_entry_id": config_entry.entry_id,
+                        "device_id": device.device_id,
+                        **device.lineup_diff.as_dict(),
+                    },
+                )
+
+            if device.installed_version != registry_sw_version:
+                _async_update_registry_firmware()
         except Exception as exc:
             _LOGGER.warning(log_formatter.format("%s"), exc)
             raise UpdateFailed(str(exc)) from exc
@@ -108,27 +501,18 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         return device
 
     async def _async_data_coordinator_tuner_status_update() -> bool:
-        """Update routine for the tuner status DataUpdateCoordinator."""
-        device: List[HDHomeRunDevice] | HDHomeRunDevice | None = None
+        """Update routine for the tuner status DataUpdateCoordinator.
+
+        The details are gathered by the general coordinator, this only waits
+        for them if they haven't been gathered yet.
+        """
         try:
-            if (
-                device := hass.data[DOMAIN][config_entry.entry_id][
-                    CONF_DATA_COORDINATOR_TUNER_STATUS
-                ].data
-            ) is None:
-                device = await Discover(
-                    broadcast_address=config_entry.data.get(CONF_HOST),
-                    mode=DiscoverMode(
-                        config_entry.options.get(
-                            CONF_DISCOVERY_MODE, DEF_DISCOVERY_MODE.value
-                        )
-                    ),
-                    session=async_get_clientsession(hass=hass),
-                ).async_discover()
-                if device:
-                    device = device[0]
-            await device.async_gather_details()
-            await device.async_refresh_tuner_status()
+            if device.tuner_count is None:
+                await fleet.async_gather_details(device=device)
+            await fleet.async_refresh_tuner_status(
+                device=device,
+                max_age=scan_interval_tuner_status * FLEET_MAX_AGE_RATIO,
+            )
         except Exception as exc:
             _LOGGER.warning(log_formatter.format("%s"), exc)
             raise UpdateFailed(str(exc)) from exc
@@ -140,30 +524,37 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         _LOGGER,
         name=f"{DOMAIN}_{config_entry.unique_id}",
         update_method=_async_data_coordinator_update,
-        update_interval=timedelta(
-            seconds=config_entry.options.get(CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL_SECS)
-        ),
     )
     hass.data[DOMAIN][config_entry.entry_id][
         CONF_DATA_COORDINATOR_GENERAL
     ] = coordinator_general
-    await coordinator_general.async_config_entry_first_refresh()
 
     coordinator_tuner_status: DataUpdateCoordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name=f"{DOMAIN}_tuner_status_{config_entry.unique_id}",
         update_method=_async_data_coordinator_tuner_status_update,
-        update_interval=timedelta(
-            seconds=config_entry.options.get(
-                CONF_SCAN_INTERVAL_TUNER_STATUS, DEF_SCAN_INTERVAL_TUNER_STATUS_SECS
-            )
-        ),
     )
     hass.data[DOMAIN][config_entry.entry_id][
         CONF_DATA_COORDINATOR_TUNER_STATUS
     ] = coordinator_tuner_status
-    await coordinator_tuner_status.async_config_entry_first_refresh()
+    # endregion
+
+    # region #-- warm start from the snapshot or do the first refresh --#
+    if warm_start:
+        coordinator_general.async_set_updated_data(device)
+        coordinator_tuner_status.async_set_updated_data(device)
+    else:
+        try:
+            await asyncio.gather(
+                coordinator_general.async_config_entry_first_refresh(),
+                coordinator_tuner_status.async_config_entry_first_refresh(),
+            )
+        except Exception:
+            # the entry will be set up again so give up the shared device
+            fleet.release(device=device)
+            hass.data[DOMAIN][config_entry.entry_id].pop(CONF_DEVICE, None)
+            raise
     # endregion
 
     # region #-- setup the platforms --#
@@ -172,10 +563,102 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     await hass.config_entries.async_forward_entry_setups(config_entry, setup_platforms)
     # endregion
 
+    hass.data[DOMAIN][config_entry.entry_id][CONF_SETUP_TIMING] = {
+        "setup_secs": round(time.perf_counter() - setup_started, 3),
+        "warm_start": warm_start,
+    }
+    _LOGGER.debug(
+        log_formatter.format("setup took %s"),
+        hass.data[DOMAIN][config_entry.entry_id][CONF_SETUP_TIMING],
+    )
+
+    # region #-- reconcile the snapshot with the device --#
+    if warm_start:
+        for coordinator in (coordinator_general, coordinator_tuner_status):
+            hass.async_create_background_task(
+                coordinator.async_refresh(), name=f"{coordinator.name}_warm_start"
+            )
+    # endregion
+
+    # region #-- stagger the polling with other devices --#
+    # the coordinators have no update interval, so that every device doesn't
+    # refresh at the same moment, instead the scheduler gives each one its
+    # own slot in the interval
+    scheduler: PollScheduler = hass.data[DOMAIN].setdefault(
+        CONF_SCHEDULER, PollScheduler()
+    )
+    for coordinator, key, interval in (
+        (coordinator_general, "general", scan_interval_general),
+        (coordinator_tuner_status, "tuner_status", scan_interval_tuner_status),
+    ):
+        config_entry.async_on_unload(
+            scheduler.schedule(
+                key=f"{config_entry.entry_id}:{key}",
+                interval=interval,
+                action=coordinator.async_refresh,
+            )
+        )
+    # endregion
+
+    # region #-- follow the device if its address changes --#
+    # only devices reached by discovery or UDP are followed, a host name
+    # already follows the device and HTTP only entries opted out of UDP
+    discovery_mode = DiscoverMode(
+        config_entry.options.get(CONF_DISCOVERY_MODE, DEF_DISCOVERY_MODE.value)
+    )
+    if discovery_mode is not DiscoverMode.HTTP and _is_ip_address(
+        config_entry.data.get(CONF_HOST)
+    ):
+        listener: DiscoveryListener | None = hass.data[DOMAIN].get(CONF_LISTENER)
+        if listener is None:
+            listener = hass.data[DOMAIN][CONF_LISTENER] = DiscoveryListener()
+            listener.subscribe(functools.partial(_async_add_storage_device, hass))
+        try:
+            await listener.async_start()
+        except OSError as err:
+            _LOGGER.warning(
+                log_formatter.format("unable to start the discovery listener: %s"),
+                err,
+            )
+
+        @callback
+        def _async_device_seen(
+            record: ListenerRecord, _previous: ListenerRecord | None
+        ) -> None:
+            """Point the coordinators at the device if its address changed."""
+            if (
+                record.device_id != config_entry.unique_id
+                or not _is_ip_address(config_entry.data.get(CONF_HOST))
+                or record.ip in (device.ip, config_entry.data.get(CONF_HOST))
+            ):
+                return
+
+            _LOGGER.debug(
+                log_formatter.format("device has moved from %s to %s"),
+                device.ip,
+                record.ip,
+            )
+            hass.config_entries.async_update_entry(
+                config_entry, data={**config_entry.data, CONF_HOST: record.ip}
+            )
+            hass.async_create_task(
+                async_update_device_host(
+                    hass=hass, config_entry=config_entry, host=record.ip
+                )
+            )
+
+        config_entry.async_on_unload(listener.subscribe(_async_device_seen))
+    # endregion
+
     _LOGGER.debug(log_formatter.format("exited"))
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot when the config entry is removed."""
+    await _get_store(hass=hass, config_entry=config_entry).async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Cleanup when unloading a config entry."""
     # region #-- clean up the platforms --#
@@ -184,7 +667,16 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         config_entry, setup_platforms
     )
     if ret:
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        entry_data: Dict[str, Any] = hass.data[DOMAIN].pop(config_entry.entry_id)
+        if (fleet := hass.data[DOMAIN].get(CONF_FLEET)) is not None:
+            fleet.release(entry_data.get(CONF_DEVICE))
+        if not any(
+            entry.entry_id in hass.data[DOMAIN]
+            for entry in hass.config_entries.async_entries(DOMAIN)
+        ):
+            hass.services.async_remove(DOMAIN, SERVICE_CHANNEL_SCAN)
+            if (listener := hass.data[DOMAIN].pop(CONF_LISTENER, None)) is not None:
+                await listener.async_stop()
         ret = True
     else:
         ret = False
@@ -219,6 +711,27 @@ class HDHomerunEntity(CoordinatorEntity):
             f"{self.entity_domain.lower()}::"
             f"{slugify(self.entity_description.name)}"
         )
+        self._was_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Respond to the coordinator updating.
+
+        Entities using the general coordinator skip writing their state if
+        none of the details of the device changed since the last update.
+        """
+        available: bool = self.available
+        entry_data: Dict[str, Any] = self.hass.data[DOMAIN][self._config.entry_id]
+        if (
+            available
+            and self._was_available
+            and self.coordinator is entry_data[CONF_DATA_COORDINATOR_GENERAL]
+            and not entry_data.get(CONF_DETAILS_CHANGED, True)
+        ):
+            return
+
+        self._was_available = available
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
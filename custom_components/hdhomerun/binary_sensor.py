@@ -3,10 +3,11 @@
 # region #-- imports --#
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Callable, List, Mapping
+from typing import Any, Awaitable, Callable, List, Mapping
 
 from homeassistant.components.binary_sensor import DOMAIN as ENTITY_DOMAIN
 from homeassistant.components.binary_sensor import (
@@ -15,17 +16,16 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from . import HDHomerunEntity, entity_cleanup
+from . import HDHomerunEntity, async_refresh_device, entity_cleanup
 from .const import (
     CONF_DATA_COORDINATOR_GENERAL,
     DOMAIN,
@@ -60,14 +60,16 @@ async def async_setup_entry(
     coordinator: DataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id][
         CONF_DATA_COORDINATOR_GENERAL
     ]
-    sensors: list[HDHomerunBinarySensor | HDHomeRunRecurringBinarySensor] = []
+    sensors: list[HDHomerunBinarySensor | HDHomeRunWatchedBinarySensor] = []
 
     if coordinator.data.channel_sources:
         sensors.append(
-            HDHomeRunRecurringBinarySensor(
+            HDHomeRunWatchedBinarySensor(
                 additional_description=AdditionalBinarySensorDescription(
                     extra_attributes=lambda r: {
-                        "progress": r,
+                        "found": r.found,
+                        "found_channels": list(r.found_channels),
+                        "progress": r.progress,
                     },
                 ),
                 config_entry=config_entry,
@@ -80,10 +82,13 @@ async def async_setup_entry(
                     name="Channel Scanning",
                     translation_key="channel_scanning",
                 ),
-                recurrence_interval=5,
-                recurrence_trigger=SIGNAL_HDHOMERUN_CHANNEL_SCANNING_STARTED,
-                state_method="async_get_channel_scan_progress",
-                state_processor=lambda s: s is not None,
+                state_processor=lambda r: r.scanning,
+                watch_finished=functools.partial(
+                    async_refresh_device,
+                    coordinator_keys=(CONF_DATA_COORDINATOR_GENERAL,),
+                ),
+                watch_method="watch_channel_scan",
+                watch_trigger=SIGNAL_HDHOMERUN_CHANNEL_SCANNING_STARTED,
             )
         )
 
@@ -165,19 +170,19 @@ class HDHomerunBinarySensor(HDHomerunEntity, BinarySensorEntity):
         return False
 
 
-class HDHomeRunRecurringBinarySensor(HDHomerunEntity, BinarySensorEntity):
-    """Representation of a binary sensor that may need out of band updates."""
+class HDHomeRunWatchedBinarySensor(HDHomerunEntity, BinarySensorEntity):
+    """Representation of a binary sensor updated from a stream of the device."""
 
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
         config_entry: ConfigEntry,
         description: BinarySensorEntityDescription,
-        recurrence_interval: int,
-        recurrence_trigger: str,
-        state_method: str,
         state_processor: Callable[..., bool],
-        recurrence_post_signal: str | None = None,
+        watch_method: str,
+        watch_trigger: str,
+        watch_finished: Callable[..., Awaitable[None]] | None = None,
+        watch_post_signal: str | None = None,
         additional_description: AdditionalBinarySensorDescription | None = None,
     ) -> None:
         """Initialise."""
@@ -190,12 +195,13 @@ class HDHomeRunRecurringBinarySensor(HDHomerunEntity, BinarySensorEntity):
         self._state: bool | None = None
 
         self._esa: Mapping[str, Any] | None = None
-        self._remove_action_interval: Callable | None = None
-        self._recurrence_interval: int = recurrence_interval
-        self._recurrence_trigger: str = recurrence_trigger
-        self._recurrence_post_signal: str | None = recurrence_post_signal
-        self._state_method: str = state_method
+        self._removed: bool = False
         self._state_processor: Callable[..., bool] = state_processor
+        self._watch_finished: Callable[..., Awaitable[None]] | None = watch_finished
+        self._watch_method: str = watch_method
+        self._watch_post_signal: str | None = watch_post_signal
+        self._watch_task: asyncio.Task | None = None
+        self._watch_trigger: str = watch_trigger
 
         super().__init__(
             config_entry=config_entry,
@@ -207,72 +213,68 @@ class HDHomeRunRecurringBinarySensor(HDHomerunEntity, BinarySensorEntity):
         """React to updates from the coordinator."""
         super()._handle_coordinator_update()
         if self.is_on:
-            if self._remove_action_interval is None:
-                async_dispatcher_send(hass=self.hass, signal=self._recurrence_trigger)
-        else:
-            self._stop_interval()
-
-        self.async_write_ha_state()
-
-    def _stop_interval(self) -> None:
-        """Stop the interval from running."""
-        if isinstance(self._remove_action_interval, Callable):
-            self._remove_action_interval()
-            self._remove_action_interval = None
-            self._state = None
-            if self._recurrence_post_signal is not None:
-                async_dispatcher_send(self.hass, self._recurrence_post_signal)
-
-    async def _async_action(self, _: datetime | None = None) -> None:
-        """Calculate the actual state based on the current state in the Mesh.
-
-        This is required because we don't want to query a full update of all
-        entities from the Mesh.
-        """
-        state_method: Callable | None = getattr(
-            self.coordinator.data, self._state_method, None
-        )
-        if not isinstance(state_method, Callable):
-            raise RuntimeError("State method is not callable") from None
-
-        if not isinstance(self._state_processor, Callable):
-            raise RuntimeError("State processor is not callable") from None
-
-        state_method_results: Any = await state_method()
-        if isinstance(self._additional_description.extra_attributes, Callable):
-            self._esa = self._additional_description.extra_attributes(
-                state_method_results
+            self._start_watching()
+
+    @callback
+    def _start_watching(self) -> None:
+        """Start consuming the stream if not already doing so."""
+        if self._watch_task is None and not self._removed:
+            self._watch_task = self.hass.async_create_background_task(
+                self._async_watch(), name=f"{self.entity_id}_watch"
             )
-        temp_state: bool = self._state_processor(state_method_results)
-        if temp_state:
-            if self._remove_action_interval is None:
-                self._remove_action_interval = async_track_time_interval(
-                    hass=self.hass,
-                    action=self._async_action,
-                    interval=timedelta(seconds=self._recurrence_interval),
-                )
-        self._state = temp_state
 
-        self.async_schedule_update_ha_state()
+    async def _async_watch(self) -> None:
+        """Update the state from the stream until it ends."""
+        watch_method: Callable | None = getattr(
+            self.coordinator.data, self._watch_method, None
+        )
+        if not isinstance(watch_method, Callable):
+            raise RuntimeError("Watch method is not callable") from None
+
+        was_on: bool = False
+        try:
+            async for result in watch_method():
+                if isinstance(self._additional_description.extra_attributes, Callable):
+                    self._esa = self._additional_description.extra_attributes(result)
+                self._state = self._state_processor(result)
+                was_on |= self._state
+                self.async_write_ha_state()
+        finally:
+            self._watch_task = None
+            self._state = None
+            self._esa = None
+            if not self._removed:
+                self.async_write_ha_state()
 
-        if not temp_state:
-            self._stop_interval()
+        if was_on and self._watch_finished is not None:
+            await self._watch_finished(hass=self.hass, config_entry=self._config)
+        if self._watch_post_signal is not None:
+            async_dispatcher_send(self.hass, self._watch_post_signal)
 
     async def async_added_to_hass(self) -> None:
         """Do stuff when entity is added to registry."""
         await super().async_added_to_hass()
+        self._removed = False
         self.async_on_remove(
             async_dispatcher_connect(
                 hass=self.hass,
-                signal=self._recurrence_trigger,
-                target=self._async_action,
+                signal=self._watch_trigger,
+                target=self._start_watching,
             )
         )
         self._handle_coordinator_update()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Tidy up when removed."""
-        self._stop_interval()
+        """Tidy up when removed.
+
+        The stream is stopped before the entity goes so that it doesn't try
+        to write its state afterwards.
+        """
+        self._removed = True
+        if (watch_task := self._watch_task) is not None:
+            watch_task.cancel()
+            await asyncio.gather(watch_task, return_exceptions=True)
+        await super().async_will_remove_from_hass()
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
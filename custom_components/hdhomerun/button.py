@@ -6,7 +6,7 @@ from __future__ import annotations
 import dataclasses
 import logging
 from abc import ABC
-from typing import Callable, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from homeassistant.components.button import DOMAIN as ENTITY_DOMAIN
 from homeassistant.components.button import (
@@ -23,10 +23,11 @@ from homeassistant.helpers.dispatcher import (
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from . import HDHomerunEntity, entity_cleanup
+from . import HDHomerunEntity, async_refresh_device, entity_cleanup
 from .const import (
     CONF_DATA_COORDINATOR_GENERAL,
     DOMAIN,
+    EVENT_HDHOMERUN_RESTARTED,
     SIGNAL_HDHOMERUN_CHANNEL_SCANNING_STARTED,
     SIGNAL_HDHOMERUN_CHANNEL_SOURCE_CHANGE,
 )
@@ -46,11 +47,31 @@ class AdditionalButtonDescription:
     listen_for_signal: str | None = None
     listen_for_signal_action: str | None = None
     press_action_arguments: Optional[dict] = dataclasses.field(default_factory=dict)
+    press_finished: Callable[..., Awaitable[None]] | None = None
 
 
 # endregion
 
 
+async def _async_restart_finished(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    result: float | None,
+    error: Exception | None,
+) -> None:
+    """Report how long the device was away and refresh it."""
+    event_data: Dict[str, Any] = {
+        "config_entry_id": config_entry.entry_id,
+        "device_id": config_entry.unique_id,
+    }
+    if error is None:
+        event_data["downtime"] = round(result, 3)
+    else:
+        event_data["error"] = str(error)
+    hass.bus.async_fire(EVENT_HDHOMERUN_RESTARTED, event_data)
+    await async_refresh_device(hass=hass, config_entry=config_entry)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -65,6 +86,8 @@ async def async_setup_entry(
         HDHomeRunButton(
             additional_description=AdditionalButtonDescription(
                 press_action="async_restart",
+                press_action_arguments={"wait": True},
+                press_finished=_async_restart_finished,
             ),
             config_entry=config_entry,
             coordinator=coordinator,
@@ -113,8 +136,13 @@ async def _async_button_pressed(
     hass: HomeAssistant,
     self: HDHomeRunButton,
     action_arguments: dict | None = None,
+    finished: Callable[..., Awaitable[None]] | None = None,
 ) -> None:
-    """Carry out the action for the button being pressed."""
+    """Carry out the action for the button being pressed.
+
+    If there is something to do once the action has finished it is done
+    even if the action failed, it is told the result or the error.
+    """
     action: Callable | None = getattr(device, action, None)
     signal: str | None = action_arguments.pop("signal", None)
     if isinstance(action, Callable):
@@ -123,9 +151,21 @@ async def _async_button_pressed(
         for arg, value in action_arguments.items():
             if isinstance(value, Callable):
                 action_arguments[arg] = value(self)
-        await action(**action_arguments)
+        ret: Any = None
+        error: Exception | None = None
+        try:
+            ret = await action(**action_arguments)
+        except Exception as err:  # pylint: disable=broad-except
+            if finished is None:
+                raise
+            _LOGGER.warning("%s failed: %s", action.__name__, err)
+            error = err
         if signal:
             async_dispatcher_send(hass, signal)
+        if finished is not None:
+            await finished(
+                hass=hass, config_entry=self._config, result=ret, error=error
+            )
 
 
 class HDHomeRunButton(HDHomerunEntity, ButtonEntity, ABC):
@@ -171,11 +211,22 @@ class HDHomeRunButton(HDHomerunEntity, ButtonEntity, ABC):
         return await super().async_added_to_hass()
 
     async def async_press(self) -> None:
-        """Handle the button being pressed."""
-        await _async_button_pressed(
+        """Handle the button being pressed.
+
+        Actions that need to be followed up, e.g. waiting for a restart,
+        carry on in the background.
+        """
+        press = _async_button_pressed(
             action=self._additional_description.press_action,
             action_arguments=self._additional_description.press_action_arguments.copy(),
             device=self.coordinator.data,
+            finished=self._additional_description.press_finished,
             hass=self.hass,
             self=self,
         )
+        if self._additional_description.press_finished is None:
+            await press
+        else:
+            self.hass.async_create_background_task(
+                press, name=f"{self.entity_id}_press"
+            )
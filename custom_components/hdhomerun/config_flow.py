@@ -17,9 +17,11 @@ from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from . import async_update_device_host
 from .const import (
     CONF_HOST,
     CONF_SCAN_INTERVAL_TUNER_STATUS,
+    CONF_SSDP_SEEDS,
     CONF_TUNER_CHANNEL_ENTITY_PICTURE_PATH,
     CONF_TUNER_CHANNEL_FORMAT,
     CONF_TUNER_CHANNEL_NAME,
@@ -32,7 +34,8 @@ from .const import (
     DOMAIN,
 )
 from .logger import Logger
-from .pyhdhr.discover import Discover, HDHomeRunDevice
+from .pyhdhr.const import HDHOMERUN_TAG_DEVICE_ID
+from .pyhdhr.discover import Discover, HDHomeRunDevice, MultiDiscover
 from .pyhdhr.exceptions import HDHomeRunDeviceNotFoundError
 
 # endregion
@@ -49,6 +52,9 @@ STEP_SELECT_DEVICE: str = "select_device"
 STEP_TIMEOUTS: str = "timeouts"
 STEP_USER: str = "user"
 
+DEF_GATHER_DETAILS_CONCURRENCY: int = 4
+DEF_GATHER_DETAILS_TIMEOUT_SECS: float = 5
+
 
 async def _async_build_schema_with_user_input(step: str, user_input=None) -> vol.Schema:
     """Build the input and validation schema for the config UI.
@@ -163,6 +169,8 @@ class HDHomerunConfigFlow(config_entries.ConfigFlow, Logger, domain=DOMAIN):
         self._error_message: str = ""
         self._friendly_name: str = ""
         self._host: str = ""
+        self._gather_checked: int = 0
+        self._gather_total: int | None = None
         self._task_details: asyncio.Task | None = None
 
     @staticmethod
@@ -173,26 +181,94 @@ class HDHomerunConfigFlow(config_entries.ConfigFlow, Logger, domain=DOMAIN):
         """Get the options flow for this handler."""
         return HDHomerunOptionsFlowHandler(config_entry=config_entry)
 
+    async def _async_gather_candidate_details(
+        self, candidates: List[HDHomeRunDevice], existing_ids: List[str]
+    ) -> None:
+        """Gather the details for the candidate devices concurrently.
+
+        The number of devices queried at once is bounded and each device has
+        its own timeout. Devices are added to the list for selection as their
+        results arrive and the progress shown is updated with them.
+        """
+        self._gather_checked = 0
+        self._gather_total = len(candidates)
+        self._async_update_progress()
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(
+            DEF_GATHER_DETAILS_CONCURRENCY
+        )
+
+        async def _async_gather(dev: HDHomeRunDevice) -> HDHomeRunDevice:
+            """Gather details for a single device."""
+            async with semaphore:
+                await asyncio.wait_for(
+                    dev.async_gather_details(),
+                    timeout=DEF_GATHER_DETAILS_TIMEOUT_SECS,
+                )
+            return dev
+
+        for result in asyncio.as_completed([_async_gather(dev) for dev in candidates]):
+            try:
+                dev: HDHomeRunDevice = await result
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug(self.format("unable to gather details: %s"), err)
+            else:
+                if dev.device_id not in existing_ids:
+                    dev_name: str = ""
+                    if dev.friendly_name:
+                        dev_name += dev.friendly_name
+                    dev_name += f" {dev.device_id}" if dev_name else dev.device_id
+                    if self._discovered_devices is None:
+                        self._discovered_devices = {}
+                    self._discovered_devices[dev.ip] = dev_name
+                    _LOGGER.debug(self.format("added %s (%s)"), dev_name, dev.ip)
+
+            self._gather_checked += 1
+            self._async_update_progress()
+
+    @callback
+    def _async_update_progress(self) -> None:
+        """Have the progress shown for the flow brought up to date."""
+        self.hass.async_create_task(
+            self.hass.config_entries.flow.async_configure(flow_id=self.flow_id)
+        )
+
     async def _async_task_discover_all(self) -> None:
         """Discover all available devices."""
         err_msg: str | None = None
         try:
-            self._discovered_devices_hd: List[HDHomeRunDevice] = await Discover(
+            discover: MultiDiscover = MultiDiscover(
                 session=async_get_clientsession(hass=self.hass)
-            ).async_discover()
+            )
+            self._discovered_devices_hd: List[HDHomeRunDevice] = (
+                await discover.async_discover()
+            )
+            _LOGGER.debug(self.format("discovery stats: %s"), discover.stats)
             if len(self._discovered_devices_hd) == 0:
                 raise ValueError
         except Exception as err:  # pylint: disable=broad-except
             err_msg = "generic_hdhomerun_error"
             self._error_message = str(err)
             _LOGGER.error(self.format("%s"), err)
+        else:
+            # region #-- skip devices already configured using the discovery data --#
+            existing_ids: List[str] = [
+                ce.unique_id for ce in self.hass.config_entries.async_entries(DOMAIN)
+            ]
+            candidates: List[HDHomeRunDevice] = [
+                dev
+                for dev in self._discovered_devices_hd
+                if dev.get_from_datagram(tag=HDHOMERUN_TAG_DEVICE_ID)
+                not in existing_ids
+            ]
+            # endregion
+            await self._async_gather_candidate_details(
+                candidates=candidates, existing_ids=existing_ids
+            )
 
         if err_msg is not None:
             self._errors["base"] = err_msg
 
-        self.hass.async_create_task(
-            self.hass.config_entries.flow.async_configure(flow_id=self.flow_id)
-        )
+        self._async_update_progress()
 
     async def _async_task_discover_single(self) -> None:
         """Discover a single device as specified by the instance host."""
@@ -245,6 +321,23 @@ class HDHomerunConfigFlow(config_entries.ConfigFlow, Logger, domain=DOMAIN):
                 step_id=STEP_DETAILS, progress_action="task_discover"
             )
 
+        if not self._task_details.done():
+            if self._gather_total is None:
+                return self.async_show_progress(
+                    step_id=STEP_DETAILS, progress_action="task_discover"
+                )
+
+            # show the devices as their details arrive
+            return self.async_show_progress(
+                step_id=STEP_DETAILS,
+                progress_action="task_gather_details",
+                description_placeholders={
+                    "checked": str(self._gather_checked),
+                    "devices": "<br />".join((self._discovered_devices or {}).values()),
+                    "total": str(self._gather_total),
+                },
+            )
+
         await self._task_details
 
         _LOGGER.debug(self.format("_errors: %s"), self._errors)
@@ -307,23 +400,6 @@ class HDHomerunConfigFlow(config_entries.ConfigFlow, Logger, domain=DOMAIN):
             await self.async_set_unique_id(unique_id=serial, raise_on_progress=False)
             return await self.async_step_friendly_name()
 
-        # region #-- build the names to show as options --#
-        existing_entries: List[
-            config_entries.ConfigEntry
-        ] = self.hass.config_entries.async_entries(domain=DOMAIN)
-        existing_ids: List[str] = [ce.unique_id for ce in existing_entries]
-        for dev in self._discovered_devices_hd:
-            await dev.async_gather_details()
-            if dev.device_id not in existing_ids:
-                dev_name: str = ""
-                if dev.friendly_name:
-                    dev_name += dev.friendly_name
-                dev_name += f" {dev.device_id}" if dev_name else dev.device_id
-                if self._discovered_devices is None:
-                    self._discovered_devices = {}
-                self._discovered_devices[dev.ip] = dev_name
-        # endregion
-
         # region #-- no additional sensors found --#
         if self._discovered_devices is None:
             raise data_entry_flow.AbortFlow(reason="no_additional")
@@ -356,26 +432,54 @@ class HDHomerunConfigFlow(config_entries.ConfigFlow, Logger, domain=DOMAIN):
         service_list = discovery_info.upnp.get(ssdp.ATTR_UPNP_SERVICE_LIST, {}).get(
             "service"
         )
+        base_url: str | None = None
         if service_list:
             _LOGGER.debug(self.format("%s"), json.dumps(service_list))
             service = service_list[0]
-            self._host = urlparse(url=service.get("controlURL", "")).hostname
+            control_url = urlparse(url=service.get("controlURL", ""))
+            self._host = control_url.hostname
+            if control_url.scheme and control_url.netloc:
+                base_url = f"{control_url.scheme}://{control_url.netloc}"
         serial: str = discovery_info.upnp.get(ssdp.ATTR_UPNP_SERIAL, "")
         # endregion
 
+        # region #-- seed the device cache so setup can skip discovery --#
+        if self._host and serial:
+            self.hass.data.setdefault(DOMAIN, {}).setdefault(CONF_SSDP_SEEDS, {})[
+                serial
+            ] = {
+                "base_url": base_url,
+                "device_id": serial,
+                "host": self._host,
+                "lineup_url": f"{base_url}/lineup.json" if base_url else None,
+                "model": discovery_info.upnp.get(
+                    ssdp.ATTR_UPNP_MODEL_NUMBER,
+                    discovery_info.upnp.get(ssdp.ATTR_UPNP_MODEL_NAME),
+                ),
+            }
+        # endregion
+
         # region #-- set a unique_id, update details if device has changed IP --#
         _LOGGER.debug(self.format("setting unique_id: %s"), serial)
         await self.async_set_unique_id(unique_id=serial)
-        matching_instance: List[
-            config_entries.ConfigEntry
-        ] | config_entries.ConfigEntry = [
-            instance for instance in self.hass.config_entries.async_entries(DOMAIN)
-        ]
-        if matching_instance:
-            matching_instance = matching_instance[0]
+        matching_instance: config_entries.ConfigEntry | None = next(
+            (
+                instance
+                for instance in self.hass.config_entries.async_entries(DOMAIN)
+                if instance.unique_id == serial
+            ),
+            None,
+        )
+        if matching_instance is not None:
             if matching_instance.source == "ssdp":
                 _LOGGER.debug(self.format("instance already configured, updating host"))
-                self._abort_if_unique_id_configured(updates={CONF_HOST: self._host})
+                if self._host and matching_instance.data.get(CONF_HOST) != self._host:
+                    await async_update_device_host(
+                        hass=self.hass, config_entry=matching_instance, host=self._host
+                    )
+                self._abort_if_unique_id_configured(
+                    updates={CONF_HOST: self._host}, reload_on_update=False
+                )
             else:
                 _LOGGER.debug(
                     self.format("instance already configured, not updating host")
@@ -396,6 +500,7 @@ class HDHomerunConfigFlow(config_entries.ConfigFlow, Logger, domain=DOMAIN):
             self._errors = {}
             self._friendly_name = user_input.get(CONF_FRIENDLY_NAME, "")
             self._host = user_input.get(CONF_HOST, "")
+            self._gather_total = None
             self._task_details = None
             return await self.async_step_details()
 
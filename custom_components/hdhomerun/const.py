@@ -14,12 +14,22 @@ from .pyhdhr.const import DiscoverMode
 DOMAIN: str = "hdhomerun"
 ENTITY_SLUG: str = "HDHomeRun"
 
+CONF_CHANNEL_SOURCE: str = "channel_source"
 CONF_DATA_COORDINATOR_GENERAL: str = "data_coordinator_general"
 CONF_DATA_COORDINATOR_TUNER_STATUS: str = "data_coordinaror_tuner_status"
+CONF_DETAILS_CHANGED: str = "details_changed"
 CONF_DEVICE: str = "hdhomerun_device"
 CONF_DISCOVERY_MODE: str = "discovery_mode"
+CONF_FLEET: str = "fleet"
 CONF_HOST: str = "host"
+CONF_LISTENER: str = "listener"
+CONF_MAX_CONCURRENT: str = "max_concurrent"
+CONF_OPTIONS: str = "options"
+CONF_SSDP_SEEDS: str = "ssdp_seeds"
+CONF_STORE: str = "store"
 CONF_SCAN_INTERVAL_TUNER_STATUS: str = "scan_interval_tuner_status"
+CONF_SCHEDULER: str = "scheduler"
+CONF_SETUP_TIMING: str = "setup_timing"
 CONF_TUNER_CHANNEL_ENTITY_PICTURE_PATH: str = "channel_entity_picture_path"
 CONF_TUNER_CHANNEL_FORMAT: str = "channel_format"
 CONF_TUNER_CHANNEL_NAME: str = "channel_name"
@@ -32,6 +42,17 @@ DEF_SCAN_INTERVAL_TUNER_STATUS_SECS: int = 10
 DEF_TUNER_CHANNEL_ENTITY_PICTURE_PATH: str = ""
 DEF_TUNER_CHANNEL_FORMAT: str = CONF_TUNER_CHANNEL_NAME
 
+# fraction of the scan interval for which a poll by another consumer is current
+FLEET_MAX_AGE_RATIO: float = 0.9
+
+STORAGE_SAVE_DELAY_SECS: int = 10
+STORAGE_VERSION: int = 1
+
+EVENT_HDHOMERUN_CHANNEL_SCAN_FINISHED: str = f"{DOMAIN}_channel_scan_finished"
+EVENT_HDHOMERUN_FIRMWARE_CHANGED: str = f"{DOMAIN}_firmware_changed"
+EVENT_HDHOMERUN_LINEUP_CHANGED: str = f"{DOMAIN}_lineup_changed"
+EVENT_HDHOMERUN_RESTARTED: str = f"{DOMAIN}_restarted"
+
 PLATFORMS = [
     BINARY_SENSOR_DOMAIN,
     BUTTON_DOMAIN,
@@ -40,5 +61,7 @@ PLATFORMS = [
     UPDATE_DOMAIN,
 ]
 
+SERVICE_CHANNEL_SCAN: str = "channel_scan"
+
 SIGNAL_HDHOMERUN_CHANNEL_SCANNING_STARTED: str = f"{DOMAIN}_channel_scanning_started"
 SIGNAL_HDHOMERUN_CHANNEL_SOURCE_CHANGE: str = f"{DOMAIN}_channel_source_changed"
@@ -1,8 +1,9 @@
 """Diagnostics support."""
 
 # region #-- imports --#
+import dataclasses
 import logging
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
@@ -11,15 +12,22 @@ from homeassistant.core import HomeAssistant
 from .const import (
     CONF_DATA_COORDINATOR_GENERAL,
     CONF_DATA_COORDINATOR_TUNER_STATUS,
+    CONF_LISTENER,
+    CONF_SCHEDULER,
+    CONF_SETUP_TIMING,
     DOMAIN,
 )
 from .pyhdhr.discover import HDHomeRunDevice
+from .pyhdhr.listener import ListenerRecord
 
 # endregion
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# not serialisable and already included as `channels` and `processed_datagram`
+_EXCLUDED_PROPERTIES: Tuple[str, ...] = ("discovery_record", "lineup")
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
@@ -34,7 +42,8 @@ async def async_get_config_entry_diagnostics(
         "device": {
             p: getattr(device, p, None)
             for p in [prop for prop in dir(HDHomeRunDevice) if not prop.startswith("_")]
-            if not isinstance(getattr(device, p, None), Callable)
+            if p not in _EXCLUDED_PROPERTIES
+            and not isinstance(getattr(device, p, None), Callable)
         }
     }
 
@@ -45,6 +54,14 @@ async def async_get_config_entry_diagnostics(
     diags["device"]["tuner_status"] = device_tuner_status.tuner_status
     diags["device"]["raw_details"] = getattr(device, "_raw_details", None)
     diags["device"]["processed_datagram"] = getattr(device, "_processed_datagram", None)
+    diags["setup_timing"] = hass.data[DOMAIN][config_entry.entry_id].get(
+        CONF_SETUP_TIMING
+    )
+    if (scheduler := hass.data[DOMAIN].get(CONF_SCHEDULER)) is not None:
+        diags["scheduler"] = scheduler.stats
+    if (listener := hass.data[DOMAIN].get(CONF_LISTENER)) is not None:
+        record: ListenerRecord | None = listener.get(config_entry.unique_id)
+        diags["listener"] = dataclasses.asdict(record) if record else None
 
     return async_redact_data(
         diags, to_redact=("device_id", "DeviceID", "device_auth_string", "DeviceAuth")
@@ -4,13 +4,28 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
 from typing import Dict, List, Tuple
 
 import aiohttp
 import asyncclick as click
 
-from .discover import Discover, DiscoverMode, HDHomeRunDevice
+from .channel_scan import (
+    DEF_MAX_CONCURRENT_SCANS,
+    ChannelScanProgress,
+    ChannelScanResult,
+    async_channel_scan_many,
+)
+from .const import HDHOMERUN_TAG_DEVICE_ID, HDHOMERUN_TAG_TUNER_COUNT
+from .device import DeviceType
+from .discover import (
+    DEF_SWEEP_RATE,
+    Discover,
+    DiscoverMode,
+    HDHomeRunDevice,
+    MultiDiscover,
+)
 from .logger import Logger
 
 # endregion
@@ -65,48 +80,164 @@ async def channel_scan(ctx: click.Context, source: str, target: str):
                     show_eta=False,
                     show_percent=True,
                 ) as pbar:
-                    while True:
-                        progress: int | None = (
-                            await device.async_get_channel_scan_progress()
-                        )
-                        if progress is None:
+                    async for progress in device.watch_channel_scan():
+                        if not progress.scanning:
                             pbar.update(100 - prev_progress)
                             break
 
-                        if prev_progress != progress:
-                            pbar.update(progress - prev_progress)
-                            prev_progress = progress
-                        await asyncio.sleep(1)
+                        if progress.progress is not None:
+                            pbar.update(progress.progress - prev_progress)
+                            prev_progress = progress.progress
 
     _LOGGER.debug(log_formatter.format("exited"))
 
 
 @cli.command()
+@click.option(
+    "-t",
+    "--target",
+    "targets",
+    multiple=True,
+    required=True,
+    help="address of a device, optionally with the source, e.g. 192.168.1.2=Cable",
+)
+@click.option("--source", help="source to use for targets that don't specify one")
+@click.option("--max-concurrent", default=DEF_MAX_CONCURRENT_SCANS, show_default=True)
+@click.pass_context
+async def channel_scan_many(
+    ctx: click.Context, targets: Tuple[str, ...], source: str, max_concurrent: int
+):
+    """Carry out a channel scan on many devices at the same time."""
+    _LOGGER.debug(log_formatter.format("entered, args: %s"), locals())
+
+    async with ctx.obj as session:
+
+        async def _async_get_device(
+            target: str,
+        ) -> Tuple[HDHomeRunDevice | None, str]:
+            """Find the device and the source to scan."""
+            host, _, channel_source = target.partition("=")
+            devices: List[HDHomeRunDevice] = await Discover(
+                broadcast_address=host, session=session
+            ).async_discover()
+            if not devices:
+                _LOGGER.error(log_formatter.format("Unable to find %s"), host)
+                return None, ""
+
+            await devices[0].async_gather_details()
+            return devices[0], channel_source or source
+
+        scans: List[Tuple[HDHomeRunDevice, str]] = [
+            (device, channel_source)
+            for device, channel_source in await asyncio.gather(
+                *[_async_get_device(target) for target in targets]
+            )
+            if device is not None
+        ]
+        if not scans:
+            return
+
+        with click.progressbar(
+            label="Channel scanning progress",
+            length=100 * len(scans),
+            show_eta=False,
+            show_percent=True,
+        ) as pbar:
+
+            def _on_progress(progress: Dict[str, ChannelScanProgress | None]) -> None:
+                """Move the progress bar to the total across the devices."""
+                total: int = sum(
+                    100 if not p.scanning else p.progress or 0
+                    for p in progress.values()
+                    if p is not None
+                )
+                pbar.update(total - pbar.pos)
+
+            results: List[ChannelScanResult] = await async_channel_scan_many(
+                scans=scans, max_concurrent=max_concurrent, on_progress=_on_progress
+            )
+
+        for result in results:
+            _display_data(
+                _build_display_data(
+                    mappings=[
+                        ("channel_source", "Source"),
+                        ("channel_count", "Channels"),
+                        ("duration", "Duration (s)"),
+                        ("error", "Error"),
+                    ],
+                    obj=dataclasses.asdict(result),
+                    title=result.name,
+                )
+            )
+
+    _LOGGER.debug(log_formatter.format("exited"))
+
+
+@cli.command()
+@click.option(
+    "-a", "--all-networks", is_flag=True, help="discover on every local network"
+)
 @click.option("-b", "--broadcast-address", default="255.255.255.255")
 @click.option("-m", "--mode", default=DiscoverMode.AUTO.value)
+@click.option(
+    "-t",
+    "--device-type",
+    "device_types",
+    multiple=True,
+    default=[DeviceType.TUNER.name.lower()],
+    show_default=True,
+    type=click.Choice([device_type.name.lower() for device_type in DeviceType]),
+)
 @click.pass_context
 async def discover(
     ctx: click.Context,
+    all_networks: bool = False,
     broadcast_address: str | None = None,
     mode: DiscoverMode = DiscoverMode.AUTO,
+    device_types: Tuple[str, ...] = (),
 ) -> None:
     """Attempt to discover devices."""
     _LOGGER.debug(log_formatter.format("entered, args: %s"), locals())
 
     async with ctx.obj as session:
-        devices: List[HDHomeRunDevice] = await Discover(
-            broadcast_address=broadcast_address, mode=mode, session=session
-        ).async_discover()
+        devices: List[HDHomeRunDevice]
+        if all_networks:
+            multi_discover: MultiDiscover = MultiDiscover(mode=mode, session=session)
+            devices = await multi_discover.async_discover()
+            for stats in multi_discover.stats:
+                _display_data(
+                    _build_display_data(
+                        mappings=[
+                            ("duration", "Duration (s)"),
+                            ("replies", "Replies"),
+                            ("error", "Error"),
+                        ],
+                        obj=dataclasses.asdict(stats),
+                        title=stats.target.name or stats.target.broadcast_address,
+                    )
+                )
+        else:
+            devices = await Discover(
+                broadcast_address=broadcast_address,
+                device_types=[
+                    DeviceType[device_type.upper()] for device_type in device_types
+                ],
+                mode=mode,
+                session=session,
+            ).async_discover()
 
         dev: HDHomeRunDevice
         for dev in devices:
-            await dev.async_gather_details()
-            await dev.async_refresh_tuner_status()
+            if DeviceType.TUNER in dev.device_types or not dev.device_types:
+                await dev.async_gather_details()
+                await dev.async_refresh_tuner_status()
             _display_data(
                 _build_display_data(
                     mappings=[
                         ("device_id", "Device ID"),
                         ("device_type", "Device Type"),
+                        ("storage_id", "Storage ID"),
                         ("discovery_method", "Discovery Method"),
                         ("device_auth_string", "Device Auth"),
                         ("base_url", "Base URL"),
@@ -138,6 +269,51 @@ async def discover(
     _LOGGER.debug(log_formatter.format("exited"))
 
 
+@cli.command()
+@click.argument("cidrs", nargs=-1, required=True)
+@click.option("-m", "--mode", default=DiscoverMode.AUTO.value)
+@click.option("-r", "--rate", default=DEF_SWEEP_RATE, show_default=True)
+@click.pass_context
+async def scan_subnet(
+    ctx: click.Context,
+    cidrs: Tuple[str, ...],
+    mode: DiscoverMode = DiscoverMode.AUTO,
+    rate: int = DEF_SWEEP_RATE,
+) -> None:
+    """Discover devices by sending to every host in the given ranges."""
+    _LOGGER.debug(log_formatter.format("entered, args: %s"), locals())
+
+    async with ctx.obj as session:
+        devices: List[HDHomeRunDevice] = await Discover(
+            mode=mode, session=session, sweep=list(cidrs), sweep_rate=rate
+        ).async_discover()
+
+        dev: HDHomeRunDevice
+        for dev in devices:
+            _display_data(
+                _build_display_data(
+                    mappings=[
+                        ("ip", "IP"),
+                        ("discovery_method", "Discovery Method"),
+                        (
+                            "device_id",
+                            "Device ID",
+                            dev.get_from_datagram(tag=HDHOMERUN_TAG_DEVICE_ID),
+                        ),
+                        (
+                            "tuner_count",
+                            "# Tuners",
+                            dev.get_from_datagram(tag=HDHOMERUN_TAG_TUNER_COUNT),
+                        ),
+                    ],
+                    obj=dev,
+                    title=dev.ip,
+                )
+            )
+
+    _LOGGER.debug(log_formatter.format("exited"))
+
+
 @cli.command()
 @click.option("--target", required=True)
 @click.option("--variable", required=True)
@@ -155,12 +331,17 @@ async def get_variable(target: str, variable: str) -> None:
 
 @cli.command()
 @click.option("--target", required=True)
-async def restart(target: str) -> None:
+@click.option(
+    "--wait", is_flag=True, help="wait for the device to come back and show the downtime"
+)
+async def restart(target: str, wait: bool) -> None:
     """Issue a restart command to the device."""
     _LOGGER.debug(log_formatter.format("entered, args: %s"), locals())
 
     device: HDHomeRunDevice = HDHomeRunDevice(host=target)
-    await device.async_restart()
+    downtime: float | None = await device.async_restart(wait=wait)
+    if downtime is not None:
+        click.echo(f"Device was away for {downtime:.3f}s")
 
     _LOGGER.debug(log_formatter.format("exited"))
 
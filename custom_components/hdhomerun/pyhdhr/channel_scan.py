@@ -0,0 +1,299 @@
+"""Channel scan progress."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+)
+
+from .logger import Logger
+
+if TYPE_CHECKING:
+    from .device import HDHomeRunDevice
+
+# endregion
+
+_LOGGER = logging.getLogger(__name__)
+
+DEF_MAX_CONCURRENT_SCANS: int = 2
+DEF_POLL_INTERVAL_FAST_SECS: float = 1
+DEF_POLL_INTERVAL_SLOW_SECS: float = 5
+DEF_POLL_MAX_FAILURES: int = 3
+# progress, in percent, either side of which the fast interval is used
+DEF_POLL_FAST_MARGIN: int = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class ChannelScanProgress:
+    """Progress of a channel scan."""
+
+    scanning: bool
+    found: int | None = None
+    found_channels: Tuple[str, ...] = ()
+    new_channels: Tuple[Dict[str, Any], ...] = ()
+    progress: int | None = None
+
+    @classmethod
+    def from_lineup_status(
+        cls,
+        lineup_status: Dict[str, Any],
+        found_channels: Tuple[str, ...] = (),
+        new_channels: Tuple[Dict[str, Any], ...] = (),
+    ) -> ChannelScanProgress:
+        """Build the progress from the response of lineup_status.json."""
+        return cls(
+            scanning=bool(lineup_status.get("ScanInProgress")),
+            found=lineup_status.get("Found"),
+            found_channels=found_channels,
+            new_channels=new_channels,
+            progress=lineup_status.get("Progress"),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class ChannelScanResult:
+    """Outcome of a channel scan on a single device."""
+
+    name: str
+    channel_source: str
+    channel_count: int | None = None
+    duration: float | None = None
+    error: str | None = None
+
+
+class ChannelScanWatcher:
+    """Poll the progress of a channel scan on behalf of many subscribers.
+
+    A single poll feeds every subscriber. The poll is started by the first
+    subscriber and stops when the scan finishes or there are no more
+    subscribers. Only changes in progress are passed on.
+
+    If given a way to fetch the channels found so far, they are fetched
+    whenever the number found goes up and once more when the scan finishes.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[Dict[str, Any] | None]],
+        fetch_found: Callable[[], Awaitable[List[Dict[str, Any]] | None]]
+        | None = None,
+        name: str = "",
+    ) -> None:
+        """Initialise.
+
+        :param fetch: coroutine function returning the current lineup status
+        :param fetch_found: coroutine function returning the channels found so far
+        :param name: name used when logging
+        """
+        self._fetch: Callable[[], Awaitable[Dict[str, Any] | None]] = fetch
+        self._fetch_found: Callable[
+            [], Awaitable[List[Dict[str, Any]] | None]
+        ] | None = fetch_found
+        self._found_channels: Dict[str, str] = {}
+        self._last: ChannelScanProgress | None = None
+        self._log_formatter: Logger = Logger(unique_id=name)
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _get_interval(progress: ChannelScanProgress | None) -> float:
+        """Get how long to wait before the next poll.
+
+        The start and end of a scan are polled quickly so that they are
+        reported promptly, the middle of a scan moves slowly.
+        """
+        if (
+            progress is None
+            or progress.progress is None
+            or progress.progress < DEF_POLL_FAST_MARGIN
+            or progress.progress > 100 - DEF_POLL_FAST_MARGIN
+        ):
+            return DEF_POLL_INTERVAL_FAST_SECS
+
+        return DEF_POLL_INTERVAL_SLOW_SECS
+
+    async def _async_get_new_channels(
+        self, found: int | None, scanning: bool
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Get the channels that have been found since the last fetch."""
+        if self._fetch_found is None:
+            return ()
+
+        if scanning and (found is None or found <= len(self._found_channels)):
+            return ()
+
+        channels: List[Dict[str, Any]] | None = await self._fetch_found()
+        ret: List[Dict[str, Any]] = []
+        for channel in channels or []:
+            guide_number: str | None = channel.get("GuideNumber")
+            if guide_number is None or guide_number in self._found_channels:
+                continue
+            self._found_channels[guide_number] = channel.get("GuideName", "")
+            ret.append(channel)
+
+        if ret:
+            _LOGGER.debug(self._log_formatter.format("found %d new channels"), len(ret))
+
+        return tuple(ret)
+
+    def _publish(self, progress: ChannelScanProgress) -> None:
+        """Pass the progress to the subscribers if it changed."""
+        if progress == self._last:
+            return
+
+        self._last = progress
+        for queue in self._subscribers:
+            queue.put_nowait(progress)
+
+    async def _async_poll(self) -> None:
+        """Poll until the scan is no longer running."""
+        _LOGGER.debug(self._log_formatter.format("entered"))
+        failures: int = 0
+        while True:
+            lineup_status: Dict[str, Any] | None = await self._fetch()
+            if lineup_status is None:
+                failures += 1
+                if failures >= DEF_POLL_MAX_FAILURES:
+                    _LOGGER.debug(
+                        self._log_formatter.format("unable to get progress, stopping")
+                    )
+                    self._publish(ChannelScanProgress(scanning=False))
+                    break
+            else:
+                failures = 0
+                scanning: bool = bool(lineup_status.get("ScanInProgress"))
+                new_channels: Tuple[
+                    Dict[str, Any], ...
+                ] = await self._async_get_new_channels(
+                    found=lineup_status.get("Found"), scanning=scanning
+                )
+                progress = ChannelScanProgress.from_lineup_status(
+                    lineup_status=lineup_status,
+                    found_channels=tuple(self._found_channels.values()),
+                    new_channels=new_channels,
+                )
+                self._publish(progress)
+                if not progress.scanning:
+                    break
+
+            await asyncio.sleep(self._get_interval(self._last))
+
+        self._found_channels = {}
+        self._last = None
+        self._task = None
+        _LOGGER.debug(self._log_formatter.format("exited"))
+
+    async def watch(self) -> AsyncIterator[ChannelScanProgress]:
+        """Get the progress of the scan as it changes.
+
+        The iterator ends once the scan is no longer running.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        if self._last is not None:
+            queue.put_nowait(self._last)
+        self._subscribers.add(queue)
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._async_poll())
+
+        try:
+            while True:
+                progress: ChannelScanProgress = await queue.get()
+                yield progress
+                if not progress.scanning:
+                    break
+        finally:
+            self._subscribers.discard(queue)
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                self._task = None
+                self._found_channels = {}
+                self._last = None
+
+    @property
+    def watching(self) -> bool:
+        """Get whether the scan is being polled."""
+        return self._task is not None
+
+
+def _get_device_name(device: HDHomeRunDevice) -> str:
+    """Get the name to report a device against."""
+    return device.device_id or device.ip
+
+
+async def async_channel_scan_many(
+    scans: Iterable[Tuple[HDHomeRunDevice, str]],
+    max_concurrent: int = DEF_MAX_CONCURRENT_SCANS,
+    on_progress: Callable[[Dict[str, ChannelScanProgress | None]], None]
+    | None = None,
+) -> List[ChannelScanResult]:
+    """Scan for channels on many devices at the same time.
+
+    The number of scans running at once is limited so that devices sharing
+    an antenna or network don't slow each other down.
+
+    :param scans: the devices to scan and the channel source to use for each
+    :param max_concurrent: maximum number of scans running at the same time
+    :param on_progress: called with the progress of every device whenever one changes
+    :return: the outcome of the scan for each device
+    """
+    scans = list(scans)
+    progress: Dict[str, ChannelScanProgress | None] = {
+        _get_device_name(device): None for device, _ in scans
+    }
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _async_scan(
+        device: HDHomeRunDevice, channel_source: str
+    ) -> ChannelScanResult:
+        """Scan a single device and wait for it to finish."""
+        name: str = _get_device_name(device)
+        last: ChannelScanProgress | None = None
+        async with semaphore:
+            started: float = time.perf_counter()
+            try:
+                await device.async_channel_scan_start(channel_source=channel_source)
+                async for last in device.watch_channel_scan():
+                    progress[name] = last
+                    if on_progress is not None:
+                        on_progress(dict(progress))
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug(Logger(unique_id=name).format("scan failed: %s"), err)
+                return ChannelScanResult(
+                    name=name,
+                    channel_source=channel_source,
+                    duration=time.perf_counter() - started,
+                    error=str(err),
+                )
+
+        channel_count: int | None = None
+        if last is not None:
+            channel_count = len(last.found_channels) or last.found
+        return ChannelScanResult(
+            name=name,
+            channel_source=channel_source,
+            channel_count=channel_count,
+            duration=time.perf_counter() - started,
+        )
+
+    return list(
+        await asyncio.gather(
+            *[
+                _async_scan(device=device, channel_source=channel_source)
+                for device, channel_source in scans
+            ]
+        )
+    )
@@ -7,6 +7,7 @@ from enum import Enum, unique
 
 HDHOMERUN_CONTROL_TCP_PORT: int = 65001
 HDHOMERUN_DISCOVER_UDP_PORT: int = 65001
+HDHOMERUN_DISCOVER_UDP_MULTICAST_IPV6: str = "ff02::176"
 
 HDHOMERUN_MAX_PACKET_SIZE: int = 1460
 HDHOMERUN_MAX_PAYLOAD_SIZE: int = 1452
@@ -26,6 +27,9 @@ HDHOMERUN_TAG_ERROR_MESSAGE: int = 0x05
 HDHOMERUN_TAG_GETSET_NAME: int = 0x03
 HDHOMERUN_TAG_GETSET_VALUE: int = 0x04
 HDHOMERUN_TAG_LINEUP_URL: int = 0x27
+HDHOMERUN_TAG_MULTI_TYPE: int = 0x2D
+HDHOMERUN_TAG_STORAGE_ID: int = 0x2C
+HDHOMERUN_TAG_STORAGE_URL: int = 0x28
 HDHOMERUN_TAG_TUNER_COUNT: int = 0x10
 
 HDHOMERUN_DEVICE_ID_WILDCARD: int = 0xFFFFFFFF
@@ -0,0 +1,89 @@
+"""JSON decoding."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# endregion
+
+DEF_EXECUTOR_THRESHOLD_BYTES: int = 64 * 1024
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def default_decoder() -> JSONDecoder:
+    """Get the fastest JSON decoder available."""
+    if orjson is not None:
+        return orjson.loads
+
+    return json.loads
+
+
+def decoder_name(decoder: JSONDecoder) -> str:
+    """Get a friendly name for the decoder.
+
+    Decoders that aren't functions, e.g. partials or callable instances,
+    are named after their type.
+    """
+    module: str = getattr(decoder, "__module__", None) or "unknown"
+    return f"{module}.{getattr(decoder, '__name__', type(decoder).__name__)}"
+
+
+class JSONDecoderRunner:
+    """Decode JSON payloads, moving large ones off the event loop."""
+
+    def __init__(
+        self,
+        decoder: JSONDecoder | None = None,
+        executor_threshold: int = DEF_EXECUTOR_THRESHOLD_BYTES,
+    ) -> None:
+        """Initialise."""
+        self._decoder: JSONDecoder = decoder or default_decoder()
+        self._executor_threshold: int = executor_threshold
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    async def async_decode(self, payload: bytes, key: str = "") -> Any:
+        """Decode the payload.
+
+        Payloads at or above the threshold are decoded in the default
+        executor.
+
+        :param payload: the raw JSON
+        :param key: name to record the timings against
+        :return: the decoded payload
+        """
+        in_executor: bool = len(payload) >= self._executor_threshold
+        start: float = time.perf_counter()
+        if in_executor:
+            ret = await asyncio.get_running_loop().run_in_executor(
+                None, self._decoder, payload
+            )
+        else:
+            ret = self._decoder(payload)
+
+        if key:
+            self._stats[key] = {
+                "bytes": len(payload),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "executor": in_executor,
+            }
+
+        return ret
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get the decoder in use and the timings of the last decodes."""
+        return {
+            "decoder": decoder_name(self._decoder),
+            "executor_threshold": self._executor_threshold,
+            "timings": self._stats,
+        }
@@ -4,33 +4,68 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-import struct
+import socket
 from enum import Enum, unique
-from typing import Any, Dict, List
-from urllib.parse import urlparse
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from urllib.parse import urlencode, urlparse
 
 import aiohttp
 
+from .channel_scan import ChannelScanProgress, ChannelScanWatcher
 from .const import (
-    HDHOMERUN_TAG_BASE_URL,
-    HDHOMERUN_TAG_DEVICE_AUTH_STR,
-    HDHOMERUN_TAG_DEVICE_ID,
-    HDHOMERUN_TAG_DEVICE_TYPE,
     HDHOMERUN_TAG_GETSET_NAME,
     HDHOMERUN_TAG_GETSET_VALUE,
-    HDHOMERUN_TAG_LINEUP_URL,
-    HDHOMERUN_TAG_TUNER_COUNT,
     DiscoverMode,
 )
+from .decoder import DEF_EXECUTOR_THRESHOLD_BYTES, JSONDecoder, JSONDecoderRunner
 from .decorators import needs_http
+from .endpoint import DiscoveryEndpoint
+from .exceptions import HDHomeRunDeviceNotFoundError
+from .lineup import Lineup, LineupDiff, LineupSummary
 from .logger import Logger
 from .protocol import HDHomeRunProtocol
+from .record import TAG_DECODERS, DiscoveryRecord
 
 # endregion
 
 _LOGGER = logging.getLogger(__name__)
 
+DEF_DISCOVERY_MAX_AGE_SECS: float = 300
+DEF_DISCOVERY_TIMEOUT_SECS: float = 1
+DEF_RESTART_PING_MAX_SECS: float = 2
+DEF_RESTART_PING_MIN_SECS: float = 0.25
+DEF_RESTART_PING_TIMEOUT_SECS: float = 1.5
+DEF_RESTART_GONE_TIMEOUT_SECS: float = 15
+DEF_RESTART_TIMEOUT_SECS: float = 120
+
+_SNAPSHOT_ATTRIBUTES: Tuple[str, ...] = (
+    "_base_url",
+    "_control_host",
+    "_device_auth_str",
+    "_device_id",
+    "_device_type",
+    "_lineup_url",
+    "_storage_id",
+    "_storage_url",
+    "_sys_hwmodel",
+    "_sys_model",
+    "_sys_version",
+    "_tuner_count",
+    "_tuner_status",
+)
+
+
+def format_url_host(host: str) -> str:
+    """Format an address for use in a URL, bracketing IPv6 addresses."""
+    if ":" not in host:
+        return host
+
+    address, _, scope = host.partition("%")
+    return f"[{address}%25{scope}]" if scope else f"[{address}]"
+
+
 # TODO: Python 3.11 includes StrEnum by default.
 # switch to using that at some point in the future.
 class DevicePaths(str, Enum):
@@ -54,21 +89,46 @@ class DeviceType(Enum):
 class HDHomeRunDevice:
     """Representation of a device."""
 
-    def __init__(self, host: str) -> None:
-        """Initialise."""
+    def __init__(
+        self,
+        host: str,
+        json_decoder: JSONDecoder | None = None,
+        json_executor_threshold: int = DEF_EXECUTOR_THRESHOLD_BYTES,
+    ) -> None:
+        """Initialise.
+
+        :param host: the address of the device
+        :param json_decoder: callable to decode JSON (defaults to orjson if available)
+        :param json_executor_threshold: size in bytes from which JSON is decoded in an executor
+        """
+        self._details_changed: bool = True
         self._discovery_method: DiscoverMode | None = None
         self._host: str = host
+        self._http_validators: Dict[str, Dict[str, str]] = {}
+        self._json_decoder: JSONDecoderRunner = JSONDecoderRunner(
+            decoder=json_decoder, executor_threshold=json_executor_threshold
+        )
         self._log_formatter: Logger = Logger(unique_id=self._host)
+        self._discovery_record: DiscoveryRecord | None = None
         self._processed_datagram: Dict[str, Any]
         self._raw_details: Dict[str, Any] = {}
         self._session: aiohttp.ClientSession | None = None
 
         self._base_url: str | None = None
+        self._channel_scan_watcher: ChannelScanWatcher | None = None
         self._channel_sources: List[str] | None = None
+        self._control_host: str | None = None
         self._device_auth_str: str | None = None
         self._device_id: str | None = None
-        self._device_type: str | None = None
+        self._device_type: int | None = None
+        self._device_types: Tuple[int, ...] = ()
+        self._lineup: Lineup = Lineup()
+        self._lineup_diff: LineupDiff | None = None
+        self._lineup_fetched: bool = False
+        self._lineup_summary: LineupSummary = LineupSummary()
         self._lineup_url: str | None = None
+        self._storage_id: str | None = None
+        self._storage_url: str | None = None
         self._sys_hwmodel: str | None = None
         self._sys_model: str | None = None
         self._sys_version: str | None = None
@@ -79,28 +139,126 @@ class HDHomeRunDevice:
         """Friendly representation of the device."""
         return f"{self.__class__.__name__} {self._host}"
 
+    @classmethod
+    def from_discovery_record(
+        cls, record: DiscoveryRecord, control_host: str | None = None
+    ) -> HDHomeRunDevice:
+        """Create a device from a UDP discovery reply.
+
+        :param record: the decoded discovery reply
+        :param control_host: address to use for the control protocol if not
+            the address the reply came from
+        """
+        ret: HDHomeRunDevice = cls(host=record.ip)
+        if control_host != record.ip:
+            ret._control_host = control_host
+        ret._discovery_method = DiscoverMode.UDP
+        ret._discovery_record = record
+        ret._processed_datagram = record.datagram
+        ret._apply_discovery_record(record=record)
+
+        return ret
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: Dict[str, Any],
+        session: aiohttp.ClientSession | None = None,
+    ) -> HDHomeRunDevice:
+        """Create a device from a snapshot created by `to_snapshot`.
+
+        :param snapshot: the snapshot to restore from
+        :param session: session to use for HTTP requests, a device using UDP
+            still uses it to get the lineup
+        :return: the restored device
+        """
+        ret: HDHomeRunDevice = cls(host=snapshot["host"])
+        if (discovery_method := snapshot.get("discovery_method")) is not None:
+            ret._discovery_method = DiscoverMode[discovery_method]
+        ret._session = session
+
+        if (datagram := snapshot.get("processed_datagram")) is not None:
+            ret._processed_datagram = {
+                "header": datagram.get("header"),
+                "length": datagram.get("length"),
+                "data": {
+                    (tag if tag == "raw" else int(tag)): bytes.fromhex(value)
+                    for tag, value in datagram.get("data", {}).items()
+                },
+            }
+
+        ret._raw_details = dict(snapshot.get("raw_details", {}))
+        if (channels := snapshot.get("lineup")) is not None:
+            ret._lineup = Lineup(channels)
+            ret._lineup_fetched = True
+            ret._lineup_summary = LineupSummary.from_lineup(ret._lineup)
+        for attribute in _SNAPSHOT_ATTRIBUTES:
+            setattr(ret, attribute, snapshot.get(attribute.lstrip("_")))
+
+        return ret
+
     def get_from_datagram(
         self, tag: int, device_details: HDHomeRunDevice | None = None
     ) -> str | None:
         """Grab the data from the processed datagram."""
-        ret: str | None = None
         device = device_details or self
-        value = getattr(device, "_processed_datagram", {}).get("data", {}).get(tag, b"")
-        if tag == HDHOMERUN_TAG_BASE_URL:
-            ret = value.decode()
-        elif tag == HDHOMERUN_TAG_DEVICE_AUTH_STR:
-            ret = value.decode()
-        elif tag == HDHOMERUN_TAG_DEVICE_ID:
-            (property_value,) = struct.unpack(">L", value)
-            ret = f"{property_value:04X}"
-        elif tag == HDHOMERUN_TAG_DEVICE_TYPE:
-            (ret,) = struct.unpack(">L", value)
-        elif tag == HDHOMERUN_TAG_LINEUP_URL:
-            ret = value.decode()
-        elif tag == HDHOMERUN_TAG_TUNER_COUNT:
-            (ret,) = struct.unpack(">B", value)
+        if (record := device.discovery_record) is None:
+            return None
 
-        return ret
+        return record.get(tag)
+
+    def _apply_discovery_record(self, record: DiscoveryRecord) -> None:
+        """Take the details from the tags present in a discovery reply."""
+        for tag in record.datagram.get("data", {}):
+            if (decoder := TAG_DECODERS.get(tag)) is not None:
+                setattr(self, f"_{decoder[0]}", record.get(tag))
+
+    async def _async_get_json_if_changed(
+        self, url: str, params: Dict[str, str] | None = None, **kwargs
+    ) -> Tuple[aiohttp.ClientResponse, bool, Any]:
+        """Request JSON from the device only decoding it if it has changed.
+
+        The validators (ETag, Last-Modified) from the previous response for
+        the URL are sent as conditional headers. If the firmware doesn't
+        provide them a hash of the content is used to detect a change.
+
+        :param url: the URL to request
+        :param params: query parameters for the request
+        :return: the response, whether the content changed and the decoded content
+        """
+        cache_key: str = f"{url}?{urlencode(params)}" if params else url
+        validators: Dict[str, str] = self._http_validators.get(cache_key, {})
+        headers: Dict[str, str] = {}
+        if (etag := validators.get("ETag")) is not None:
+            headers["If-None-Match"] = etag
+        if (last_modified := validators.get("Last-Modified")) is not None:
+            headers["If-Modified-Since"] = last_modified
+
+        resp: aiohttp.ClientResponse = await self._session.get(
+            url=url, params=params, headers=headers, **kwargs
+        )
+        if resp.status == 304:
+            _LOGGER.debug(self._log_formatter.format("%s not modified"), cache_key)
+            return resp, False, None
+
+        if not resp.ok:
+            return resp, False, None
+
+        body: bytes = await resp.read()
+        new_validators: Dict[str, str] = {
+            header: resp.headers[header]
+            for header in ("ETag", "Last-Modified")
+            if header in resp.headers
+        }
+        new_validators["hash"] = hashlib.sha1(body).hexdigest()
+        self._http_validators[cache_key] = new_validators
+        if validators.get("hash") == new_validators["hash"]:
+            _LOGGER.debug(self._log_formatter.format("%s unchanged"), cache_key)
+            return resp, False, None
+
+        return resp, True, await self._json_decoder.async_decode(
+            payload=body, key=resp.url.name
+        )
 
     @needs_http
     async def _async_gather_details_http(self) -> None:
@@ -109,11 +267,13 @@ class HDHomeRunDevice:
         _LOGGER.debug(self._log_formatter.format("entered"))
 
         try:
-            url: str = f"http://{self.ip}/{DevicePaths.DISCOVER.value}"
+            url: str = (
+                f"http://{format_url_host(self.ip)}/{DevicePaths.DISCOVER.value}"
+            )
             _LOGGER.debug(
                 self._log_formatter.format("attempting gather details from: %s"), url
             )
-            resp = await self._session.get(
+            resp, changed, resp_json = await self._async_get_json_if_changed(
                 url=url,
                 raise_for_status=True,
             )
@@ -123,28 +283,33 @@ class HDHomeRunDevice:
             )
         else:
             key: str = resp.url.name.split(".")[0]
-            self._raw_details[key] = await resp.json()
-            _LOGGER.debug(
-                self._log_formatter.format("results for %s: %s"),
-                key,
-                self._raw_details[key],
-            )
+            if changed:
+                self._details_changed = True
+                self._raw_details[key] = resp_json
+                _LOGGER.debug(
+                    self._log_formatter.format("results for %s: %s"),
+                    key,
+                    self._raw_details[key],
+                )
         # endregion
 
-        requests: List[aiohttp.ClientRequest] = [
-            self._session.get(
+        requests = [
+            self._async_get_json_if_changed(
                 url=self.lineup_url,
                 params={
                     "show": "found",
+                    "tuning": "",
                 },
             ),
-            self._session.get(
+            self._async_get_json_if_changed(
                 url=f"{self.base_url}/{DevicePaths.LINEUP_STATUS.value}",
             ),
         ]
 
-        responses: List[aiohttp.ClientResponse] = await asyncio.gather(*requests)
-        for resp in responses:
+        responses: List[
+            Tuple[aiohttp.ClientResponse, bool, Any]
+        ] = await asyncio.gather(*requests)
+        for resp, changed, resp_json in responses:
             key: str = resp.url.name.split(".")[0]
             if not resp.ok:
                 _LOGGER.debug(
@@ -155,41 +320,124 @@ class HDHomeRunDevice:
                 )
                 continue
 
-            self._raw_details[key] = await resp.json()
+            if not changed:
+                continue
+
+            self._details_changed = True
             _LOGGER.debug(
                 self._log_formatter.format("results for %s: %s"),
                 key,
-                self._raw_details[key],
+                resp_json,
+            )
+            if key == "lineup":
+                self._set_lineup(channels=resp_json)
+            else:
+                self._raw_details[key] = resp_json
+
+    def _set_lineup(self, channels: List[Dict[str, Any]]) -> None:
+        """Replace the lineup, working out what changed since the last one."""
+        previous_lineup: Lineup = self._lineup
+        self._lineup = Lineup(channels)
+        self._lineup_summary = LineupSummary.from_lineup(self._lineup)
+        if self._lineup_fetched:
+            self._lineup_diff = LineupDiff.from_lineups(
+                previous=previous_lineup, current=self._lineup
             )
+        self._lineup_fetched = True
+
+    async def _async_get_lineup_udp(self) -> None:
+        """Get the lineup for a UDP discovered device.
+
+        The lineup is used to resolve the tuned channels so a failure here
+        only means falling back to querying the tuners for them.
+        """
+        if self._session is None or not self.lineup_url:
+            return
+
+        try:
+            resp, changed, resp_json = await self._async_get_json_if_changed(
+                url=self.lineup_url,
+                params={
+                    "show": "found",
+                    "tuning": "",
+                },
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug(self._log_formatter.format("unable to get lineup: %s"), err)
+            return
+
+        if not resp.ok:
+            _LOGGER.debug(
+                self._log_formatter.format("lineup failed with error %d - %s"),
+                resp.status,
+                resp.reason,
+            )
+        elif changed:
+            self._set_lineup(channels=resp_json)
+
+    async def _async_get_discovery_record(self) -> DiscoveryRecord:
+        """Get the discovery reply, asking the device again if missing or stale.
+
+        :raises HDHomeRunDeviceNotFoundError: if the device doesn't reply
+        """
+        record: DiscoveryRecord | None = self.discovery_record
+        loop = asyncio.get_running_loop()
+        if (
+            record is not None
+            and record.received is not None
+            and loop.time() - record.received < DEF_DISCOVERY_MAX_AGE_SECS
+        ):
+            return record
+
+        _LOGGER.debug(self._log_formatter.format("asking the device for its details"))
+        if (record := await self._async_ping()) is None:
+            raise HDHomeRunDeviceNotFoundError(device=self.ip)
+
+        return record
+
+    async def _async_ping(
+        self, timeout: float = DEF_DISCOVERY_TIMEOUT_SECS, share: bool = True
+    ) -> DiscoveryRecord | None:
+        """Send a discovery request directly to the device.
+
+        The wait ends as soon as the device replies. The reply is kept as
+        the discovery reply of the device.
+
+        :param timeout: seconds to wait for the reply
+        :param share: whether a recent reply, or request, can be used
+        :return: the reply, None if the device didn't reply
+        """
+        endpoint: DiscoveryEndpoint = await DiscoveryEndpoint.async_acquire(
+            family=socket.AF_INET6 if ":" in self.control_host else socket.AF_INET
+        )
+        try:
+            replies: List[DiscoveryRecord] = await endpoint.async_request(
+                targets=[self.control_host],
+                timeout=timeout,
+                device_id=self.device_id,
+                max_replies=1,
+                share=share,
+            )
+        finally:
+            endpoint.release()
+
+        if not replies:
+            return None
+
+        self._discovery_record = replies[0]
+        self._processed_datagram = replies[0].datagram
+
+        return replies[0]
 
     async def _async_gather_details_udp(self) -> None:
         """Gather details via TCP/UDP for a UDP discovered device."""
-        from .discover import Discover  # pylint: disable=import-outside-toplevel
-
         # region #-- get the properties available from a discovery --#
-        updated_device: List[HDHomeRunDevice] | HDHomeRunDevice = await Discover(
-            broadcast_address=self.ip, mode=DiscoverMode.UDP, session=None
-        ).async_discover()
-        if updated_device:
-            updated_device = updated_device[0]
-            for tag in getattr(updated_device, "_processed_datagram", {}).get("data"):
-                value = self.get_from_datagram(device_details=updated_device, tag=tag)
-                if tag == HDHOMERUN_TAG_BASE_URL:
-                    self._base_url = value
-                elif tag == HDHOMERUN_TAG_DEVICE_AUTH_STR:
-                    self._device_auth_str = value
-                elif tag == HDHOMERUN_TAG_DEVICE_ID:
-                    self._device_id = value
-                elif tag == HDHOMERUN_TAG_DEVICE_TYPE:
-                    self._device_type = value
-                elif tag == HDHOMERUN_TAG_LINEUP_URL:
-                    self._lineup_url = value
-                elif tag == HDHOMERUN_TAG_TUNER_COUNT:
-                    self._tuner_count = value
+        self._apply_discovery_record(record=await self._async_get_discovery_record())
+        await self._async_get_lineup_udp()
         # endregion
 
         # region #-- get the details from the control protocol --#
-        protocol: HDHomeRunProtocol = HDHomeRunProtocol(host=self.ip)
+        protocol: HDHomeRunProtocol = HDHomeRunProtocol(host=self.control_host)
         supplemental_info = [
             protocol.async_get_version(),
             protocol.async_get_model(),
@@ -212,42 +460,66 @@ class HDHomeRunDevice:
     async def _async_get_channel_details_udp(
         self, tuner_index: int
     ) -> Dict[str, int | str]:
-        """Gather details about the currently tuned channel."""
-        protocol: HDHomeRunProtocol = HDHomeRunProtocol(host=self.ip)
+        """Gather details about the currently tuned channel.
+
+        The channel is resolved from the cached lineup where possible and
+        only falls back to querying the stream information if it can't be.
+        Without a lineup the tuned channel isn't asked for at all.
+        """
+        protocol: HDHomeRunProtocol = HDHomeRunProtocol(host=self.control_host)
         ret: Dict[str, int | str] = {}
 
-        channel_details = await protocol.async_get_tuner_current_channel(
-            tuner_idx=tuner_index
-        )
-        tuner_channel_id, channel_names, tuner_target = channel_details
-        tuner_channel_id = (
-            tuner_channel_id.get("data", {})[HDHOMERUN_TAG_GETSET_VALUE]
-            .decode()
-            .rstrip("\0")
-        )
-        channel_names = (
-            channel_names.get("data", {})[HDHOMERUN_TAG_GETSET_VALUE]
-            .decode()
-            .rstrip("\0")
-            .split("\n")
-        )
-        channel: str
-        channel_name: List[tuple[str, ...]] = [
-            tuple(channel.replace(f"{tuner_channel_id}: ", "").split(" ", maxsplit=1))
-            for channel in channel_names
-            if channel.startswith(f"{tuner_channel_id}: ")
+        queries = [
+            protocol.async_get_tuner_program(tuner_idx=tuner_index),
+            protocol.async_get_tuner_target(tuner_idx=tuner_index),
         ]
-        if channel_name:
-            vct_number, vct_name = channel_name[0]
-            ret["VctNumber"] = str(vct_number)
-            ret["VctName"] = str(vct_name)
-        target_url: str = (
-            tuner_target.get("data", {})[HDHOMERUN_TAG_GETSET_VALUE]
-            .decode()
-            .rstrip("\0")
-        )
-        if target_url != "none":
-            ret["TargetIP"] = urlparse(url=target_url).hostname
+        if self._lineup:
+            queries.append(protocol.async_get_tuner_channel(tuner_idx=tuner_index))
+        tuner_program, tuner_target, *tuner_channel = [
+            resp.get("data", {})[HDHOMERUN_TAG_GETSET_VALUE].decode().rstrip("\0")
+            for resp in await asyncio.gather(*queries)
+        ]
+
+        # region #-- resolve the channel from the lineup --#
+        channel: Dict[str, Any] | None = None
+        if tuner_channel:
+            frequency: str = tuner_channel[0].rsplit(":", maxsplit=1)[-1]
+            if frequency.isdigit() and tuner_program.isdigit():
+                channel = self._lineup.get_by_program(
+                    frequency=int(frequency), program=int(tuner_program)
+                )
+        # endregion
+
+        # region #-- fallback to the stream information --#
+        if channel is None:
+            _LOGGER.debug(
+                self._log_formatter.format(
+                    "program %s not in lineup, querying stream information"
+                ),
+                tuner_program,
+            )
+            streams: List[str] = (
+                (await protocol.async_get_tuner_streaminfo(tuner_idx=tuner_index))
+                .get("data", {})[HDHOMERUN_TAG_GETSET_VALUE]
+                .decode()
+                .rstrip("\0")
+                .split("\n")
+            )
+            channel_name: List[tuple[str, ...]] = [
+                tuple(stream.replace(f"{tuner_program}: ", "").split(" ", maxsplit=1))
+                for stream in streams
+                if stream.startswith(f"{tuner_program}: ")
+            ]
+            if channel_name:
+                channel = dict(zip(("GuideNumber", "GuideName"), channel_name[0]))
+        # endregion
+
+        if channel is not None:
+            ret["VctNumber"] = str(channel.get("GuideNumber"))
+            ret["VctName"] = str(channel.get("GuideName"))
+
+        if tuner_target != "none":
+            ret["TargetIP"] = urlparse(url=tuner_target).hostname
 
         return ret
 
@@ -259,13 +531,15 @@ class HDHomeRunDevice:
             url=f"{self.base_url}/{DevicePaths.TUNER_STATUS.value}",
             raise_for_status=True,
         )
-        self._tuner_status = await resp.json()
+        self._tuner_status = await self._json_decoder.async_decode(
+            payload=await resp.read(), key=resp.url.name
+        )
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def _async_get_tuner_status_udp(self) -> None:
         """Get the current details for the tuners using the control protocol."""
         _LOGGER.debug(self._log_formatter.format("entered"))
-        protocol: HDHomeRunProtocol = HDHomeRunProtocol(host=self.ip)
+        protocol: HDHomeRunProtocol = HDHomeRunProtocol(host=self.control_host)
 
         tuners = [
             protocol.async_get_tuner_status(tuner_idx=idx)
@@ -314,22 +588,33 @@ class HDHomeRunDevice:
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def async_gather_details(self) -> None:
-        """Gather the details for the device."""
+        """Gather the details for the device.
+
+        `details_changed` reflects whether anything was updated.
+        """
         _LOGGER.debug(self._log_formatter.format("entered"))
         if self._discovery_method is DiscoverMode.HTTP:
             _LOGGER.debug(self._log_formatter.format("gathering details using HTTP"))
+            self._details_changed = False
+            self._lineup_diff = None
             await self._async_gather_details_http()
 
         if self._discovery_method is DiscoverMode.UDP:
             _LOGGER.debug(self._log_formatter.format("gathering details using UDP"))
+            self._details_changed = True
+            self._lineup_diff = None
             await self._async_gather_details_udp()
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        _LOGGER.debug(
+            self._log_formatter.format("exited, details changed: %s"),
+            self._details_changed,
+        )
 
-    @needs_http
-    async def async_get_channel_scan_progress(self, timeout: float = 2.5) -> int | None:
-        """Return the current channel scan progress as of now."""
+    async def _async_get_lineup_status(
+        self, timeout: float = 2.5
+    ) -> Dict[str, Any] | None:
+        """Get the current lineup status from the device."""
         _LOGGER.debug(self._log_formatter.format("entered"))
-        ret: int | None = None
+        ret: Dict[str, Any] | None = None
         try:
             resp = await self._session.get(
                 url=f"{self.base_url}/{DevicePaths.LINEUP_STATUS.value}",
@@ -339,12 +624,40 @@ class HDHomeRunDevice:
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error(self._log_formatter.format("type: %s, %s"), type(err), err)
         else:
-            resp_json = await resp.json()
-            ret = resp_json.get("Progress", None)
+            ret = await self._json_decoder.async_decode(payload=await resp.read())
+            self._raw_details["lineup_status"] = ret
 
         _LOGGER.debug(self._log_formatter.format("exited"))
         return ret
 
+    async def _async_get_found_channels(
+        self, timeout: float = 2.5
+    ) -> List[Dict[str, Any]] | None:
+        """Get the channels found so far by a channel scan."""
+        try:
+            resp = await self._session.get(
+                url=self.lineup_url,
+                params={"show": "found"},
+                timeout=timeout,
+                raise_for_status=True,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug(self._log_formatter.format("type: %s, %s"), type(err), err)
+            return None
+
+        return await self._json_decoder.async_decode(payload=await resp.read())
+
+    @needs_http
+    async def async_get_channel_scan_progress(self, timeout: float = 2.5) -> int | None:
+        """Return the current channel scan progress as of now."""
+        lineup_status: Dict[str, Any] | None = await self._async_get_lineup_status(
+            timeout=timeout
+        )
+        if lineup_status is None:
+            return None
+
+        return lineup_status.get("Progress", None)
+
     async def async_get_protocol_variable(
         self, name: str, timeout: float = 2.5
     ) -> Dict[str, int | str]:
@@ -352,7 +665,7 @@ class HDHomeRunDevice:
         _LOGGER.debug(self._log_formatter.format("entered"))
 
         ret: Dict[str, int | str] = {}
-        proto: HDHomeRunProtocol = HDHomeRunProtocol(host=self.ip)
+        proto: HDHomeRunProtocol = HDHomeRunProtocol(host=self.control_host)
         if (get_variable_func := getattr(proto, "_get_set_req", None)) is not None:
             ret = await get_variable_func(tag=name, timeout=timeout)
 
@@ -384,12 +697,137 @@ class HDHomeRunDevice:
 
         _LOGGER.debug(self._log_formatter.format("exited"))
 
-    async def async_restart(self) -> None:
-        """Restart the device using the control protocol."""
+    async def _async_is_reachable(self, timeout: float) -> bool:
+        """Check if the device answers.
+
+        Devices discovered over HTTP are checked by requesting their
+        discovery details, as UDP may not reach them, others are pinged
+        with a discovery request.
+
+        :param timeout: seconds to wait for the device to answer
+        """
+        if self._discovery_method is not DiscoverMode.HTTP or self._session is None:
+            return await self._async_ping(timeout=timeout, share=False) is not None
+
+        try:
+            async with self._session.get(
+                url=f"http://{format_url_host(self.ip)}/{DevicePaths.DISCOVER.value}",
+                raise_for_status=True,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+        return True
+
+    async def _async_wait_for_restart(self, timeout: float) -> float:
+        """Wait for the device to go away and come back.
+
+        The device is checked on, backing off exponentially whilst it is
+        away. Whilst waiting for it to go each check is given long enough for
+        a busy device to answer, so that a slow reply isn't mistaken for the
+        device having gone.
+
+        :param timeout: seconds to wait for the device to come back
+        :return: seconds the device was away for
+        :raises HDHomeRunDeviceNotFoundError: if the device doesn't come back in time
+        """
+        loop = asyncio.get_running_loop()
+
+        # region #-- wait for the device to go away --#
+        went_away: float | None = None
+        gone_deadline: float = loop.time() + DEF_RESTART_GONE_TIMEOUT_SECS
+        while loop.time() < gone_deadline:
+            sent: float = loop.time()
+            if await self._async_is_reachable(timeout=DEF_RESTART_PING_TIMEOUT_SECS):
+                await asyncio.sleep(
+                    max(0, sent + DEF_RESTART_PING_MIN_SECS - loop.time())
+                )
+                continue
+            went_away = sent
+            break
+
+        if went_away is None:
+            _LOGGER.debug(self._log_formatter.format("device didn't go away"))
+            return 0
+        # endregion
+
+        # region #-- wait for the device to come back --#
+        _LOGGER.debug(self._log_formatter.format("waiting for the device to return"))
+        delay: float = DEF_RESTART_PING_MIN_SECS
+        deadline: float = went_away + timeout
+        while loop.time() < deadline:
+            sent = loop.time()
+            if await self._async_is_reachable(timeout=delay):
+                return loop.time() - went_away
+            # a refused connection fails straight away so wait out the delay
+            await asyncio.sleep(max(0, sent + delay - loop.time()))
+            delay = min(delay * 2, DEF_RESTART_PING_MAX_SECS)
+        # endregion
+
+        raise HDHomeRunDeviceNotFoundError(device=self.ip)
+
+    async def async_restart(
+        self, wait: bool = False, timeout: float = DEF_RESTART_TIMEOUT_SECS
+    ) -> float | None:
+        """Restart the device using the control protocol.
+
+        :param wait: wait for the device to go away and come back
+        :param timeout: seconds to wait for the device to come back
+        :return: seconds the device was away for if waiting, otherwise None
+        """
         _LOGGER.debug(self._log_formatter.format("entered"))
-        proto: HDHomeRunProtocol = HDHomeRunProtocol(host=self.ip)
+        proto: HDHomeRunProtocol = HDHomeRunProtocol(host=self.control_host)
         await proto.async_restart()
+
+        ret: float | None = None
+        if wait:
+            ret = await self._async_wait_for_restart(timeout=timeout)
+            _LOGGER.debug(
+                self._log_formatter.format("device was away for %.3fs"), ret
+            )
+
         _LOGGER.debug(self._log_formatter.format("exited"))
+        return ret
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Get a JSON serialisable snapshot of the known state of the device."""
+        ret: Dict[str, Any] = {
+            "host": self._host,
+            "discovery_method": getattr(self._discovery_method, "name", None),
+            "lineup": self._lineup.to_list() if self._lineup_fetched else None,
+            "raw_details": self._raw_details,
+        }
+        if (datagram := getattr(self, "_processed_datagram", None)) is not None:
+            ret["processed_datagram"] = {
+                "header": datagram.get("header"),
+                "length": datagram.get("length"),
+                "data": {
+                    str(tag): value.hex()
+                    for tag, value in datagram.get("data", {}).items()
+                },
+            }
+        for attribute in _SNAPSHOT_ATTRIBUTES:
+            ret[attribute.lstrip("_")] = getattr(self, attribute)
+
+        return ret
+
+    def set_host(self, host: str) -> None:
+        """Point the device at a new address.
+
+        Details that include the previous address are dropped so that they
+        are refreshed by the next gather of details.
+        """
+        _LOGGER.debug(self._log_formatter.format("changing host to %s"), host)
+        self._host = host
+        self._log_formatter = Logger(unique_id=self._host)
+        self._base_url = None
+        self._control_host = None
+        self._discovery_record = None
+        self._http_validators = {}
+        self._lineup_url = None
+        self._raw_details.pop("discover", None)
 
     @needs_http
     async def async_channel_scan_start(self, channel_source: str) -> None:
@@ -415,6 +853,24 @@ class HDHomeRunDevice:
 
         _LOGGER.debug(self._log_formatter.format("exited"))
 
+    @needs_http
+    def watch_channel_scan(self) -> AsyncIterator[ChannelScanProgress]:
+        """Get the progress of a channel scan as it changes.
+
+        All watchers of the device share the same poll of the device. The
+        channels found so far are fetched as the scan finds them and each
+        progress report carries those that are new. The iterator ends when
+        the scan is no longer running.
+        """
+        if self._channel_scan_watcher is None:
+            self._channel_scan_watcher = ChannelScanWatcher(
+                fetch=self._async_get_lineup_status,
+                fetch_found=self._async_get_found_channels,
+                name=self._host,
+            )
+
+        return self._channel_scan_watcher.watch()
+
     # region #-- properties --#
     @property
     def base_url(self) -> str | None:
@@ -444,7 +900,17 @@ class HDHomeRunDevice:
     @property
     def channels(self) -> List[Dict[str, str]]:
         """Get a list of channels as per the HTTP API."""
-        return self._raw_details.get("lineup", [])
+        return self._lineup.to_list()
+
+    @property
+    def details_changed(self) -> bool:
+        """Get whether the last gather of details found any changes."""
+        return self._details_changed
+
+    @property
+    def control_host(self) -> str | None:
+        """Get the address used for the control protocol."""
+        return self._control_host or self._host
 
     @property
     def device_auth_string(self) -> str | None:
@@ -458,10 +924,44 @@ class HDHomeRunDevice:
         """Get the device ID."""
         return self._raw_details.get("discover", {}).get("DeviceID", self._device_id)
 
+    @property
+    def discovery_record(self) -> DiscoveryRecord | None:
+        """Get the decoded discovery reply, None if not discovered over UDP."""
+        datagram: Dict[str, Any] | None = getattr(self, "_processed_datagram", None)
+        if datagram is None:
+            return None
+
+        record: DiscoveryRecord | None = self._discovery_record
+        if record is None or record.datagram is not datagram:
+            try:
+                self._discovery_record = DiscoveryRecord(
+                    ip=self._host, datagram=datagram
+                )
+            except ValueError as err:
+                _LOGGER.debug(self._log_formatter.format("invalid datagram: %s"), err)
+                return None
+
+        return self._discovery_record
+
     @property
     def device_type(self) -> DeviceType | None:
         """Get the device type as defined in the UDP protocol."""
-        return self._device_type
+        try:
+            return DeviceType(self._device_type)
+        except ValueError:
+            return None
+
+    @property
+    def device_types(self) -> Tuple[DeviceType, ...]:
+        """Get all the functions of the device, e.g. a tuner and storage engine."""
+        ret: List[DeviceType] = []
+        for device_type in self._device_types or (self._device_type,):
+            try:
+                ret.append(DeviceType(device_type))
+            except ValueError:
+                continue
+
+        return tuple(ret)
 
     @property
     def discovery_method(self):
@@ -492,11 +992,34 @@ class HDHomeRunDevice:
         """Get the IP address."""
         return self._host
 
+    @property
+    def json_decoder_stats(self) -> Dict[str, Any]:
+        """Get the JSON decoder in use and how long decoding took."""
+        return self._json_decoder.stats
+
     @property
     def latest_version(self) -> str | None:
         """Get the latest available version (HTTP API)."""
         return self._raw_details.get("discover", {}).get("UpgradeAvailable", None)
 
+    @property
+    def lineup(self) -> Lineup:
+        """Get the indexed channel lineup."""
+        return self._lineup
+
+    @property
+    def lineup_diff(self) -> LineupDiff | None:
+        """Get the changes to the lineup found by the last gather of details.
+
+        N.B. None if the lineup didn't change or this was the first fetch
+        """
+        return self._lineup_diff
+
+    @property
+    def lineup_summary(self) -> LineupSummary:
+        """Get the aggregated view of the channel lineup."""
+        return self._lineup_summary
+
     @property
     def lineup_url(self) -> str | None:
         """Get the URL for the channel lineup."""
@@ -514,6 +1037,18 @@ class HDHomeRunDevice:
             "FirmwareName", self._sys_model
         )
 
+    @property
+    def storage_id(self) -> str | None:
+        """Get the ID of the storage engine."""
+        return self._raw_details.get("discover", {}).get("StorageID", self._storage_id)
+
+    @property
+    def storage_url(self) -> str | None:
+        """Get the URL for the recordings held by the storage engine."""
+        return self._raw_details.get("discover", {}).get(
+            "StorageURL", self._storage_url
+        )
+
     @property
     def tuner_count(self) -> int | None:
         """Get the number of tuners."""
@@ -4,33 +4,39 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import ipaddress
 import logging
 import socket
-import struct
-from typing import List, Tuple
+import time
+from typing import Any, Dict, Iterable, List, Tuple
 
 import aiohttp
 
+try:
+    import ifaddr
+except ImportError:  # pragma: no cover
+    ifaddr = None
+
 from .const import (
-    HDHOMERUN_DEVICE_ID_WILDCARD,
-    HDHOMERUN_DEVICE_TYPE_TUNER,
-    HDHOMERUN_DISCOVER_UDP_PORT,
+    HDHOMERUN_DISCOVER_UDP_MULTICAST_IPV6,
     HDHOMERUN_TAG_DEVICE_ID,
-    HDHOMERUN_TAG_DEVICE_TYPE,
-    HDHOMERUN_TYPE_DISCOVER_REQ,
-    HDHOMERUN_TYPE_DISCOVER_RPY,
     DiscoverMode,
 )
-from .device import DevicePaths, HDHomeRunDevice
+from .device import DevicePaths, DeviceType, HDHomeRunDevice, format_url_host
+from .endpoint import DiscoveryEndpoint
 from .exceptions import HDHomeRunDeviceNotFoundError
 from .logger import Logger
-from .protocol import HDHomeRunProtocol
+from .record import DiscoveryRecord
 
 # endregion
 
 _LOGGER = logging.getLogger(__name__)
 
 DEF_BROADCAST_ADDRESS: str = "255.255.255.255"
+DEF_HTTP_PROBE_CONCURRENCY: int = 8
+DEF_HTTP_PROBE_TIMEOUT_SECS: float = 2.5
+DEF_SWEEP_RATE: int = 1000  # packets per second
 
 
 class Discover:
@@ -42,16 +48,194 @@ class Discover:
         broadcast_address: str = DEF_BROADCAST_ADDRESS,
         interface: str | None = None,
         mode: DiscoverMode = DiscoverMode.AUTO,
+        http_probe_concurrency: int = DEF_HTTP_PROBE_CONCURRENCY,
+        http_probe_timeout: float = DEF_HTTP_PROBE_TIMEOUT_SECS,
+        sweep: List[str] | None = None,
+        sweep_rate: int = DEF_SWEEP_RATE,
+        dual_stack: bool = True,
+        device_types: Iterable[DeviceType] = (DeviceType.TUNER,),
+        http_probes: Dict[str, asyncio.Future] | None = None,
     ) -> None:
-        """Initialise."""
+        """Initialise.
+
+        :param session: session to use for HTTP requests
+        :param broadcast_address: address to send the discovery to
+        :param interface: network interface to bind to for UDP discovery
+        :param mode: the discovery methods to use
+        :param http_probe_concurrency: maximum devices probed over HTTP at once
+        :param http_probe_timeout: seconds to wait for each device to respond over HTTP
+        :param sweep: CIDR ranges to send a unicast discovery to every host of,
+            used instead of the broadcast address
+        :param sweep_rate: maximum packets per second to send when sweeping
+        :param dual_stack: also send to the IPv6 link-local multicast group when
+            broadcasting
+        :param device_types: the types of device to return
+        :param http_probes: HTTP probes keyed by address, shared between
+            discoveries so that each address is only probed once
+        """
         self._log_formatter: Logger = Logger()
         self._broadcast_address: str = broadcast_address
         self._created_session: bool = False
+        self._device_types: Tuple[DeviceType, ...] = tuple(device_types)
+        self._dual_stack: bool = dual_stack
+        self._http_probe_concurrency: int = http_probe_concurrency
+        self._http_probe_timeout: float = http_probe_timeout
+        self._http_probes: Dict[str, asyncio.Future] = (
+            {} if http_probes is None else http_probes
+        )
         self._interface: str | None = interface
         self._mode: DiscoverMode = DiscoverMode(mode)
         self._session: aiohttp.ClientSession | None = session or None
+        self._sweep: List[str] | None = sweep
+        self._sweep_rate: int = sweep_rate
         self._udp_timeout: float = 1
 
+    def _get_udp_targets(self) -> List[str]:
+        """Get the addresses to send the UDP discovery to."""
+        if not self._sweep:
+            ret: List[str] = [self._broadcast_address]
+            if self._dual_stack and self._broadcast_address == DEF_BROADCAST_ADDRESS:
+                ret.extend(get_local_ipv6_multicast_targets())
+            return ret
+
+        return list(
+            dict.fromkeys(
+                str(host)
+                for cidr in self._sweep
+                for host in ipaddress.IPv4Network(cidr, strict=False).hosts()
+            )
+        )
+
+    async def _async_request_udp(
+        self, family: int, targets: List[str]
+    ) -> List[DiscoveryRecord]:
+        """Send the discovery to the targets of a single address family."""
+        try:
+            endpoint: DiscoveryEndpoint = await DiscoveryEndpoint.async_acquire(
+                interface=self._interface, family=family
+            )
+        except OSError as err:
+            if family == socket.AF_INET:
+                raise
+            _LOGGER.debug(self._log_formatter.format("IPv6 unavailable: %s"), err)
+            return []
+
+        try:
+            return await endpoint.async_request(
+                targets=targets,
+                timeout=self._udp_timeout,
+                device_types=[device_type.value for device_type in self._device_types],
+                rate=self._sweep_rate if self._sweep else None,
+            )
+        finally:
+            endpoint.release()
+
+    def _is_wanted_type(self, online_device: Dict[str, Any]) -> bool:
+        """Check if a device from the online service is of a type asked for.
+
+        Tuners have a DeviceID, storage engines a StorageID, a device can
+        be both.
+        """
+        if "DeviceID" in online_device and DeviceType.TUNER in self._device_types:
+            return True
+
+        return (
+            "StorageID" in online_device and DeviceType.STORAGE in self._device_types
+        )
+
+    @staticmethod
+    def _merge_udp_replies(replies: List[DiscoveryRecord]) -> List[HDHomeRunDevice]:
+        """Merge the replies received over IPv4 and IPv6.
+
+        The IPv4 address is kept as the address of the device, the address
+        that replied first is used for the control protocol.
+        """
+        by_key: Dict[str, List[DiscoveryRecord]] = {}
+        for record in replies:
+            by_key.setdefault(record.key, []).append(record)
+
+        ret: List[HDHomeRunDevice] = []
+        for records in by_key.values():
+            primary: DiscoveryRecord = next(
+                (record for record in records if ":" not in record.ip), records[0]
+            )
+            fastest: DiscoveryRecord = min(
+                records, key=lambda record: record.received or 0
+            )
+            ret.append(
+                HDHomeRunDevice.from_discovery_record(
+                    record=primary, control_host=fastest.ip
+                )
+            )
+
+        return ret
+
+    async def _async_is_available_http(
+        self, host: str, semaphore: asyncio.Semaphore
+    ) -> bool:
+        """Check if the device at the address is available locally over HTTP.
+
+        :param host: the address of the device
+        :param semaphore: limits the number of probes running at once
+        """
+        async with semaphore:
+            try:
+                _LOGGER.debug(
+                    self._log_formatter.format(
+                        "attempting to reach local discovery for %s"
+                    ),
+                    host,
+                )
+                url = f"http://{format_url_host(host)}/{DevicePaths.DISCOVER.value}"
+                await self._session.get(
+                    url=url,
+                    raise_for_status=True,
+                    timeout=aiohttp.ClientTimeout(total=self._http_probe_timeout),
+                )
+            except (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientResponseError,
+                asyncio.TimeoutError,
+            ) as exc:
+                _LOGGER.debug(self._log_formatter.format("%s"), exc)
+                return False
+
+        return True
+
+    async def _async_probe_http(
+        self, device: HDHomeRunDevice, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Set the device to use HTTP if it is available locally over HTTP.
+
+        An address already probed, or being probed, isn't probed again.
+
+        :param device: the device to check
+        :param semaphore: limits the number of probes running at once
+        """
+        if (probe := self._http_probes.get(device.ip)) is None:
+            probe = self._http_probes[device.ip] = asyncio.ensure_future(
+                self._async_is_available_http(host=device.ip, semaphore=semaphore)
+            )
+
+        if not await asyncio.shield(probe):
+            if device.discovery_method is DiscoverMode.HTTP:
+                _LOGGER.debug(
+                    self._log_formatter.format(
+                        "%s is not available locally over HTTP, setting to UDP only"
+                    ),
+                    device.ip,
+                )
+                setattr(device, "_discovery_method", DiscoverMode.UDP)
+        else:
+            _LOGGER.debug(
+                self._log_formatter.format(
+                    "setting %s to use HTTP mode and setting the session"
+                ),
+                device.ip,
+            )
+            setattr(device, "_discovery_method", DiscoverMode.HTTP)
+            setattr(device, "_session", self._session)
+
     async def async_discover(self) -> List[HDHomeRunDevice]:
         """Carry out a discovery."""
         _LOGGER.debug(self._log_formatter.format("entered"))
@@ -59,34 +243,37 @@ class Discover:
 
         if self._mode in (DiscoverMode.AUTO, DiscoverMode.UDP):
             _LOGGER.debug(self._log_formatter.format("carrying out UDP discovery"))
-            loop = asyncio.get_event_loop()
-            transport, protocol = await loop.create_datagram_endpoint(
-                lambda: _DiscoverProtocol(
-                    target=self._broadcast_address,
-                    interface=self._interface,
-                ),
-                local_addr=("0.0.0.0", 0),
+            targets_by_family: Dict[int, List[str]] = {}
+            for target in self._get_udp_targets():
+                family: int = socket.AF_INET6 if ":" in target else socket.AF_INET
+                targets_by_family.setdefault(family, []).append(target)
+            replies: List[List[DiscoveryRecord]] = await asyncio.gather(
+                *[
+                    self._async_request_udp(family=family, targets=targets)
+                    for family, targets in targets_by_family.items()
+                ]
             )
-
-            try:
-                _LOGGER.debug(
-                    self._log_formatter.format("waiting %s second%s for responses"),
-                    self._udp_timeout,
-                    "s" if self._udp_timeout != 1 else "",
+            discovered_devices.extend(
+                self._merge_udp_replies(
+                    replies=[record for result in replies for record in result]
                 )
-                await asyncio.sleep(self._udp_timeout)
-            finally:
-                transport.close()
-
-            discovered_devices.extend(protocol.discovered_devices)
+            )
+            # UDP devices still use the session to get the lineup
+            if self._session is not None and not self._created_session:
+                for device in discovered_devices:
+                    setattr(device, "_session", self._session)
             _LOGGER.debug(
                 self._log_formatter.format("UDP discovery found %d devices"),
                 len(discovered_devices),
             )
 
         if self._mode in (DiscoverMode.AUTO, DiscoverMode.HTTP):
-            if self._broadcast_address == DEF_BROADCAST_ADDRESS:
+            devices_by_ip: Dict[str, HDHomeRunDevice] = {
+                device.ip: device for device in discovered_devices
+            }
+            if self._sweep is None and self._broadcast_address == DEF_BROADCAST_ADDRESS:
                 # region #-- query the SiliconDust online service --#
+                resp_json: List[Dict[str, Any]] = []
                 try:
                     _LOGGER.debug(
                         self._log_formatter.format("querying the online service")
@@ -96,6 +283,7 @@ class Discover:
                         url=url,
                         raise_for_status=True,
                     )
+                    resp_json = await response.json()
                 except aiohttp.ClientConnectionError:
                     _LOGGER.warning("%s is unavailable for querying", url)
                 except Exception as err:  # pylint: disable=broad-except
@@ -114,22 +302,20 @@ class Discover:
                         "matching up UDP results and those from the online service"
                     )
                 )
-                already_discovered = [device.ip for device in discovered_devices]
-                resp_json = await response.json()
                 for device in resp_json:
+                    if not self._is_wanted_type(online_device=device):
+                        continue
+
                     if (host := device.get("LocalIP", None)) is not None:
-                        try:
-                            idx: int = already_discovered.index(host)
-                        except ValueError:
+                        if (hdhr_device := devices_by_ip.get(host)) is None:
                             hdhr_device = HDHomeRunDevice(host=host)
-                            setattr(hdhr_device, "_discovery_method", DiscoverMode.HTTP)
                             _LOGGER.debug(
                                 self._log_formatter.format(
                                     "adding %s to discovered devices"
                                 ),
                                 host,
                             )
-                            discovered_devices.append(hdhr_device)
+                            devices_by_ip[host] = hdhr_device
                         else:
                             _LOGGER.debug(
                                 self._log_formatter.format(
@@ -137,92 +323,42 @@ class Discover:
                                 ),
                                 host,
                             )
-                            setattr(
-                                discovered_devices[idx],
-                                "_discovery_method",
-                                DiscoverMode.HTTP,
-                            )
+                        setattr(hdhr_device, "_discovery_method", DiscoverMode.HTTP)
                 # endregion
 
             # region #-- check local discovery to see if HTTP is available --#
-            def _find_in_discovered_devices(device_ip: str) -> int | None:
-                """Find a device in discovered devices."""
-                ret: List[int] = [
-                    idx
-                    for idx, device in enumerate(discovered_devices)
-                    if device.ip == device_ip
-                ]
-                if ret:
-                    return ret[0]
-
-                return None
-
             if (
-                self._broadcast_address != DEF_BROADCAST_ADDRESS
+                self._sweep is None
+                and self._broadcast_address != DEF_BROADCAST_ADDRESS
                 and self._mode is DiscoverMode.HTTP
             ):
                 _LOGGER.debug(
                     self._log_formatter.format("creating dummy found device for %s"),
                     self._broadcast_address,
                 )
-                discovered_devices = [HDHomeRunDevice(host=self._broadcast_address)]
-                setattr(discovered_devices[0], "_discovery_method", DiscoverMode.HTTP)
-            already_discovered = [device.ip for device in discovered_devices]
-            for device_ip in already_discovered:
-                discovered_idx = _find_in_discovered_devices(device_ip)
-                if discovered_idx is not None:
-                    try:
-                        _LOGGER.debug(
-                            self._log_formatter.format(
-                                "attempting to reach local discovery for %s"
-                            ),
-                            device_ip,
-                        )
-                        url = f"http://{device_ip}/{DevicePaths.DISCOVER.value}"
-                        response: aiohttp.ClientResponse = await self._session.get(
-                            url=url,
-                            raise_for_status=True,
-                        )
-                    except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError) as exc:
-                        _LOGGER.debug(self._log_formatter.format("%s"), exc)
-                        if (
-                            discovered_devices[discovered_idx].discovery_method
-                            is DiscoverMode.HTTP
-                        ):
-                            _LOGGER.debug(
-                                self._log_formatter.format(
-                                    "%s is not available locally over HTTP, setting to UDP only"
-                                ),
-                                device_ip,
-                            )
-                            setattr(
-                                discovered_devices[discovered_idx],
-                                "_discovery_method",
-                                DiscoverMode.UDP,
-                            )
-                    else:
-                        _LOGGER.debug(
-                            self._log_formatter.format(
-                                "setting %s to use HTTP mode and setting the session"
-                            ),
-                            device_ip,
-                        )
-                        setattr(
-                            discovered_devices[discovered_idx],
-                            "_discovery_method",
-                            DiscoverMode.HTTP,
-                        )
-                        setattr(
-                            discovered_devices[discovered_idx],
-                            "_session",
-                            self._session,
-                        )
+                hdhr_device = HDHomeRunDevice(host=self._broadcast_address)
+                setattr(hdhr_device, "_discovery_method", DiscoverMode.HTTP)
+                devices_by_ip = {self._broadcast_address: hdhr_device}
+
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(
+                self._http_probe_concurrency
+            )
+            await asyncio.gather(
+                *[
+                    self._async_probe_http(device=device, semaphore=semaphore)
+                    for device in devices_by_ip.values()
+                ]
+            )
+            discovered_devices = list(devices_by_ip.values())
             # endregion
 
         if self._created_session:
             await self._session.close()
 
         if not discovered_devices:
+            if self._sweep:
+                raise HDHomeRunDeviceNotFoundError(device=", ".join(self._sweep))
+
             if self._broadcast_address == DEF_BROADCAST_ADDRESS:
                 raise HDHomeRunDeviceNotFoundError(device="no devices")
 
@@ -236,95 +372,205 @@ class Discover:
         return discovered_devices
 
 
-class _DiscoverProtocol(asyncio.DatagramProtocol):
-    """Internal implementation of the discovery protocol."""
+@dataclasses.dataclass(frozen=True)
+class DiscoverTarget:
+    """Where to send a discovery."""
 
-    discovered_devices: List[HDHomeRunDevice] = []
+    broadcast_address: str = DEF_BROADCAST_ADDRESS
+    interface: str | None = None
+    name: str | None = None
 
-    def __init__(
-        self,
-        interface: str | None,
-        target: str,
-        port: int = HDHOMERUN_DISCOVER_UDP_PORT,
-    ) -> None:
-        """Initialise."""
-        self._interface: str | None = interface
-        self._log_formatter: Logger = Logger(prefix=f"{__class__.__name__}.")
-        self._target = (target, port)
-        self._transport: asyncio.DatagramTransport | None = None
 
-        self.discovered_devices = []
+@dataclasses.dataclass(frozen=True)
+class DiscoverTargetStats:
+    """Outcome of the discovery for a single target."""
 
-    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
-        """Respond when a conection is made.
+    target: DiscoverTarget
+    duration: float
+    replies: int
+    error: str | None = None
 
-        :param transport: UDP transport
-        :return: None
-        """
-        # region #-- initialise the socket --#
-        self._transport = transport
-        sock: socket.socket = self._transport.get_extra_info("socket")
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        # endregion
 
-        # bind to an interface if necessary
-        if self._interface is not None:
-            sock.setsockopt(
-                socket.SOL_SOCKET, socket.SO_BINDTODEVICE, self._interface.encode()
+def get_local_discover_targets() -> List[DiscoverTarget]:
+    """Get a target for the broadcast address of each local IPv4 network.
+
+    N.B. requires ifaddr, only the global broadcast address is returned
+    without it
+    """
+    ret: Dict[str, DiscoverTarget] = {}
+    if ifaddr is None:
+        _LOGGER.debug("ifaddr is not available, unable to enumerate the networks")
+        return [DiscoverTarget()]
+
+    for adapter in ifaddr.get_adapters():
+        for adapter_ip in adapter.ips:
+            if not isinstance(adapter_ip.ip, str):  # IPv6
+                continue
+
+            network = ipaddress.IPv4Network(
+                f"{adapter_ip.ip}/{adapter_ip.network_prefix}", strict=False
+            )
+            if network.is_loopback or network.is_link_local or network.prefixlen >= 31:
+                continue
+
+            broadcast_address: str = str(network.broadcast_address)
+            ret.setdefault(
+                broadcast_address,
+                DiscoverTarget(
+                    broadcast_address=broadcast_address, name=adapter.nice_name
+                ),
             )
 
-        self.do_discover()
+    return list(ret.values())
 
-    def connection_lost(self, exc: Exception | None) -> None:
-        """React to the connection being lost."""
 
-    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
-        """Process the data received.
+def get_local_ipv6_multicast_targets() -> List[str]:
+    """Get the IPv6 multicast group for each interface with a link-local address.
 
-        :param data: data received in response to the message
-        :param addr: where the data came from
-        :return: None
-        """
-        ip_address, _ = addr
-
-        if ip_address not in [device.ip for device in self.discovered_devices]:
-            # region #-- initialise the device object --#
-            discovered_device: HDHomeRunDevice = HDHomeRunDevice(host=ip_address)
-            setattr(discovered_device, "_discovery_method", DiscoverMode.UDP)
-            response = HDHomeRunProtocol.parse_response(data)
-            _LOGGER.debug("UDP response: %s", response)
-            # endregion
+    N.B. requires ifaddr, nothing is returned without it
+    """
+    ret: List[str] = []
+    if ifaddr is None:
+        return ret
 
-            # region #-- check that the tuner was initialised with a discovery response --#
-            if response.get("header") != HDHOMERUN_TYPE_DISCOVER_RPY:
-                raise ValueError
-            # endregion
+    for adapter in ifaddr.get_adapters():
+        for adapter_ip in adapter.ips:
+            if isinstance(adapter_ip.ip, str):  # IPv4
+                continue
 
-            setattr(discovered_device, "_processed_datagram", response)
+            target: str = f"{HDHOMERUN_DISCOVER_UDP_MULTICAST_IPV6}%{adapter.name}"
+            if ipaddress.IPv6Address(adapter_ip.ip[0]).is_link_local:
+                if target not in ret:
+                    ret.append(target)
 
-            self.discovered_devices.append(discovered_device)
+    return ret
 
-    def do_discover(self) -> None:
-        """Send the packets."""
-        _LOGGER.debug(self._log_formatter.format("entered"))
 
-        pkt_type: bytes = struct.pack(">H", HDHOMERUN_TYPE_DISCOVER_REQ)
-        payload_data: List[Tuple[int, bytes]] = [
-            (HDHOMERUN_TAG_DEVICE_TYPE, struct.pack(">I", HDHOMERUN_DEVICE_TYPE_TUNER)),
-            (HDHOMERUN_TAG_DEVICE_ID, struct.pack(">I", HDHOMERUN_DEVICE_ID_WILDCARD)),
+class MultiDiscover:
+    """Discover devices on many networks at the same time.
+
+    A discovery is carried out for each target concurrently and the results
+    are merged using the DeviceID. A device found on more than one target is
+    only probed over HTTP once.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        targets: List[DiscoverTarget] | None = None,
+        mode: DiscoverMode = DiscoverMode.AUTO,
+    ) -> None:
+        """Initialise.
+
+        :param session: session to use for HTTP requests
+        :param targets: where to send the discoveries, defaults to every local network
+        :param mode: the discovery methods to use
+        """
+        self._http_probes: Dict[str, asyncio.Future] = {}
+        self._log_formatter: Logger = Logger(prefix=f"{self.__class__.__name__}.")
+        self._mode: DiscoverMode = DiscoverMode(mode)
+        self._session: aiohttp.ClientSession = session
+        self._stats: List[DiscoverTargetStats] = []
+        self._targets: List[DiscoverTarget] | None = targets
+
+    def _get_targets(self) -> List[DiscoverTarget]:
+        """Get the targets to discover on.
+
+        HTTP discovery only uses the online service so the local networks
+        are not needed.
+        """
+        if self._mode is DiscoverMode.HTTP:
+            return [DiscoverTarget()]
+
+        if self._targets is not None:
+            return self._targets
+
+        return [DiscoverTarget()] + [
+            target
+            for target in get_local_discover_targets()
+            if target.broadcast_address != DEF_BROADCAST_ADDRESS
         ]
-        req = HDHomeRunProtocol.build_request(
-            packet_payload=payload_data, packet_type=pkt_type
+
+    async def _async_discover_target(
+        self, target: DiscoverTarget
+    ) -> List[HDHomeRunDevice]:
+        """Discover on a single target, recording how it went."""
+        devices: List[HDHomeRunDevice] = []
+        error: str | None = None
+        started: float = time.perf_counter()
+        try:
+            devices = await Discover(
+                session=self._session,
+                broadcast_address=target.broadcast_address,
+                interface=target.interface,
+                mode=self._mode,
+                http_probes=self._http_probes,
+            ).async_discover()
+        except HDHomeRunDeviceNotFoundError:
+            pass
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug(
+                self._log_formatter.format("discovery on %s failed: %s"), target, err
+            )
+            error = str(err)
+
+        self._stats.append(
+            DiscoverTargetStats(
+                target=target,
+                duration=round(time.perf_counter() - started, 3),
+                replies=len(devices),
+                error=error,
+            )
         )
+        return devices
 
-        _LOGGER.debug(
-            self._log_formatter.format("sending discovery packet: %s, %s"),
-            self._target,
-            req.hex(),
+    async def async_discover(self) -> List[HDHomeRunDevice]:
+        """Carry out the discoveries."""
+        _LOGGER.debug(self._log_formatter.format("entered"))
+        self._http_probes = {}
+        self._stats = []
+        targets: List[DiscoverTarget] = self._get_targets()
+        _LOGGER.debug(self._log_formatter.format("targets: %s"), targets)
+        results: List[List[HDHomeRunDevice]] = await asyncio.gather(
+            *[self._async_discover_target(target=target) for target in targets]
         )
-        self._transport.sendto(req, self._target)
+
+        # region #-- merge the results, preferring devices available over HTTP --#
+        # devices only known by address are matched on the address of those
+        # with a DeviceID
+        found: List[Tuple[str | None, HDHomeRunDevice]] = sorted(
+            (
+                (
+                    device.get_from_datagram(tag=HDHOMERUN_TAG_DEVICE_ID)
+                    or device.device_id,
+                    device,
+                )
+                for result in results
+                for device in result
+            ),
+            key=lambda item: item[0] is None,
+        )
+        devices: Dict[str, HDHomeRunDevice] = {}
+        keys_by_ip: Dict[str, str] = {}
+        for device_id, device in found:
+            key: str = device_id or keys_by_ip.get(device.ip, device.ip)
+            keys_by_ip.setdefault(device.ip, key)
+            existing: HDHomeRunDevice | None = devices.get(key)
+            if existing is None or (
+                existing.discovery_method is not DiscoverMode.HTTP
+                and device.discovery_method is DiscoverMode.HTTP
+            ):
+                devices[key] = device
+        # endregion
+
+        _LOGGER.debug(self._log_formatter.format("stats: %s"), self._stats)
+        if not devices:
+            raise HDHomeRunDeviceNotFoundError(device="no devices")
 
         _LOGGER.debug(self._log_formatter.format("exited"))
+        return list(devices.values())
 
-    def error_received(self, exc: Exception) -> None:
-        """React to an error being received."""
+    @property
+    def stats(self) -> List[DiscoverTargetStats]:
+        """Get the timing and number of replies for each target."""
+        return self._stats
@@ -0,0 +1,546 @@
+"""Shared socket for discovery requests."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import struct
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Set, Tuple
+
+try:
+    import ifaddr
+except ImportError:  # pragma: no cover
+    ifaddr = None
+
+from .const import (
+    HDHOMERUN_DEVICE_ID_WILDCARD,
+    HDHOMERUN_DEVICE_TYPE_WILDCARD,
+    HDHOMERUN_DISCOVER_UDP_PORT,
+    HDHOMERUN_TAG_DEVICE_ID,
+    HDHOMERUN_TAG_DEVICE_TYPE,
+    HDHOMERUN_TYPE_DISCOVER_REQ,
+)
+from .logger import Logger
+from .protocol import HDHomeRunProtocol
+from .record import DiscoveryRecord
+
+# endregion
+
+_LOGGER = logging.getLogger(__name__)
+
+# requests to the same address within this window share a single send
+DEF_BATCH_WINDOW_SECS: float = 0.5
+
+ReplyCallback = Callable[[DiscoveryRecord], None]
+
+
+def build_discover_request(
+    device_types: Iterable[int] = (HDHOMERUN_DEVICE_TYPE_WILDCARD,),
+) -> bytes:
+    """Build the discovery request packet.
+
+    :param device_types: the types of device that should reply, by default
+        every type so that tuners and storage engines are found in one pass
+    """
+    pkt_type: bytes = struct.pack(">H", HDHOMERUN_TYPE_DISCOVER_REQ)
+    payload_data: List[Tuple[int, bytes]] = [
+        (HDHOMERUN_TAG_DEVICE_TYPE, struct.pack(">I", device_type))
+        for device_type in device_types
+    ]
+    payload_data.append(
+        (HDHOMERUN_TAG_DEVICE_ID, struct.pack(">I", HDHOMERUN_DEVICE_ID_WILDCARD))
+    )
+    return HDHomeRunProtocol.build_request(
+        packet_payload=payload_data, packet_type=pkt_type
+    )
+
+
+def _get_scope_id(scope: str) -> int:
+    """Get the interface index of an IPv6 scope, given as a name or index."""
+    if not scope:
+        return 0
+
+    if scope.isdigit():
+        return int(scope)
+
+    try:
+        return socket.if_nametoindex(scope)
+    except OSError:
+        return 0
+
+
+class _Waiter:
+    """A request waiting for replies."""
+
+    def __init__(
+        self,
+        targets: Set[str],
+        broadcasts: List[Callable[[str], bool]],
+        device_id: str | None,
+        device_types: Tuple[int, ...] | None,
+        max_replies: int | None = None,
+    ) -> None:
+        """Initialise.
+
+        :param targets: addresses the request was sent to
+        :param broadcasts: for each broadcast sent to, a check of whether a
+            reply came from the network it was sent on
+        :param device_id: only accept replies from this device
+        :param device_types: only accept replies from these types of device
+        :param max_replies: number of replies after which the request is complete
+        """
+        self.broadcasts: List[Callable[[str], bool]] = broadcasts
+        self.device_id: str | None = device_id
+        self.device_types: Tuple[int, ...] | None = device_types
+        self.done: asyncio.Event = asyncio.Event()
+        self.max_replies: int | None = max_replies
+        self.replies: Dict[str, DiscoveryRecord] = {}
+        self.targets: Set[str] = targets
+
+    def offer(self, record: DiscoveryRecord) -> None:
+        """Keep the reply if it is for this request."""
+        if self.device_types is not None and not record.is_type(*self.device_types):
+            return
+
+        if self.device_id is not None:
+            if record.device_id != self.device_id.upper():
+                return
+        elif record.ip not in self.targets and not any(
+            in_network(record.ip) for in_network in self.broadcasts
+        ):
+            return
+
+        self.replies.setdefault(record.key, record)
+        if self.max_replies is not None and len(self.replies) >= self.max_replies:
+            self.done.set()
+
+
+class _EndpointProtocol(asyncio.DatagramProtocol):
+    """Pass the replies received to the endpoint."""
+
+    def __init__(self, endpoint: DiscoveryEndpoint) -> None:
+        """Initialise."""
+        self._endpoint: DiscoveryEndpoint = endpoint
+
+    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
+        """Allow broadcasts to be sent and bind to an interface if necessary."""
+        sock: socket.socket = transport.get_extra_info("socket")
+        if self._endpoint.family == socket.AF_INET:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        if self._endpoint.interface is not None:
+            sock.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_BINDTODEVICE,
+                self._endpoint.interface.encode(),
+            )
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Pass the reply on to the endpoint."""
+        self._endpoint.handle_datagram(data=data, addr=addr)
+
+    def error_received(self, exc: Exception) -> None:
+        """React to an error being received."""
+
+
+class DiscoveryEndpoint:
+    """A discovery socket shared by everything discovering on an interface.
+
+    Requests are multiplexed over the one socket and replies are handed to
+    the requests waiting for them, matched on the address the request was
+    sent to, the network of the broadcast it was sent to or the DeviceID
+    that was asked for. A request to an address
+    that was sent to within the batch window isn't sent again, the replies
+    already received are used instead.
+
+    Every type of device is asked for in the one request, those waiting
+    filter the replies down to the types they want.
+
+    There is an endpoint for each address family. IPv6 link-local
+    addresses, including the multicast group, carry the interface they are
+    on as a scope, e.g. `ff02::176%eth0`.
+
+    Use `async_acquire` to get the endpoint for an interface and `release`
+    when finished with it. The socket is closed when it has no more users.
+    """
+
+    _endpoints: ClassVar[Dict[Tuple[str | None, int], DiscoveryEndpoint]] = {}
+
+    def __init__(
+        self,
+        interface: str | None = None,
+        family: int = socket.AF_INET,
+        port: int = HDHOMERUN_DISCOVER_UDP_PORT,
+        batch_window: float = DEF_BATCH_WINDOW_SECS,
+    ) -> None:
+        """Initialise.
+
+        :param interface: network interface to bind to
+        :param family: address family of the socket, AF_INET or AF_INET6
+        :param port: port to send the discovery requests to
+        :param batch_window: seconds a send to an address is shared for
+        """
+        self._batch_window: float = batch_window
+        self._broadcast_networks: Dict[str, List[ipaddress.IPv4Network]] | None = None
+        self._callbacks: List[ReplyCallback] = []
+        self._log_formatter: Logger = Logger(prefix=f"{self.__class__.__name__}.")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._opening: asyncio.Future | None = None
+        self._port: int = port
+        self._recent_replies: List[Tuple[float, DiscoveryRecord]] = []
+        self._request: bytes = build_discover_request()
+        self._sent_at: Dict[str, float] = {}
+        self._stats: Dict[str, int] = {
+            "malformed": 0,
+            "packets_sent": 0,
+            "replies": 0,
+            "sends_shared": 0,
+            "sockets_opened": 0,
+        }
+        self._transport: asyncio.DatagramTransport | None = None
+        self._users: int = 0
+        self._waiters: Set[_Waiter] = set()
+
+        self.family: int = family
+        self.interface: str | None = interface
+
+    @classmethod
+    async def async_acquire(
+        cls, interface: str | None = None, family: int = socket.AF_INET
+    ) -> DiscoveryEndpoint:
+        """Get the shared endpoint for an interface, opening it if necessary."""
+        loop = asyncio.get_running_loop()
+        endpoint: DiscoveryEndpoint | None = cls._endpoints.get((interface, family))
+        if endpoint is None or endpoint._loop is not loop:
+            endpoint = cls(interface=interface, family=family)
+            endpoint._loop = loop
+            cls._endpoints[(interface, family)] = endpoint
+
+        endpoint._users += 1
+        try:
+            await endpoint._async_open()
+        except BaseException:
+            endpoint.release()
+            raise
+
+        return endpoint
+
+    async def _async_open(self) -> None:
+        """Open the socket, sharing the attempt with any other users."""
+        if self._transport is not None:
+            return
+
+        if self._opening is None:
+            local_host: str = "::" if self.family == socket.AF_INET6 else "0.0.0.0"
+            self._opening = asyncio.ensure_future(
+                self._loop.create_datagram_endpoint(
+                    lambda: _EndpointProtocol(endpoint=self),
+                    local_addr=(local_host, 0),
+                    family=self.family,
+                )
+            )
+            self._opening.add_done_callback(self._opened)
+
+        await asyncio.shield(self._opening)
+
+    def _opened(self, opening: asyncio.Future) -> None:
+        """Keep the socket once open, closing it if no longer wanted."""
+        self._opening = None
+        if opening.cancelled() or opening.exception() is not None:
+            return
+
+        transport, _ = opening.result()
+        if not self._users:
+            transport.close()
+            return
+
+        self._transport = transport
+        self._stats["sockets_opened"] += 1
+        _LOGGER.debug(
+            self._log_formatter.format("opened socket for interface: %s"),
+            self.interface,
+        )
+
+    @property
+    def _key(self) -> Tuple[str | None, int]:
+        """Get the key the endpoint is shared under."""
+        return self.interface, self.family
+
+    def release(self) -> None:
+        """Stop using the endpoint, closing it if there are no more users."""
+        self._users = max(0, self._users - 1)
+        if self._users:
+            return
+
+        _LOGGER.debug(self._log_formatter.format("closing"))
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._endpoints.get(self._key) is self:
+            del self._endpoints[self._key]
+
+    def _get_broadcast_networks(self) -> Dict[str, List[ipaddress.IPv4Network]]:
+        """Get the local networks keyed by their broadcast address."""
+        if self._broadcast_networks is None:
+            self._broadcast_networks = {}
+            if ifaddr is not None:
+                for adapter in ifaddr.get_adapters():
+                    for ip in adapter.ips:
+                        if not isinstance(ip.ip, str) or ip.network_prefix >= 31:
+                            continue
+                        network = ipaddress.IPv4Network(
+                            f"{ip.ip}/{ip.network_prefix}", strict=False
+                        )
+                        self._broadcast_networks.setdefault(
+                            str(network.broadcast_address), []
+                        ).append(network)
+
+        return self._broadcast_networks
+
+    def _get_broadcast_check(self, address: str) -> Callable[[str], bool] | None:
+        """Get a check of whether a reply came from the network of a broadcast.
+
+        The global broadcast, and IPv6 multicast without a scope, reach every
+        network. A subnet broadcast only reaches that subnet and a scoped
+        multicast only the interface of the scope.
+
+        :return: the check, None if the address isn't a broadcast
+        """
+        if address == "255.255.255.255":
+            return lambda ip: True
+
+        if self.family == socket.AF_INET6:
+            host, _, scope = address.partition("%")
+            if not ipaddress.IPv6Address(host).is_multicast:
+                return None
+            if not scope:
+                return lambda ip: True
+            scope_id: int = _get_scope_id(scope)
+            return lambda ip: _get_scope_id(ip.partition("%")[2]) == scope_id
+
+        networks: List[ipaddress.IPv4Network] | None
+        if ifaddr is None:
+            if not address.endswith(".255"):
+                return None
+            networks = [ipaddress.IPv4Network(f"{address}/24", strict=False)]
+        elif (networks := self._get_broadcast_networks().get(address)) is None:
+            return None
+
+        def _in_network(ip: str) -> bool:
+            try:
+                return any(ipaddress.IPv4Address(ip) in net for net in networks)
+            except ValueError:
+                return False
+
+        return _in_network
+
+    def _prune(self, now: float) -> None:
+        """Forget the sends and replies that are outside the batch window."""
+        cutoff: float = now - self._batch_window
+        self._recent_replies = [
+            reply for reply in self._recent_replies if reply[0] >= cutoff
+        ]
+        self._sent_at = {
+            target: sent_at
+            for target, sent_at in self._sent_at.items()
+            if sent_at >= cutoff
+        }
+
+    @staticmethod
+    def _get_reply_address(addr: Tuple[Any, ...]) -> str:
+        """Get the address a reply came from, with the scope if link-local."""
+        host: str = addr[0]
+        if len(addr) == 4 and addr[3] and "%" not in host:
+            try:
+                host = f"{host}%{socket.if_indextoname(addr[3])}"
+            except OSError:
+                host = f"{host}%{addr[3]}"
+
+        return host
+
+    def _get_sockaddr(self, target: str) -> Tuple[Any, ...]:
+        """Get the socket address to send to for a target."""
+        if self.family != socket.AF_INET6:
+            return target, self._port
+
+        host, _, scope = target.partition("%")
+        return host, self._port, 0, _get_scope_id(scope)
+
+    def handle_datagram(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Pass a discovery reply to those waiting for it.
+
+        Packets that aren't valid discovery replies are counted and dropped.
+        """
+        ip_address: str = self._get_reply_address(addr=addr)
+        try:
+            record: DiscoveryRecord = DiscoveryRecord.from_reply(
+                ip=ip_address,
+                datagram=HDHomeRunProtocol.parse_response(data),
+                received=self._loop.time(),
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            self._stats["malformed"] += 1
+            _LOGGER.debug(
+                self._log_formatter.format("dropped invalid reply from %s: %s"),
+                ip_address,
+                err,
+            )
+            return
+
+        _LOGGER.debug(
+            self._log_formatter.format("UDP response from %s: %s"),
+            ip_address,
+            record.datagram,
+        )
+        self._stats["replies"] += 1
+        self._recent_replies.append((record.received, record))
+        for waiter in self._waiters:
+            waiter.offer(record=record)
+        for callback in list(self._callbacks):
+            try:
+                callback(record)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error(self._log_formatter.format("callback failed: %s"), err)
+
+    def _select_targets(self, targets: List[str]) -> List[str]:
+        """Get the targets that haven't been sent to within the batch window."""
+        now: float = self._loop.time()
+        self._prune(now=now)
+        ret: List[str] = []
+        for target in targets:
+            if target in self._sent_at:
+                self._stats["sends_shared"] += 1
+                continue
+            self._sent_at[target] = now
+            ret.append(target)
+
+        return ret
+
+    def _send_now(self, targets: List[str]) -> None:
+        """Send the request to each target."""
+        if self._transport is None:
+            return
+
+        for target in targets:
+            try:
+                self._transport.sendto(self._request, self._get_sockaddr(target))
+            except OSError as err:
+                _LOGGER.debug(
+                    self._log_formatter.format("unable to send to %s: %s"),
+                    target,
+                    err,
+                )
+                continue
+            self._stats["packets_sent"] += 1
+
+    async def _async_send(self, targets: List[str], rate: int | None) -> None:
+        """Send the request to each target without exceeding the rate.
+
+        Packets are sent in small batches every tick rather than one at a
+        time so that the rate can be kept without a timer per packet.
+        """
+        if not targets:
+            return
+
+        started: float = self._loop.time()
+        if rate is None:
+            self._send_now(targets=targets)
+        else:
+            batch_size: int = max(1, int(rate * 0.01))
+            for idx in range(0, len(targets), batch_size):
+                self._send_now(targets=targets[idx : idx + batch_size])
+                # sleep until the time the next batch is due
+                await asyncio.sleep(
+                    max(0, started + (idx + batch_size) / rate - self._loop.time())
+                )
+        _LOGGER.debug(
+            self._log_formatter.format("sent %d packets in %.3fs"),
+            len(targets),
+            self._loop.time() - started,
+        )
+
+    async def async_request(
+        self,
+        targets: List[str],
+        timeout: float,
+        device_id: str | None = None,
+        device_types: Iterable[int] | None = None,
+        rate: int | None = None,
+        max_replies: int | None = None,
+        share: bool = True,
+    ) -> List[DiscoveryRecord]:
+        """Send a discovery request and collect the replies.
+
+        :param targets: addresses to send the request to
+        :param timeout: seconds to wait for replies once sent
+        :param device_id: only collect the replies from this device
+        :param device_types: only collect the replies from these types of device,
+            None for every type
+        :param rate: maximum packets per second, None to send all at once
+        :param max_replies: stop waiting once this many replies are received
+        :param share: whether sends and replies within the batch window can be
+            shared, False to always send and only collect new replies
+        :return: the replies, one per device
+        """
+        waiter: _Waiter = _Waiter(
+            targets=set(targets),
+            broadcasts=[
+                check
+                for target in targets
+                if (check := self._get_broadcast_check(address=target)) is not None
+            ],
+            device_id=device_id,
+            device_types=None if device_types is None else tuple(device_types),
+            max_replies=max_replies,
+        )
+        self._prune(now=self._loop.time())
+        to_send: List[str] = targets
+        if share:
+            for _, record in self._recent_replies:
+                waiter.offer(record=record)
+
+            if waiter.done.is_set():
+                return list(waiter.replies.values())
+
+            to_send = self._select_targets(targets=targets)
+        self._waiters.add(waiter)
+        try:
+            await self._async_send(targets=to_send, rate=rate)
+            _LOGGER.debug(
+                self._log_formatter.format("waiting %s second%s for responses"),
+                timeout,
+                "s" if timeout != 1 else "",
+            )
+            try:
+                await asyncio.wait_for(waiter.done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            self._waiters.discard(waiter)
+
+        return list(waiter.replies.values())
+
+    def send(self, targets: List[str]) -> None:
+        """Send a discovery request without waiting for the replies."""
+        self._send_now(targets=self._select_targets(targets=targets))
+
+    def subscribe(self, callback: ReplyCallback) -> Callable[[], None]:
+        """Be told about every discovery reply received.
+
+        :param callback: called with the decoded reply
+        :return: callable to unsubscribe
+        """
+        self._callbacks.append(callback)
+
+        def _unsubscribe() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return _unsubscribe
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the number of sockets opened, packets sent and replies received."""
+        return {**self._stats, "users": self._users, "waiters": len(self._waiters)}
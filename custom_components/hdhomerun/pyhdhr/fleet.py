@@ -0,0 +1,251 @@
+"""Shared device instances for multiple consumers."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Tuple
+
+from .const import HDHOMERUN_TAG_DEVICE_ID
+from .device import DeviceType, HDHomeRunDevice
+from .logger import Logger
+
+# endregion
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _FleetMember:
+    """A device in the fleet and the state of its polling."""
+
+    def __init__(self, device: HDHomeRunDevice) -> None:
+        """Initialise."""
+        self.changed_run: Dict[str, int] = {}
+        self.device: HDHomeRunDevice = device
+        self.last_run: Dict[str, float] = {}
+        self.ref_count: int = 0
+        self.runs: Dict[str, int] = {}
+        self.tasks: Dict[str, asyncio.Task] = {}
+
+
+class DeviceFleet:
+    """Registry of shared devices keyed by DeviceID.
+
+    Consumers acquire a device from the fleet and are handed the shared
+    instance for that DeviceID. Polling through the fleet is consolidated
+    so that concurrent requests share the same call and requests made
+    within `max_age` of the last one are skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self._log_formatter: Logger = Logger(prefix=f"{self.__class__.__name__}.")
+        self._members: Dict[str, _FleetMember] = {}
+
+    def __contains__(self, device_id: str) -> bool:
+        """Check if a device is in the fleet."""
+        return device_id in self._members
+
+    def __len__(self) -> int:
+        """Get the number of devices in the fleet."""
+        return len(self._members)
+
+    @staticmethod
+    def _get_key(device: HDHomeRunDevice, device_id: str | None = None) -> str:
+        """Get the key to register the device against."""
+        return (
+            device_id
+            or device.device_id
+            or device.get_from_datagram(tag=HDHOMERUN_TAG_DEVICE_ID)
+            or device.storage_id
+            or device.ip
+        )
+
+    def _get_member(self, device: HDHomeRunDevice) -> _FleetMember | None:
+        """Find the fleet member for the given device."""
+        for member in self._members.values():
+            if member.device is device:
+                return member
+
+        return None
+
+    async def _async_run_once(
+        self,
+        device: HDHomeRunDevice,
+        name: str,
+        func: Callable[[], Coroutine[Any, Any, None]],
+        max_age: float,
+        changed: Callable[[], bool] | None = None,
+    ) -> bool:
+        """Run the given function unless it is already running or ran recently.
+
+        :param device: the device being polled
+        :param name: name used to consolidate calls
+        :param func: the function to run
+        :param max_age: seconds for which the previous run is considered current
+        :param changed: called after a run to find out if it changed anything,
+            every run is taken to have changed something if not given
+        :return: True if this call ran the function, False if it was consolidated
+        """
+        member: _FleetMember | None = self._get_member(device)
+        if member is None:
+            await func()
+            return True
+
+        if (task := member.tasks.get(name)) is not None:
+            _LOGGER.debug(
+                self._log_formatter.format("%s already running for %s"),
+                name,
+                device,
+            )
+            await asyncio.shield(task)
+            return False
+
+        if time.monotonic() - member.last_run.get(name, float("-inf")) < max_age:
+            _LOGGER.debug(
+                self._log_formatter.format("%s for %s is still current"),
+                name,
+                device,
+            )
+            return False
+
+        def _record_run(task: asyncio.Task) -> None:
+            """Record the run before anyone waiting on it resumes."""
+            member.tasks.pop(name, None)
+            if not task.cancelled() and task.exception() is None:
+                member.last_run[name] = time.monotonic()
+                member.runs[name] = member.runs.get(name, 0) + 1
+                if changed is None or changed():
+                    member.changed_run[name] = member.runs[name]
+
+        task = asyncio.ensure_future(func())
+        task.add_done_callback(_record_run)
+        member.tasks[name] = task
+        await asyncio.shield(task)
+
+        return True
+
+    def add(
+        self, device: HDHomeRunDevice, device_id: str | None = None
+    ) -> HDHomeRunDevice:
+        """Make a device known to the fleet without registering an interest.
+
+        Used for devices seen on the network that have no consumer of their
+        own, e.g. storage engines. If the device is already known, and no
+        consumer holds it, it is pointed at its new address should it have
+        moved. A device that is held is left to its consumers to follow.
+
+        :param device: the device to add
+        :param device_id: the DeviceID, or StorageID, if it is already known
+        :return: the shared instance for the DeviceID
+        """
+        key: str = self._get_key(device=device, device_id=device_id)
+        if (member := self._members.get(key)) is None:
+            _LOGGER.debug(self._log_formatter.format("adding %s as %s"), device, key)
+            member = self._members[key] = _FleetMember(device=device)
+        elif member.ref_count == 0 and member.device.ip != device.ip:
+            member.device.set_host(host=device.ip)
+
+        return member.device
+
+    def acquire(
+        self, device: HDHomeRunDevice, device_id: str | None = None
+    ) -> HDHomeRunDevice:
+        """Register an interest in a device.
+
+        A device that was only added to the fleet, and so has no consumers,
+        is replaced by the given device.
+
+        :param device: the device to register
+        :param device_id: the DeviceID if it is already known
+        :return: the shared instance for the DeviceID
+        """
+        key: str = self._get_key(device=device, device_id=device_id)
+        member: _FleetMember | None = self._members.get(key)
+        if member is None or member.ref_count == 0:
+            _LOGGER.debug(self._log_formatter.format("adding %s as %s"), device, key)
+            member = self._members[key] = _FleetMember(device=device)
+        member.ref_count += 1
+
+        return member.device
+
+    def get(self, device_id: str) -> HDHomeRunDevice | None:
+        """Get the shared instance for a DeviceID."""
+        if (member := self._members.get(device_id)) is not None:
+            return member.device
+
+        return None
+
+    def get_runs(self, device: HDHomeRunDevice, name: str) -> Tuple[int, int]:
+        """Get the number of runs of a poll and the last run that changed anything.
+
+        Consumers that keep the number of the run they last looked at can
+        tell if anything changed since, whoever carried out the runs.
+
+        :return: the number of runs and the number of the last run that changed
+            anything, 0 if there hasn't been one
+        """
+        if (member := self._get_member(device)) is None:
+            return 0, 0
+
+        return member.runs.get(name, 0), member.changed_run.get(name, 0)
+
+    def invalidate(self, device: HDHomeRunDevice) -> None:
+        """Force the next poll of the device to run."""
+        if (member := self._get_member(device)) is not None:
+            member.last_run.clear()
+
+    def release(self, device: HDHomeRunDevice) -> None:
+        """Remove an interest in a device, dropping it when no longer used."""
+        for key, member in list(self._members.items()):
+            if member.device is device:
+                member.ref_count -= 1
+                if member.ref_count <= 0:
+                    _LOGGER.debug(self._log_formatter.format("removing %s"), key)
+                    self._members.pop(key)
+                break
+
+    async def async_gather_details(
+        self, device: HDHomeRunDevice, max_age: float = 0
+    ) -> bool:
+        """Gather the details of the device, consolidating with other consumers.
+
+        :return: True if this call gathered the details
+        """
+        return await self._async_run_once(
+            device=device,
+            name="gather_details",
+            func=device.async_gather_details,
+            max_age=max_age,
+            changed=lambda: device.details_changed,
+        )
+
+    async def async_refresh_tuner_status(
+        self, device: HDHomeRunDevice, max_age: float = 0
+    ) -> bool:
+        """Refresh the tuner status, consolidating with other consumers.
+
+        :return: True if this call refreshed the tuner status
+        """
+        return await self._async_run_once(
+            device=device,
+            name="tuner_status",
+            func=device.async_refresh_tuner_status,
+            max_age=max_age,
+        )
+
+    @property
+    def devices(self) -> List[HDHomeRunDevice]:
+        """Get the devices in the fleet."""
+        return [member.device for member in self._members.values()]
+
+    @property
+    def storage_devices(self) -> List[HDHomeRunDevice]:
+        """Get the storage engines in the fleet."""
+        return [
+            member.device
+            for member in self._members.values()
+            if DeviceType.STORAGE in member.device.device_types
+        ]
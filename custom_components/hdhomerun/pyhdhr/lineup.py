@@ -0,0 +1,269 @@
+"""Channel lineup helpers."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, Dict, Iterator, List, Tuple
+
+# endregion
+
+
+@dataclasses.dataclass(frozen=True)
+class LineupSummary:
+    """Aggregated view of a channel lineup.
+
+    Built in a single pass over the lineup when it is fetched so that
+    consumers don't need to walk the lineup each time they need a count.
+    """
+
+    count: int = 0
+    disabled: Tuple[str, ...] = ()
+    drm: Tuple[str, ...] = ()
+    enabled: Tuple[str, ...] = ()
+    favorite: Tuple[str, ...] = ()
+    hd: Tuple[str, ...] = ()  # pylint: disable=invalid-name
+
+    @classmethod
+    def from_channels(cls, channels: List[Dict[str, Any]]) -> LineupSummary:
+        """Build the summary from the raw channel list."""
+        return cls.from_lineup(Lineup(channels))
+
+    @classmethod
+    def from_lineup(cls, lineup: Lineup) -> LineupSummary:
+        """Build the summary from the columns of a lineup."""
+        disabled: List[str] = []
+        drm: List[str] = []
+        enabled: List[str] = []
+        favorite: List[str] = []
+        hd: List[str] = []  # pylint: disable=invalid-name
+
+        for name, is_enabled, is_favorite, is_hd, is_drm in zip(
+            lineup.column("GuideName"),
+            lineup.column("Enabled"),
+            lineup.column("Favorite"),
+            lineup.column("HD"),
+            lineup.column("DRM"),
+        ):
+            if is_enabled == 0:
+                disabled.append(name)
+            elif is_enabled == 1:
+                enabled.append(name)
+            if is_favorite == 1:
+                favorite.append(name)
+            if is_hd == 1:
+                hd.append(name)
+            if is_drm == 1:
+                drm.append(name)
+
+        return cls(
+            count=len(lineup),
+            disabled=tuple(disabled),
+            drm=tuple(drm),
+            enabled=tuple(enabled),
+            favorite=tuple(favorite),
+            hd=tuple(hd),
+        )
+
+    @property
+    def disabled_count(self) -> int:
+        """Get the number of disabled channels."""
+        return len(self.disabled)
+
+    @property
+    def drm_count(self) -> int:
+        """Get the number of DRM protected channels."""
+        return len(self.drm)
+
+    @property
+    def enabled_count(self) -> int:
+        """Get the number of enabled channels."""
+        return len(self.enabled)
+
+    @property
+    def favorite_count(self) -> int:
+        """Get the number of favourite channels."""
+        return len(self.favorite)
+
+    @property
+    def hd_count(self) -> int:
+        """Get the number of HD channels."""
+        return len(self.hd)
+
+
+class Lineup:
+    """Column-oriented store for a channel lineup.
+
+    Each property of a channel is held as a single tuple across the lineup
+    rather than as a dictionary per channel. Lookup indexes are built on
+    first use; a new instance is created each time the lineup is fetched
+    so the indexes are never stale.
+    """
+
+    __slots__ = (
+        "_columns",
+        "_count",
+        "_index_guide_name",
+        "_index_guide_number",
+        "_index_program",
+    )
+
+    def __init__(self, channels: List[Dict[str, Any]] | None = None) -> None:
+        """Initialise."""
+        channels = channels or []
+        keys: List[str] = list(
+            dict.fromkeys(key for channel in channels for key in channel)
+        )
+        self._columns: Dict[str, Tuple[Any, ...]] = {
+            key: tuple(channel.get(key, None) for channel in channels)
+            for key in keys
+        }
+        self._count: int = len(channels)
+        self._index_guide_name: Dict[str, int] | None = None
+        self._index_guide_number: Dict[str, int] | None = None
+        self._index_program: Dict[Tuple[int, int], int] | None = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the channels as dictionaries."""
+        for idx in range(self._count):
+            yield self.channel(idx)
+
+    def __len__(self) -> int:
+        """Get the number of channels."""
+        return self._count
+
+    def __repr__(self) -> str:
+        """Friendly representation of the lineup."""
+        return f"{self.__class__.__name__} ({self._count} channels)"
+
+    def _build_index(self, *keys: str) -> Dict[Any, int]:
+        """Map the values of the given columns to the first matching row."""
+        ret: Dict[Any, int] = {}
+        values = (
+            self.column(keys[0]) if len(keys) == 1 else zip(*map(self.column, keys))
+        )
+        for idx, value in enumerate(values):
+            if value is None or (isinstance(value, tuple) and None in value):
+                continue
+            ret.setdefault(value, idx)
+
+        return ret
+
+    def channel(self, idx: int) -> Dict[str, Any]:
+        """Rebuild the channel at the given position as a dictionary."""
+        return {
+            key: column[idx]
+            for key, column in self._columns.items()
+            if column[idx] is not None
+        }
+
+    def column(self, key: str) -> Tuple[Any, ...]:
+        """Get all values for a property across the lineup."""
+        return self._columns.get(key, (None,) * self._count)
+
+    def index_by_guide_number(self) -> Dict[str, int]:
+        """Get the mapping of GuideNumber to position in the lineup."""
+        if self._index_guide_number is None:
+            self._index_guide_number = self._build_index("GuideNumber")
+        return self._index_guide_number
+
+    def get_by_guide_name(self, guide_name: str) -> Dict[str, Any] | None:
+        """Find a channel by its name."""
+        if self._index_guide_name is None:
+            self._index_guide_name = self._build_index("GuideName")
+        idx: int | None = self._index_guide_name.get(guide_name)
+        return None if idx is None else self.channel(idx)
+
+    def get_by_guide_number(self, guide_number: str) -> Dict[str, Any] | None:
+        """Find a channel by its number."""
+        idx: int | None = self.index_by_guide_number().get(str(guide_number))
+        return None if idx is None else self.channel(idx)
+
+    def get_by_program(self, frequency: int, program: int) -> Dict[str, Any] | None:
+        """Find a channel by the frequency and program number it is carried on.
+
+        N.B. only available if the lineup was requested with tuning details
+        """
+        if self._index_program is None:
+            self._index_program = {
+                (int(freq), int(prog)): idx
+                for (freq, prog), idx in self._build_index(
+                    "Frequency", "ProgramNumber"
+                ).items()
+            }
+        idx: int | None = self._index_program.get((int(frequency), int(program)))
+        return None if idx is None else self.channel(idx)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Get the lineup as a list of channel dictionaries."""
+        return list(self)
+
+
+@dataclasses.dataclass(frozen=True)
+class LineupDiff:
+    """Changes between two successive lineups keyed on GuideNumber."""
+
+    added: Tuple[Dict[str, Any], ...] = ()
+    enabled_changed: Tuple[Dict[str, Any], ...] = ()
+    favorite_changed: Tuple[Dict[str, Any], ...] = ()
+    removed: Tuple[Dict[str, Any], ...] = ()
+    renamed: Tuple[Dict[str, Any], ...] = ()
+
+    def __bool__(self) -> bool:
+        """Get whether there are any changes."""
+        return any(
+            (
+                self.added,
+                self.enabled_changed,
+                self.favorite_changed,
+                self.removed,
+                self.renamed,
+            )
+        )
+
+    @classmethod
+    def from_lineups(cls, previous: Lineup, current: Lineup) -> LineupDiff:
+        """Build the differences between two lineups."""
+        previous_index: Dict[str, int] = previous.index_by_guide_number()
+        current_index: Dict[str, int] = current.index_by_guide_number()
+        previous_keys = previous_index.keys()
+        current_keys = current_index.keys()
+
+        enabled_changed: List[Dict[str, Any]] = []
+        favorite_changed: List[Dict[str, Any]] = []
+        renamed: List[Dict[str, Any]] = []
+        for guide_number in sorted(previous_keys & current_keys):
+            previous_idx: int = previous_index[guide_number]
+            current_idx: int = current_index[guide_number]
+            for key, changes in (
+                ("GuideName", renamed),
+                ("Enabled", enabled_changed),
+                ("Favorite", favorite_changed),
+            ):
+                old = previous.column(key)[previous_idx]
+                new = current.column(key)[current_idx]
+                if old != new:
+                    changes.append(
+                        {"GuideNumber": guide_number, "old": old, "new": new}
+                    )
+
+        return cls(
+            added=tuple(
+                current.channel(current_index[guide_number])
+                for guide_number in sorted(current_keys - previous_keys)
+            ),
+            enabled_changed=tuple(enabled_changed),
+            favorite_changed=tuple(favorite_changed),
+            removed=tuple(
+                previous.channel(previous_index[guide_number])
+                for guide_number in sorted(previous_keys - current_keys)
+            ),
+            renamed=tuple(renamed),
+        )
+
+    def as_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the changes as a dictionary of lists."""
+        return {
+            field.name: list(getattr(self, field.name))
+            for field in dataclasses.fields(self)
+        }
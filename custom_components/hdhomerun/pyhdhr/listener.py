@@ -0,0 +1,158 @@
+"""Background discovery of devices."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import time
+from typing import Callable, Dict, List, Tuple
+
+from .discover import DEF_BROADCAST_ADDRESS
+from .endpoint import DiscoveryEndpoint
+from .logger import Logger
+from .record import DiscoveryRecord
+
+# endregion
+
+_LOGGER = logging.getLogger(__name__)
+
+DEF_LISTENER_INTERVAL_SECS: float = 60
+
+ListenerCallback = Callable[["ListenerRecord", "ListenerRecord | None"], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class ListenerRecord:
+    """What is known about a device from its discovery replies."""
+
+    device_id: str  # the StorageID for a storage engine
+    ip: str  # pylint: disable=invalid-name
+    base_url: str | None = None
+    device_types: Tuple[int, ...] = ()
+    last_seen: float = 0
+    tuner_count: int | None = None
+
+    def same_device_details(self, other: ListenerRecord | None) -> bool:
+        """Check if the details, other than when it was seen, are the same."""
+        return other is not None and dataclasses.replace(
+            other, last_seen=self.last_seen
+        ) == self
+
+
+class DiscoveryListener:
+    """Keep track of the devices on the network in the background.
+
+    A discovery request is broadcast periodically on the shared discovery
+    endpoint. Every reply received on the endpoint, whoever asked for it,
+    updates the registry of devices and the subscribers are told about new
+    devices and those that have changed address.
+    """
+
+    def __init__(
+        self,
+        broadcast_address: str = DEF_BROADCAST_ADDRESS,
+        interval: float = DEF_LISTENER_INTERVAL_SECS,
+    ) -> None:
+        """Initialise.
+
+        :param broadcast_address: address to send the discovery requests to
+        :param interval: seconds between discovery requests
+        """
+        self._broadcast_address: str = broadcast_address
+        self._callbacks: List[ListenerCallback] = []
+        self._devices: Dict[str, ListenerRecord] = {}
+        self._interval: float = interval
+        self._log_formatter: Logger = Logger(prefix=f"{self.__class__.__name__}.")
+        self._endpoint: DiscoveryEndpoint | None = None
+        self._task: asyncio.Task | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+
+    async def _async_broadcast(self) -> None:
+        """Send the discovery request periodically."""
+        while True:
+            _LOGGER.debug(self._log_formatter.format("sending discovery request"))
+            self._endpoint.send(targets=[self._broadcast_address])
+            await asyncio.sleep(self._interval)
+
+    async def async_start(self) -> None:
+        """Start listening."""
+        if self._endpoint is not None:
+            return
+
+        _LOGGER.debug(self._log_formatter.format("starting"))
+        self._endpoint = await DiscoveryEndpoint.async_acquire()
+        self._unsubscribe = self._endpoint.subscribe(self.handle_reply)
+        self._task = asyncio.ensure_future(self._async_broadcast())
+
+    async def async_stop(self) -> None:
+        """Stop listening."""
+        _LOGGER.debug(self._log_formatter.format("stopping"))
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._endpoint is not None:
+            self._endpoint.release()
+            self._endpoint = None
+
+    def get(self, device_id: str) -> ListenerRecord | None:
+        """Get what is known about a device."""
+        return self._devices.get(device_id)
+
+    def handle_reply(self, reply: DiscoveryRecord) -> None:
+        """Update the registry from a discovery reply."""
+        if (device_id := reply.device_id or reply.storage_id) is None:
+            return
+
+        record: ListenerRecord = ListenerRecord(
+            device_id=device_id,
+            ip=reply.ip,
+            base_url=reply.base_url,
+            device_types=reply.types,
+            last_seen=time.time(),
+            tuner_count=reply.tuner_count,
+        )
+        previous: ListenerRecord | None = self._devices.get(record.device_id)
+        self._devices[record.device_id] = record
+        if record.same_device_details(previous):
+            return
+
+        _LOGGER.debug(
+            self._log_formatter.format("%s changed from %s to %s"),
+            record.device_id,
+            previous,
+            record,
+        )
+        for callback in list(self._callbacks):
+            try:
+                callback(record, previous)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error(self._log_formatter.format("callback failed: %s"), err)
+
+    def subscribe(self, callback: ListenerCallback) -> Callable[[], None]:
+        """Be told when a device is found or changes.
+
+        :param callback: called with the new and previous details of the device
+        :return: callable to unsubscribe
+        """
+        self._callbacks.append(callback)
+
+        def _unsubscribe() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return _unsubscribe
+
+    @property
+    def devices(self) -> Dict[str, ListenerRecord]:
+        """Get the devices that have been seen."""
+        return dict(self._devices)
+
+    @property
+    def listening(self) -> bool:
+        """Get whether the listener is running."""
+        return self._endpoint is not None
@@ -292,24 +292,29 @@ class HDHomeRunProtocol:
         value_name = "/sys/model"
         return await self._get_set_req(tag=value_name, timeout=timeout)
 
-    async def async_get_tuner_current_channel(
-        self, tuner_idx, timeout: float = 2.5
-    ) -> Tuple[Dict[str, bytes], ...]:
-        """Get the current channel information from the tuner.
+    async def async_get_tuner_channel(
+        self, tuner_idx: int, timeout: float = 2.5
+    ) -> Dict[str, bytes]:
+        """Get the channel (modulation and frequency) the tuner is tuned to.
 
-        :param tuner_idx: the index number of the tuner
+        :param tuner_idx: index number of the tuner
         :param timeout: timeout for the query
-        :return: a tuple of tuner details as parsed by the `parse_response` function
+        :return: details as parsed by the `parse_response` function
         """
-        details = [
-            self._get_set_req(tag=f"/tuner{tuner_idx}/program", timeout=timeout),
-            self._get_set_req(tag=f"/tuner{tuner_idx}/streaminfo", timeout=timeout),
-            self._get_set_req(tag=f"/tuner{tuner_idx}/target", timeout=timeout),
-        ]
+        value_name: str = f"/tuner{tuner_idx}/channel"
+        return await self._get_set_req(tag=value_name, timeout=timeout)
 
-        channel_details = await asyncio.gather(*details)
+    async def async_get_tuner_program(
+        self, tuner_idx: int, timeout: float = 2.5
+    ) -> Dict[str, bytes]:
+        """Get the program number the tuner is filtering on.
 
-        return channel_details
+        :param tuner_idx: index number of the tuner
+        :param timeout: timeout for the query
+        :return: details as parsed by the `parse_response` function
+        """
+        value_name: str = f"/tuner{tuner_idx}/program"
+        return await self._get_set_req(tag=value_name, timeout=timeout)
 
     async def async_get_tuner_status(
         self, tuner_idx: int, timeout: float = 2.5
@@ -326,6 +331,30 @@ class HDHomeRunProtocol:
         value_name: str = f"/tuner{tuner_idx}/status"
         return await self._get_set_req(tag=value_name, timeout=timeout)
 
+    async def async_get_tuner_streaminfo(
+        self, tuner_idx: int, timeout: float = 2.5
+    ) -> Dict[str, bytes]:
+        """Get the programs available on the currently tuned channel.
+
+        :param tuner_idx: index number of the tuner
+        :param timeout: timeout for the query
+        :return: details as parsed by the `parse_response` function
+        """
+        value_name: str = f"/tuner{tuner_idx}/streaminfo"
+        return await self._get_set_req(tag=value_name, timeout=timeout)
+
+    async def async_get_tuner_target(
+        self, tuner_idx: int, timeout: float = 2.5
+    ) -> Dict[str, bytes]:
+        """Get where the tuner is streaming to.
+
+        :param tuner_idx: index number of the tuner
+        :param timeout: timeout for the query
+        :return: details as parsed by the `parse_response` function
+        """
+        value_name: str = f"/tuner{tuner_idx}/target"
+        return await self._get_set_req(tag=value_name, timeout=timeout)
+
     async def async_get_version(self, timeout: float = 2.5) -> Dict[str, bytes]:
         """Get the firmware version.
 
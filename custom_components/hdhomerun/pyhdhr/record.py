@@ -0,0 +1,162 @@
+"""Decoded discovery replies."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import struct
+from typing import Any, Callable, Dict, Tuple
+
+from .const import (
+    HDHOMERUN_DEVICE_TYPE_TUNER,
+    HDHOMERUN_TAG_BASE_URL,
+    HDHOMERUN_TAG_DEVICE_AUTH_STR,
+    HDHOMERUN_TAG_DEVICE_ID,
+    HDHOMERUN_TAG_DEVICE_TYPE,
+    HDHOMERUN_TAG_LINEUP_URL,
+    HDHOMERUN_TAG_MULTI_TYPE,
+    HDHOMERUN_TAG_STORAGE_ID,
+    HDHOMERUN_TAG_STORAGE_URL,
+    HDHOMERUN_TAG_TUNER_COUNT,
+    HDHOMERUN_TYPE_DISCOVER_RPY,
+)
+
+# endregion
+
+
+def _decode_device_id(value: bytes) -> str:
+    """Decode the DeviceID to its hex representation."""
+    (device_id,) = struct.unpack(">L", value)
+    return f"{device_id:04X}"
+
+
+def _decode_uint8(value: bytes) -> int:
+    """Decode a single byte value."""
+    (ret,) = struct.unpack(">B", value)
+    return ret
+
+
+def _decode_uint32(value: bytes) -> int:
+    """Decode a four byte value."""
+    (ret,) = struct.unpack(">L", value)
+    return ret
+
+
+def _decode_uint32_list(value: bytes) -> Tuple[int, ...]:
+    """Decode a list of four byte values."""
+    return struct.unpack(f">{len(value) // 4}L", value[: len(value) // 4 * 4])
+
+
+def _decode_str(value: bytes) -> str:
+    """Decode a string value."""
+    return value.decode()
+
+
+# tag -> (attribute of the record, decoder)
+TAG_DECODERS: Dict[int, Tuple[str, Callable[[bytes], Any]]] = {
+    HDHOMERUN_TAG_BASE_URL: ("base_url", _decode_str),
+    HDHOMERUN_TAG_DEVICE_AUTH_STR: ("device_auth_str", _decode_str),
+    HDHOMERUN_TAG_DEVICE_ID: ("device_id", _decode_device_id),
+    HDHOMERUN_TAG_DEVICE_TYPE: ("device_type", _decode_uint32),
+    HDHOMERUN_TAG_LINEUP_URL: ("lineup_url", _decode_str),
+    HDHOMERUN_TAG_MULTI_TYPE: ("device_types", _decode_uint32_list),
+    HDHOMERUN_TAG_STORAGE_ID: ("storage_id", _decode_str),
+    HDHOMERUN_TAG_STORAGE_URL: ("storage_url", _decode_str),
+    HDHOMERUN_TAG_TUNER_COUNT: ("tuner_count", _decode_uint8),
+}
+
+
+class DiscoveryRecord:
+    """A discovery reply decoded once into its known tags.
+
+    The parsed datagram is kept alongside so that it can still be stored
+    in, and restored from, a snapshot of the device.
+    """
+
+    __slots__ = (
+        "base_url",
+        "datagram",
+        "device_auth_str",
+        "device_id",
+        "device_type",
+        "device_types",
+        "ip",
+        "lineup_url",
+        "received",
+        "storage_id",
+        "storage_url",
+        "tuner_count",
+    )
+
+    def __init__(
+        self, ip: str, datagram: Dict[str, Any], received: float | None = None
+    ) -> None:
+        """Initialise.
+
+        :param ip: the address the reply came from
+        :param datagram: the reply as parsed by `HDHomeRunProtocol.parse_response`
+        :param received: event loop time the reply was received
+        :raises ValueError: if a known tag can't be decoded
+        """
+        self.base_url: str | None = None
+        self.datagram: Dict[str, Any] = datagram
+        self.device_auth_str: str | None = None
+        self.device_id: str | None = None
+        self.device_type: int | None = None
+        self.device_types: Tuple[int, ...] = ()
+        self.ip: str = ip  # pylint: disable=invalid-name
+        self.lineup_url: str | None = None
+        self.received: float | None = received
+        self.storage_id: str | None = None
+        self.storage_url: str | None = None
+        self.tuner_count: int | None = None
+
+        for tag, value in datagram.get("data", {}).items():
+            if not value or (decoder := TAG_DECODERS.get(tag)) is None:
+                continue
+            attribute, decode = decoder
+            try:
+                setattr(self, attribute, decode(value))
+            except (struct.error, UnicodeDecodeError) as err:
+                raise ValueError(f"unable to decode tag {tag:#04x}: {err}") from err
+
+    def __repr__(self) -> str:
+        """Friendly representation of the record."""
+        return f"{self.__class__.__name__} {self.key}"
+
+    @classmethod
+    def from_reply(
+        cls, ip: str, datagram: Dict[str, Any] | None, received: float | None = None
+    ) -> DiscoveryRecord:
+        """Decode a parsed discovery reply.
+
+        :raises ValueError: if the datagram isn't a valid discovery reply
+        """
+        if datagram is None or datagram.get("header") != HDHOMERUN_TYPE_DISCOVER_RPY:
+            raise ValueError("not a discovery reply")
+
+        return cls(ip=ip, datagram=datagram, received=received)
+
+    def get(self, tag: int | str) -> Any:
+        """Get the decoded value of a tag, None if unknown or not present."""
+        if (decoder := TAG_DECODERS.get(tag)) is None:
+            return None
+
+        return getattr(self, decoder[0])
+
+    def is_type(self, *device_types: int) -> bool:
+        """Check if the device is any of the given types."""
+        return any(device_type in self.types for device_type in device_types)
+
+    @property
+    def types(self) -> Tuple[int, ...]:
+        """Get the types of the device.
+
+        A device with more than one function lists them all, a reply
+        without a type is assumed to be from a tuner.
+        """
+        return self.device_types or (self.device_type or HDHOMERUN_DEVICE_TYPE_TUNER,)
+
+    @property
+    def key(self) -> str:
+        """Get the key to deduplicate replies on."""
+        return self.device_id or self.storage_id or self.ip
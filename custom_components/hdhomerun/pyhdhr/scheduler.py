@@ -0,0 +1,241 @@
+"""Staggered polling of many devices."""
+
+# region #-- imports --#
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import time
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from .logger import Logger
+
+# endregion
+
+_LOGGER = logging.getLogger(__name__)
+
+DEF_JITTER_RATIO: float = 0.02
+
+
+class _ScheduledPoll:
+    """State of a single scheduled poll."""
+
+    def __init__(
+        self, action: Callable[[], Awaitable[Any]], interval: float, offset: float
+    ) -> None:
+        """Initialise."""
+        self.action: Callable[[], Awaitable[Any]] = action
+        self.cycle: int | None = None  # the cycle last scheduled
+        self.handle: asyncio.TimerHandle | None = None
+        self.interval: float = interval
+        self.last_duration: float | None = None
+        self.offset: float = offset
+        self.task: asyncio.Task | None = None
+
+
+class PollScheduler:
+    """Spread the polling of many devices evenly across their interval.
+
+    Each poll is given an offset into its interval derived from its key so
+    the same key always lands in the same slot, even after being
+    rescheduled. A small amount of jitter, also derived from the key, is
+    applied to each cycle.
+    """
+
+    def __init__(self, jitter_ratio: float = DEF_JITTER_RATIO) -> None:
+        """Initialise.
+
+        :param jitter_ratio: maximum jitter as a fraction of the interval
+        """
+        self._jitter_ratio: float = jitter_ratio
+        self._log_formatter: Logger = Logger(prefix=f"{self.__class__.__name__}.")
+        self._polls: Dict[str, _ScheduledPoll] = {}
+
+    @staticmethod
+    def offset_for(key: str, interval: float) -> float:
+        """Get the deterministic offset into the interval for a key."""
+        return zlib.crc32(key.encode()) / 0xFFFFFFFF * interval
+
+    def _jitter_for(self, key: str, cycle: int, interval: float) -> float:
+        """Get the deterministic jitter for a cycle of a key."""
+        return (
+            random.Random(f"{key}:{cycle}").uniform(-1, 1)
+            * self._jitter_ratio
+            * interval
+        )
+
+    def next_slot(
+        self,
+        key: str,
+        interval: float,
+        now: float | None = None,
+        last_cycle: int | None = None,
+    ) -> Tuple[int, float]:
+        """Get the next cycle for the key and the seconds until its slot.
+
+        Slots are aligned to the wall clock so that they are kept across
+        restarts of the scheduler. A cycle is never given out twice, so a
+        poll that ran early because of negative jitter isn't run again for
+        the same cycle.
+
+        :param last_cycle: the cycle that was last scheduled for the key
+        """
+        now = time.time() if now is None else now
+        offset: float = self.offset_for(key=key, interval=interval)
+        cycle: int = math.floor((now - offset) / interval) + 1
+        if last_cycle is not None:
+            cycle = max(cycle, last_cycle + 1)
+        return cycle, max(
+            0,
+            offset
+            + cycle * interval
+            + self._jitter_for(key=key, cycle=cycle, interval=interval)
+            - now,
+        )
+
+    def next_delay(self, key: str, interval: float, now: float | None = None) -> float:
+        """Get the seconds until the next slot for the key."""
+        return self.next_slot(key=key, interval=interval, now=now)[1]
+
+    def _schedule_next(self, key: str) -> None:
+        """Arm the timer for the next poll of the key."""
+        poll: _ScheduledPoll | None = self._polls.get(key)
+        if poll is None:
+            return
+
+        delay: float
+        poll.cycle, delay = self.next_slot(
+            key=key, interval=poll.interval, last_cycle=poll.cycle
+        )
+        poll.handle = asyncio.get_running_loop().call_later(delay, self._fire, key)
+
+    def _fire(self, key: str) -> None:
+        """Run the poll for the key."""
+        if (poll := self._polls.get(key)) is None:
+            return
+
+        poll.handle = None
+        poll.task = asyncio.ensure_future(self._async_run(key=key, poll=poll))
+
+    async def _async_run(self, key: str, poll: _ScheduledPoll) -> None:
+        """Run the action timing how long it took and schedule the next.
+
+        A poll that was cancelled, or replaced by rescheduling the key, isn't
+        scheduled again.
+        """
+        started: float = time.perf_counter()
+        try:
+            await poll.action()
+        except asyncio.CancelledError:
+            poll.task = None
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug(self._log_formatter.format("%s failed: %s"), key, err)
+
+        poll.last_duration = time.perf_counter() - started
+        poll.task = None
+        if self._polls.get(key) is poll:
+            self._schedule_next(key=key)
+
+    def schedule(
+        self, key: str, interval: float, action: Callable[[], Awaitable[Any]]
+    ) -> Callable[[], None]:
+        """Poll the given action every interval in the slot for the key.
+
+        :param key: unique name for the poll, e.g. DeviceID and what is polled
+        :param interval: seconds between polls
+        :param action: coroutine function to call
+        :return: callable to stop the polling
+        """
+        self.cancel(key=key)
+        self._polls[key] = _ScheduledPoll(
+            action=action,
+            interval=interval,
+            offset=self.offset_for(key=key, interval=interval),
+        )
+        _LOGGER.debug(
+            self._log_formatter.format("scheduling %s every %ss at offset %.3fs"),
+            key,
+            interval,
+            self._polls[key].offset,
+        )
+        self._schedule_next(key=key)
+
+        return lambda: self.cancel(key=key)
+
+    def cancel(self, key: str) -> None:
+        """Stop polling for the key."""
+        if (poll := self._polls.pop(key, None)) is None:
+            return
+
+        if poll.handle is not None:
+            poll.handle.cancel()
+        if poll.task is not None:
+            poll.task.cancel()
+
+    @staticmethod
+    def _peak_overlap(windows: List[Tuple[float, float]], interval: float) -> float:
+        """Get the peak overlap of windows (start, duration) within an interval."""
+        events: List[Tuple[float, float]] = []
+        for start, duration in windows:
+            duration = min(duration, interval)
+            end: float = start + duration
+            if end > interval:  # wraps into the next interval
+                events.extend([(start, duration), (interval, -duration)])
+                events.extend([(0, duration), (end - interval, -duration)])
+            else:
+                events.extend([(start, duration), (end, -duration)])
+
+        ret: float = 0
+        in_flight: float = 0
+        for _, change in sorted(events, key=lambda event: (event[0], event[1])):
+            in_flight += change
+            ret = max(ret, in_flight)
+
+        return ret
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get the schedule and the peak overlap with and without staggering.
+
+        The peak overlap is the largest total duration of polls in flight at
+        the same time, using the last measured duration of each poll. The
+        durations are wall clock time, most of which is spent waiting on the
+        device rather than keeping the event loop busy, so this shows how
+        bunched up the requests are rather than the load on the event loop.
+        """
+        groups: Dict[float, List[_ScheduledPoll]] = {}
+        for poll in self._polls.values():
+            groups.setdefault(poll.interval, []).append(poll)
+
+        return {
+            "polls": {
+                key: {
+                    "interval": poll.interval,
+                    "last_duration": poll.last_duration,
+                    "offset": round(poll.offset, 3),
+                }
+                for key, poll in self._polls.items()
+            },
+            "peak_overlap_secs": {
+                str(interval): {
+                    "aligned": round(
+                        sum(poll.last_duration or 0 for poll in polls), 3
+                    ),
+                    "staggered": round(
+                        self._peak_overlap(
+                            windows=[
+                                (poll.offset, poll.last_duration or 0)
+                                for poll in polls
+                            ],
+                            interval=interval,
+                        ),
+                        3,
+                    ),
+                }
+                for interval, polls in groups.items()
+            },
+        }
@@ -174,27 +174,15 @@ async def async_setup_entry(
                 HDHomerunSensor(
                     additional_description=AdditionalSensorDescription(
                         extra_attributes=lambda d: (
-                            {
-                                "channels": [
-                                    channel.get("GuideName", None)
-                                    for channel in d.channels
-                                    if channel.get("Enabled", None) == 0
-                                ]
-                            }
-                        ),
-                        state_value=lambda d: len(
-                            [
-                                channel
-                                for channel in d
-                                if channel.get("Enabled", None) == 0
-                            ]
+                            {"channels": list(d.lineup_summary.disabled)}
                         ),
+                        state_value=lambda s: s.disabled_count,
                     ),
                     config_entry=config_entry,
                     coordinator=coordinator_general,
                     description=SensorEntityDescription(
                         icon="mdi:playlist-remove",
-                        key="channels",
+                        key="lineup_summary",
                         name="Disabled Channels",
                         state_class=SensorStateClass.MEASUREMENT,
                         translation_key="disabled_channels",
@@ -203,27 +191,15 @@ async def async_setup_entry(
                 HDHomerunSensor(
                     additional_description=AdditionalSensorDescription(
                         extra_attributes=lambda d: (
-                            {
-                                "channels": [
-                                    channel.get("GuideName", None)
-                                    for channel in d.channels
-                                    if channel.get("Favorite", None) == 1
-                                ]
-                            }
-                        ),
-                        state_value=lambda d: len(
-                            [
-                                channel
-                                for channel in d
-                                if channel.get("Favorite", None) == 1
-                            ]
+                            {"channels": list(d.lineup_summary.favorite)}
                         ),
+                        state_value=lambda s: s.favorite_count,
                     ),
                     config_entry=config_entry,
                     coordinator=coordinator_general,
                     description=SensorEntityDescription(
                         icon="mdi:playlist-star",
-                        key="channels",
+                        key="lineup_summary",
                         name="Favourite Channels",
                         state_class=SensorStateClass.MEASUREMENT,
                         translation_key="fav_channels",
@@ -231,14 +207,13 @@ async def async_setup_entry(
                 ),
                 HDHomerunSensor(
                     additional_description=AdditionalSensorDescription(
-                        # pylint: disable=unnecessary-lambda
-                        state_value=lambda d: len(d),
+                        state_value=lambda s: s.count,
                     ),
                     config_entry=config_entry,
                     coordinator=coordinator_general,
                     description=SensorEntityDescription(
                         icon="mdi:text-long",
-                        key="channels",
+                        key="lineup_summary",
                         name="Channel Count",
                         state_class=SensorStateClass.MEASUREMENT,
                         translation_key="channel_count",
@@ -0,0 +1,8 @@
+"""Make the device library importable without Home Assistant."""
+
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "custom_components", "hdhomerun")
+)
@@ -0,0 +1,210 @@
+"""Tests for the device."""
+
+import asyncio
+import json
+import struct
+from typing import Any, Dict, List
+
+import aiohttp
+from yarl import URL
+
+from pyhdhr import device as device_module
+from pyhdhr.const import (
+    HDHOMERUN_TAG_DEVICE_ID,
+    HDHOMERUN_TAG_GETSET_NAME,
+    HDHOMERUN_TAG_GETSET_VALUE,
+    HDHOMERUN_TAG_LINEUP_URL,
+    HDHOMERUN_TAG_TUNER_COUNT,
+    HDHOMERUN_TYPE_DISCOVER_RPY,
+    DiscoverMode,
+)
+from pyhdhr.discover import Discover
+from pyhdhr.record import DiscoveryRecord
+
+LINEUP_URL: str = "http://192.168.1.10/lineup.json"
+LINEUP: List[Dict[str, Any]] = [
+    {
+        "GuideNumber": "7.1",
+        "GuideName": "KABC",
+        "Frequency": 533000000,
+        "ProgramNumber": 3,
+    },
+]
+TUNER_VALUES: Dict[str, str] = {
+    "/sys/hwmodel": "HDHR5-4US",
+    "/sys/model": "hdhomerun5_atsc",
+    "/sys/version": "20230713",
+    "/tuner0/channel": "auto:533000000",
+    "/tuner0/program": "3",
+    "/tuner0/status": "ch=auto:533000000 lock=8vsb ss=80 snq=90 seq=100",
+    "/tuner0/streaminfo": "3: 7.1 KABC",
+    "/tuner0/target": "udp://192.168.1.20:5000",
+}
+
+
+class FakeResponse:
+    """Response from the fake session."""
+
+    def __init__(self, url: str, body: bytes) -> None:
+        """Initialise."""
+        self.headers: Dict[str, str] = {}
+        self.ok: bool = True
+        self.reason: str = "OK"
+        self.status: int = 200
+        self.url: URL = URL(url)
+        self._body: bytes = body
+
+    async def read(self) -> bytes:
+        """Get the body."""
+        return self._body
+
+
+class FakeSession:
+    """Session that only serves the lineup."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.requested: List[str] = []
+
+    async def get(self, url: str, **_) -> FakeResponse:
+        """Get the URL."""
+        self.requested.append(url)
+        return FakeResponse(url=url, body=json.dumps(LINEUP).encode())
+
+
+class FakeProtocol:
+    """Control protocol that answers from `TUNER_VALUES`."""
+
+    queried: List[str] = []
+
+    def __init__(self, host: str) -> None:
+        """Initialise."""
+
+    async def _async_get(self, name: str) -> Dict[str, Any]:
+        """Answer a query."""
+        self.queried.append(name)
+        return {
+            "data": {
+                HDHOMERUN_TAG_GETSET_NAME: f"{name}\0".encode(),
+                HDHOMERUN_TAG_GETSET_VALUE: f"{TUNER_VALUES[name]}\0".encode(),
+            }
+        }
+
+    async def async_get_hwmodel(self) -> Dict[str, Any]:
+        """Get the hardware model."""
+        return await self._async_get("/sys/hwmodel")
+
+    async def async_get_model(self) -> Dict[str, Any]:
+        """Get the model."""
+        return await self._async_get("/sys/model")
+
+    async def async_get_version(self) -> Dict[str, Any]:
+        """Get the firmware version."""
+        return await self._async_get("/sys/version")
+
+    async def async_get_tuner_channel(self, tuner_idx: int) -> Dict[str, Any]:
+        """Get the tuned channel."""
+        return await self._async_get(f"/tuner{tuner_idx}/channel")
+
+    async def async_get_tuner_program(self, tuner_idx: int) -> Dict[str, Any]:
+        """Get the tuned program."""
+        return await self._async_get(f"/tuner{tuner_idx}/program")
+
+    async def async_get_tuner_status(self, tuner_idx: int) -> Dict[str, Any]:
+        """Get the tuner status."""
+        return await self._async_get(f"/tuner{tuner_idx}/status")
+
+    async def async_get_tuner_streaminfo(self, tuner_idx: int) -> Dict[str, Any]:
+        """Get the programs on the tuned channel."""
+        return await self._async_get(f"/tuner{tuner_idx}/streaminfo")
+
+    async def async_get_tuner_target(self, tuner_idx: int) -> Dict[str, Any]:
+        """Get where the tuner is streaming to."""
+        return await self._async_get(f"/tuner{tuner_idx}/target")
+
+
+def test_udp_device_resolves_channel_from_lineup(monkeypatch) -> None:
+    """A device only reachable over UDP finds the tuned channel in its lineup."""
+    monkeypatch.setattr(device_module, "HDHomeRunProtocol", FakeProtocol)
+    monkeypatch.setattr(FakeProtocol, "queried", [])
+
+    async def _async_test() -> None:
+        record: DiscoveryRecord = DiscoveryRecord.from_reply(
+            ip="192.168.1.10",
+            datagram={
+                "header": HDHOMERUN_TYPE_DISCOVER_RPY,
+                "data": {
+                    HDHOMERUN_TAG_DEVICE_ID: struct.pack(">L", 0x1234ABCD),
+                    HDHOMERUN_TAG_LINEUP_URL: LINEUP_URL.encode(),
+                    HDHOMERUN_TAG_TUNER_COUNT: struct.pack(">B", 1),
+                },
+            },
+            received=asyncio.get_running_loop().time(),
+        )
+
+        async def _async_request_udp(*_, **__) -> List[DiscoveryRecord]:
+            return [record]
+
+        monkeypatch.setattr(Discover, "_async_request_udp", _async_request_udp)
+        session: FakeSession = FakeSession()
+        (device,) = await Discover(
+            session=session, mode=DiscoverMode.UDP, dual_stack=False
+        ).async_discover()
+        assert device.discovery_method is DiscoverMode.UDP
+
+        await device.async_gather_details()
+        assert session.requested == [LINEUP_URL]
+
+        await device.async_refresh_tuner_status()
+        assert device.tuner_status[0]["VctNumber"] == "7.1"
+        assert device.tuner_status[0]["VctName"] == "KABC"
+        assert "/tuner0/streaminfo" not in FakeProtocol.queried
+
+    asyncio.run(_async_test())
+
+
+class FakeRestartingSession:
+    """Session for a busy device that restarts after `UP_SECS`."""
+
+    DOWN_SECS: float = 1.5
+    SLOW_SECS: float = 0.3
+    UP_SECS: float = 1.0
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self._started: float = asyncio.get_running_loop().time()
+        self._timeout: float = 0
+
+    def get(self, timeout: aiohttp.ClientTimeout, **_) -> "FakeRestartingSession":
+        """Request the discovery details."""
+        self._timeout = timeout.total
+        return self
+
+    async def __aenter__(self) -> None:
+        """Answer, slowly whilst up, or refuse whilst restarting."""
+        elapsed: float = asyncio.get_running_loop().time() - self._started
+        if self.UP_SECS <= elapsed < self.UP_SECS + self.DOWN_SECS:
+            raise aiohttp.ClientConnectionError("connection refused")
+        if elapsed < self.UP_SECS:
+            await asyncio.sleep(min(self.SLOW_SECS, self._timeout))
+            if self._timeout < self.SLOW_SECS:
+                raise asyncio.TimeoutError
+
+    async def __aexit__(self, *_) -> None:
+        """Release the response."""
+
+
+def test_restart_wait_ignores_slow_replies() -> None:
+    """A slow reply before the restart isn't taken as the device going away."""
+
+    async def _async_test() -> None:
+        device: device_module.HDHomeRunDevice = device_module.HDHomeRunDevice(
+            host="192.168.1.10"
+        )
+        setattr(device, "_discovery_method", DiscoverMode.HTTP)
+        setattr(device, "_session", FakeRestartingSession())
+
+        downtime: float = await device._async_wait_for_restart(timeout=10)
+        assert downtime >= FakeRestartingSession.DOWN_SECS - 0.1
+
+    asyncio.run(_async_test())
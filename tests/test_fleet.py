@@ -0,0 +1,46 @@
+"""Tests for the device fleet."""
+
+import asyncio
+from typing import List
+
+from pyhdhr.device import HDHomeRunDevice
+from pyhdhr.fleet import DeviceFleet
+
+
+class FakeDevice(HDHomeRunDevice):
+    """Device whose details change on every other gather."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        super().__init__(host="192.0.2.1")
+        self.gathered: int = 0
+
+    async def async_gather_details(self) -> None:
+        """Pretend to gather the details."""
+        await asyncio.sleep(0.01)
+        self.gathered += 1
+        self._details_changed = self.gathered % 2 == 1
+
+
+def test_consolidated_gather_reports_changes() -> None:
+    """A consumer whose gather was consolidated still learns of the change."""
+
+    async def _async_test() -> None:
+        fleet: DeviceFleet = DeviceFleet()
+        device: FakeDevice = fleet.acquire(device=FakeDevice(), device_id="1")
+        fleet.acquire(device=device, device_id="1")
+
+        ran: List[bool] = await asyncio.gather(
+            fleet.async_gather_details(device=device, max_age=60),
+            fleet.async_gather_details(device=device, max_age=60),
+        )
+        assert ran == [True, False]
+        assert device.gathered == 1
+        assert fleet.get_runs(device=device, name="gather_details") == (1, 1)
+
+        fleet.invalidate(device)
+        await fleet.async_gather_details(device=device, max_age=60)
+        assert device.gathered == 2
+        assert fleet.get_runs(device=device, name="gather_details") == (2, 1)
+
+    asyncio.run(_async_test())
@@ -0,0 +1,66 @@
+"""Tests for the poll scheduler."""
+
+import asyncio
+from typing import List
+
+from pyhdhr.scheduler import PollScheduler
+
+INTERVAL: float = 0.05
+
+
+def _armed_timers(scheduler: PollScheduler) -> List[asyncio.TimerHandle]:
+    """Get the timers armed by the scheduler that are still pending."""
+    return [
+        handle
+        for handle in getattr(asyncio.get_running_loop(), "_scheduled")
+        if not handle.cancelled() and handle._callback == scheduler._fire
+    ]
+
+
+def test_reschedule_while_running_arms_one_timer() -> None:
+    """Rescheduling a key whilst its poll runs leaves only the new poll armed."""
+
+    async def _async_test() -> None:
+        scheduler: PollScheduler = PollScheduler(jitter_ratio=0)
+        started: asyncio.Event = asyncio.Event()
+        runs: List[str] = []
+
+        async def _async_slow() -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        async def _async_fast() -> None:
+            runs.append("fast")
+
+        scheduler.schedule(key="device", interval=INTERVAL, action=_async_slow)
+        await asyncio.wait_for(started.wait(), timeout=1)
+        running: asyncio.Task = scheduler._polls["device"].task
+
+        scheduler.schedule(key="device", interval=INTERVAL, action=_async_fast)
+        await asyncio.gather(running, return_exceptions=True)
+        assert running.cancelled()
+        assert len(_armed_timers(scheduler)) == 1
+
+        scheduler.cancel(key="device")
+        assert not _armed_timers(scheduler)
+        runs.clear()
+        await asyncio.sleep(INTERVAL * 3)
+        assert not runs
+
+    asyncio.run(_async_test())
+
+
+def test_early_poll_is_not_repeated() -> None:
+    """A poll brought forward by jitter isn't run again for the same cycle."""
+    scheduler: PollScheduler = PollScheduler()
+    for key in (f"device{idx}" for idx in range(50)):
+        now: float = 1_000_000.0
+        cycle: int | None = None
+        cycles: List[int] = []
+        for _ in range(20):
+            cycle, delay = scheduler.next_slot(
+                key=key, interval=300, now=now, last_cycle=cycle
+            )
+            cycles.append(cycle)
+            now += delay + 0.005
+        assert cycles == list(range(cycles[0], cycles[0] + len(cycles)))